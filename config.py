@@ -125,6 +125,8 @@ AI_SETTINGS = {
 BROWSER = {
   "headless": False,  # Run browser in headless mode (no UI)
   "timeout": 30,  # Seconds to wait for page elements
+  "fast_typing": False,  # Fill Indeed and ZipRecruiter search forms from JavaScript instead of typing them key by key
+  "linkedin_fast_search_typing": True,  # Send the LinkedIn job search terms in one keystroke batch, without human-like pauses
   "user_agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36",
 }
 
@@ -146,6 +148,14 @@ EMAIL = {
 LINKEDIN = {
   "username": "",  # Your LinkedIn username/email
   "password": "",  # Your LinkedIn password
+  "search_workers": 4,  # Browsers searching in parallel (each logs in separately)
+  "force_refresh": False,  # Ignore search results cached in the last 12 hours (also --force-refresh)
+  "profile_dir": "data_folder/.linkedin_profiles",  # Chrome profiles that keep you logged in between runs
+}
+
+# ZipRecruiter Settings
+ZIPRECRUITER = {
+  "search_workers": 3,  # Browsers searching in parallel
 }
 
 # Application Form Question Answering
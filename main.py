@@ -17,25 +17,16 @@ from src.job_boards.ziprecruiter_scraper import ZipRecruiterScraper
 from src.utils.h1b_checker import H1BChecker
 from src.utils.resume_matcher import ResumeMatcher
 from src.utils.cover_letter_generator import CoverLetterGenerator
+from src.utils.logger import setup_logger
 
 # Set up logging
 def setup_logging(config: Dict[str, Any]):
     """Set up logging configuration."""
-    log_level = getattr(logging, config.get('LOGGING', {}).get('level', 'INFO'))
+    log_level = config.get('LOGGING', {}).get('level', 'INFO')
     log_file = config.get('LOGGING', {}).get('log_file', 'data_folder/application_log.txt')
     
-    # Create log directory if it doesn't exist
-    os.makedirs(os.path.dirname(log_file), exist_ok=True)
-    
-    # Configure logging
-    logging.basicConfig(
-        level=log_level,
-        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-        handlers=[
-            logging.FileHandler(log_file),
-            logging.StreamHandler()
-        ]
-    )
+    # Log to the console and, buffered, to the log file
+    setup_logger(log_level, log_file)
 
 # Load configuration
 def load_config(config_path: str = 'config.py') -> Dict[str, Any]:
@@ -92,6 +83,10 @@ def update_config_with_args(config: Dict[str, Any], args: argparse.Namespace) ->
     if args.headless is not None:
         config['BROWSER']['headless'] = args.headless
     
+    # Ignore cached search results
+    if args.force_refresh:
+        config.setdefault('LINKEDIN', {})['force_refresh'] = True
+    
     return config
 
 # Create necessary directories
@@ -197,6 +192,7 @@ def main():
     
     # Browser settings
     parser.add_argument('--headless', action='store_true', help='Run browser in headless mode')
+    parser.add_argument('--force-refresh', action='store_true', help='Scrape again instead of using cached search results')
     
     # Config file
     parser.add_argument('--config', default='config.py', help='Path to configuration file')
@@ -252,6 +248,7 @@ def main():
         print("\n🔍 Scraping LinkedIn jobs...")
         linkedin_scraper = LinkedInScraper(config)
         linkedin_jobs = linkedin_scraper.scrape_jobs()
+        linkedin_scraper.close()
         job_listings.extend(linkedin_jobs)
         print(f"✅ Found {len(linkedin_jobs)} jobs on LinkedIn")
     
@@ -260,6 +257,7 @@ def main():
         print("\n🔍 Scraping Indeed jobs...")
         indeed_scraper = IndeedScraper(config)
         indeed_jobs = indeed_scraper.scrape_jobs()
+        indeed_scraper.close()
         job_listings.extend(indeed_jobs)
         print(f"✅ Found {len(indeed_jobs)} jobs on Indeed")
     
@@ -268,6 +266,7 @@ def main():
         print("\n🔍 Scraping ZipRecruiter jobs...")
         ziprecruiter_scraper = ZipRecruiterScraper(config)
         ziprecruiter_jobs = ziprecruiter_scraper.scrape_jobs()
+        ziprecruiter_scraper.close()
         job_listings.extend(ziprecruiter_jobs)
         print(f"✅ Found {len(ziprecruiter_jobs)} jobs on ZipRecruiter")
     
@@ -286,11 +285,8 @@ def main():
     h1b_jobs = []
 
     for job in job_listings:
-        company_name = job.get('company_name', '')
-        job_description = job.get('description', '')
-        
-        # Check both company name and job description for H1B sponsorship
-        if h1b_checker.is_h1b_sponsor(company_name, job_description) or h1b_checker.check_job_for_h1b_keywords(job):
+        # Check the company name, then the job description and title, for H1B sponsorship
+        if h1b_checker.check_job_for_h1b_keywords(job):
             job['sponsors_h1b'] = True
             h1b_jobs.append(job)
 
@@ -396,6 +392,8 @@ def main():
             print(f"  Waiting {delay} seconds before next application...")
             time.sleep(delay)
     
+    job_applier.close()
+    
     # Print summary
     print("\n📊 Application Summary:")
     print(f"  - Total Jobs Found: {len(job_listings)}")
@@ -1,11 +1,17 @@
+import json
 import logging
 import time
 import os
 import random
-from typing import Dict, Any, Optional
+import re
+from typing import Dict, Any, Optional, List, NamedTuple, Tuple
+try:
+    import fcntl  # POSIX only; used to serialize appends from concurrent appliers
+except ImportError:
+    fcntl = None
 from selenium import webdriver
 from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
+from selenium.webdriver.support.ui import WebDriverWait, Select
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import (
     TimeoutException, NoSuchElementException, 
@@ -19,6 +25,174 @@ from src.application.question_answerer import QuestionAnswerer
 
 logger = logging.getLogger(__name__)
 
+# Application and follow-up logs (append-only JSON Lines, one object per line).
+# A <name>.schema.json file next to each log lists its fields.
+APPLICATIONS_LOG = "data_folder/applications/applications.jsonl"
+APPLICATIONS_FIELDS = ["Date", "Company", "Title", "Location", "URL", "Source", "H1B_Sponsor", "HiringManager", "HiringManagerEmail"]
+FOLLOW_UPS_LOG = "data_folder/follow_ups/follow_ups.jsonl"
+FOLLOW_UPS_FIELDS = ["FollowUpDate", "Company", "Title", "ContactName", "ContactEmail", "URL", "Applied"]
+
+# Before each form field: wait up to FIELD_WAIT_TIMEOUT seconds for it to be
+# clickable, then pause for a short random FIELD_JITTER (seconds)
+FIELD_WAIT_TIMEOUT = 3
+FIELD_JITTER = (0.15, 0.35)
+
+# Keyword -> kind of value for the LinkedIn text-input heuristics. When several
+# keywords match, the earliest kind in FIELD_KIND_ORDER wins.
+FIELD_KIND_RE = re.compile(r"(years|experience|salary|website|portfolio|linkedin|github)", re.IGNORECASE)
+FIELD_KINDS = {
+    "years": "years",
+    "experience": "years",
+    "salary": "salary",
+    "website": "website",
+    "portfolio": "website",
+    "linkedin": "linkedin",
+    "github": "github",
+}
+FIELD_KIND_ORDER = ("years", "salary", "website", "linkedin", "github")
+
+# Kind -> (description for logging, value builder taking USER_INFO)
+FIELD_HANDLERS = {
+    # Add some variation to years of experience and salary expectations
+    "years": ("years of experience", lambda user_info: str(random.randint(2, 5))),
+    "salary": ("salary expectation", lambda user_info: str(90000 + random.randint(-5000, 5000))),
+    "website": ("website/portfolio", lambda user_info: user_info.get('portfolio', '')),
+    "linkedin": ("LinkedIn URL", lambda user_info: user_info.get('linkedin', '')),
+    "github": ("GitHub URL", lambda user_info: user_info.get('github', '')),
+}
+
+# Tags every fillable form field with a data-jf-idx attribute and returns a
+# description of each one, so a whole form is read in a single round-trip.
+COLLECT_FORM_FIELDS_JS = """
+const labels = {};
+document.querySelectorAll('label[for]').forEach(l => { labels[l.htmlFor] = l.innerText; });
+const out = [];
+document.querySelectorAll("input[type='text'], input[type='radio'], select, textarea").forEach((el, i) => {
+    el.setAttribute('data-jf-idx', i);
+    out.push({
+        idx: i,
+        tag: el.tagName.toLowerCase(),
+        type: (el.type || '').toLowerCase(),
+        id: el.id || '',
+        value: el.value || '',
+        placeholder: el.placeholder || '',
+        label: (el.id && labels[el.id]) || '',
+        options: el.tagName === 'SELECT' ? Array.from(el.options, o => o.text) : null
+    });
+});
+return out;
+"""
+
+# Reads the attributes the form answerer needs for a list of elements at once.
+FIELD_ATTRS_JS = """
+return arguments[0].map(e => ({
+    id: e.id || '',
+    'aria-label': e.getAttribute('aria-label') || '',
+    placeholder: e.getAttribute('placeholder') || '',
+    title: e.getAttribute('title') || '',
+    name: e.getAttribute('name') || '',
+    value: e.value || '',
+    type: (e.getAttribute('type') || '').toLowerCase(),
+    tag: e.tagName.toLowerCase(),
+    displayed: !!(e.offsetWidth || e.offsetHeight || e.getClientRects().length),
+    enabled: !e.disabled,
+    checked: !!e.checked
+}));
+"""
+
+# Maps each label's "for" id to its text so field labels are dict lookups.
+LABELS_BY_FOR_JS = """
+const m = {};
+document.querySelectorAll('label[for]').forEach(l => { m[l.htmlFor] = l.innerText; });
+return m;
+"""
+
+class JobRecord(NamedTuple):
+    """
+    Immutable snapshot of the job fields read while applying.
+
+    Built once per apply() so the hot path reads attributes instead of
+    repeating dict lookups with defaults.
+    """
+    url: str = ''
+    source: str = ''
+    sponsors_h1b: bool = False
+    title: str = ''
+    company_name: str = ''
+    location: str = ''
+    hiring_manager_name: str = ''
+    hiring_manager_email: str = ''
+
+    @classmethod
+    def from_dict(cls, job: Dict[str, Any]) -> 'JobRecord':
+        """Build a record from a job listing dictionary."""
+        defaults = cls._field_defaults
+        return cls(**{name: job.get(name, defaults[name]) for name in cls._fields})
+
+
+# [expires_at, 'YYYY-MM-DD'] for today's local date, refreshed at midnight
+_TODAY = [0.0, ""]
+
+
+def today() -> str:
+    """Today's local date as YYYY-MM-DD, formatted once per day."""
+    now = time.time()
+    if now >= _TODAY[0]:
+        lt = time.localtime(now)
+        next_midnight = time.mktime((lt.tm_year, lt.tm_mon, lt.tm_mday + 1, 0, 0, 0, 0, 0, -1))
+        _TODAY[:] = [next_midnight, time.strftime('%Y-%m-%d', lt)]
+    return _TODAY[1]
+
+
+def button_text_xpath(*labels: str) -> str:
+    """
+    XPath for a <button> whose normalized text contains any of ``labels``
+    (lowercase), matched case-insensitively by the browser.
+    """
+    text = "translate(normalize-space(.), 'ABCDEFGHIJKLMNOPQRSTUVWXYZ', 'abcdefghijklmnopqrstuvwxyz')"
+    return "//button[" + " or ".join(f"contains({text}, '{label}')" for label in labels) + "]"
+
+
+class FormFillPlan(NamedTuple):
+    """
+    Per-portal selectors interpreted by JobApplier._apply_generic.
+    
+    Each board only supplies what differs; the flow itself (upload resume,
+    answer questions, click through navigation) lives in one place.
+    """
+    # Buttons/links that open the application, tried in order
+    apply_xpaths: Tuple[str, ...]
+    # Navigation buttons, in priority order (submit before next)
+    nav_xpaths: Tuple[str, ...]
+    # Button text that means the click submits the application
+    submit_keywords: Tuple[str, ...] = ("submit", "review")
+    file_input_selector: str = "input[type='file']"
+    max_steps: int = 12
+
+
+GENERIC_APPLY_XPATHS = (
+    "//button[contains(translate(., 'APPLY', 'apply'), 'apply')]",
+    "//a[contains(translate(., 'APPLY', 'apply'), 'apply')]",
+)
+GENERIC_NAV_XPATHS = tuple(
+    button_text_xpath(label) for label in ("submit application", "submit", "review", "continue", "next")
+)
+# Any button that could move a LinkedIn application forward, in document order
+PROCEED_BUTTON_XPATH = button_text_xpath("next", "continue", "submit", "apply")
+
+DEFAULT_FORM_FILL_PLAN = FormFillPlan(apply_xpaths=GENERIC_APPLY_XPATHS, nav_xpaths=GENERIC_NAV_XPATHS)
+
+FORM_FILL_PLANS = {
+    # Indeed's multi-step "Apply now" flow
+    "Indeed": FormFillPlan(
+        apply_xpaths=("//button[@id='indeedApplyButton']",) + GENERIC_APPLY_XPATHS,
+        nav_xpaths=GENERIC_NAV_XPATHS,
+    ),
+    # ZipRecruiter 1-Click / Quick Apply flow
+    "ZipRecruiter": DEFAULT_FORM_FILL_PLAN,
+}
+
+
 class JobApplier:
     """
     Applies to jobs on various job boards with human-like behavior.
@@ -46,6 +220,9 @@ class JobApplier:
         self._qa = None
         self._resume_text = None
         
+        # JSONL logs opened on first write and kept open: path -> file
+        self._logs = {}
+        
     def _setup_driver(self):
         """Set up the Selenium WebDriver with randomized browser fingerprint."""
         options = webdriver.ChromeOptions()
@@ -116,63 +293,58 @@ class JobApplier:
             True if application was successful, False otherwise
         """
         if not resume_path or not os.path.exists(resume_path):
-            logger.error(f"Resume file not found: {resume_path}")
+            logger.error("Resume file not found: %s", resume_path)
             return False
         
         if cover_letter_path and not os.path.exists(cover_letter_path):
-            logger.warning(f"Cover letter file not found: {cover_letter_path}")
+            logger.warning("Cover letter file not found: %s", cover_letter_path)
             cover_letter_path = None
         
-        job_url = job.get('url', '')
-        job_source = job.get('source', '')
+        record = JobRecord.from_dict(job)
         
-        if not job_url:
+        if not record.url:
             logger.error("Job URL is missing")
             return False
         
         # Double-check H1B sponsorship
-        if not job.get('sponsors_h1b', False):
-            logger.warning(f"Skipping job that doesn't sponsor H1B: {job.get('title', '')} at {job.get('company_name', '')}")
+        if not record.sponsors_h1b:
+            logger.warning("Skipping job that doesn't sponsor H1B: %s at %s", record.title, record.company_name)
             return False
         
-        # Get hiring manager information
-        hiring_manager_name = job.get('hiring_manager_name', '')
-        hiring_manager_email = job.get('hiring_manager_email', '')
-        
-        logger.info(f"Applying to job: {job.get('title', '')} at {job.get('company_name', '')}")
-        if hiring_manager_name:
-            logger.info(f"Hiring Manager: {hiring_manager_name} ({hiring_manager_email})")
+        logger.info("Applying to job: %s at %s", record.title, record.company_name)
+        if record.hiring_manager_name:
+            logger.info("Hiring Manager: %s (%s)", record.hiring_manager_name, record.hiring_manager_email)
         
         driver = self._setup_driver()
         success = False
         
         try:
             # Apply based on job source
-            if job_source == 'LinkedIn':
+            if record.source == 'LinkedIn':
                 success = self._apply_linkedin(driver, job, resume_path, cover_letter_path)
-            elif job_source == 'Indeed':
+            elif record.source == 'Indeed':
                 success = self._apply_indeed(driver, job, resume_path, cover_letter_path)
-            elif job_source == 'ZipRecruiter':
+            elif record.source == 'ZipRecruiter':
                 success = self._apply_ziprecruiter(driver, job, resume_path, cover_letter_path)
             else:
-                logger.error(f"Unsupported job source: {job_source}")
+                logger.error("Unsupported job source: %s", record.source)
                 return False
             
             if success:
                 # Record successful application
-                self._record_application(job)
+                self._record_application(record)
                 
                 # Schedule follow-up if enabled
                 follow_up_days = self.config.get('APPLICATION', {}).get('follow_up_days', 0)
                 if follow_up_days > 0:
-                    self._schedule_follow_up(job, follow_up_days)
+                    self._schedule_follow_up(record, follow_up_days)
                 
                 # Send direct email to hiring manager if available
-                if hiring_manager_email and cover_letter_path:
+                if record.hiring_manager_email and cover_letter_path:
                     self._send_direct_email(job, cover_letter_path)
         
         except Exception as e:
-            logger.error(f"Error applying to job: {e}")
+            logger.error("Error applying to job: %s", e)
             success = False
         
         finally:
@@ -259,7 +431,7 @@ class JobApplier:
             self._simulate_normal_browsing(driver)
             
         except Exception as e:
-            logger.error(f"Error logging in to LinkedIn: {e}")
+            logger.error("Error logging in to LinkedIn: %s", e)
             raise
     
     def _simulate_normal_browsing(self, driver):
@@ -289,7 +461,7 @@ class JobApplier:
             HumanBehavior.read_page_behavior(driver, (2, 5))
             
         except Exception as e:
-            logger.warning(f"Error during normal browsing simulation: {e}")
+            logger.warning("Error during normal browsing simulation: %s", e)
             # Non-critical function, so just log and continue
     
     def _apply_linkedin(self, driver, job: Dict[str, Any], resume_path: str, cover_letter_path: Optional[str]) -> bool:
@@ -312,7 +484,7 @@ class JobApplier:
             self._linkedin_login(driver)
             
             # Navigate to the job page
-            logger.info(f"Navigating to job URL: {job_url}")
+            logger.info("Navigating to job URL: %s", job_url)
             driver.get(job_url)
             
             # Simulate reading the job description
@@ -377,7 +549,7 @@ class JobApplier:
                     return False
         
         except Exception as e:
-            logger.error(f"Error applying on LinkedIn: {e}")
+            logger.error("Error applying on LinkedIn: %s", e)
             return False
     
     def _handle_linkedin_application_form(self, driver, job: Dict[str, Any], resume_path: str, cover_letter_path: Optional[str]) -> bool:
@@ -399,7 +571,7 @@ class JobApplier:
             max_steps = 10  # Arbitrary limit to prevent infinite loops
             
             while current_step <= max_steps:
-                logger.info(f"Handling application step {current_step}")
+                logger.info("Handling application step %s", current_step)
                 
                 # Simulate reading the form page
                 HumanBehavior.read_page_behavior(driver, (2, 5))
@@ -511,22 +683,22 @@ class JobApplier:
                 # If we reach here, we couldn't find Next, Review, or Submit buttons
                 # Try to find any button that might continue the application
                 try:
-                    buttons = driver.find_elements(By.TAG_NAME, "button")
+                    # The browser filters buttons by text, so only candidates come back
+                    buttons = driver.find_elements(By.XPATH, PROCEED_BUTTON_XPATH)
                     for button in buttons:
                         try:
-                            button_text = button.text.lower()
-                            if "next" in button_text or "continue" in button_text or "submit" in button_text or "apply" in button_text:
-                                # Pause before clicking
-                                HumanBehavior.random_delay(1.0, 2.0)
-                                
-                                # Human-like click
-                                HumanBehavior.human_like_click(driver, button)
-                                logger.info(f"Clicked button with text: {button.text}")
-                                
-                                # Wait for next page with variable timing
-                                HumanBehavior.random_delay(2.0, 3.5)
-                                current_step += 1
-                                break
+                            # Pause before clicking
+                            HumanBehavior.random_delay(1.0, 2.0)
+                            
+                            # Human-like click
+                            HumanBehavior.human_like_click(driver, button)
+                            if logger.isEnabledFor(logging.INFO):
+                                logger.info("Clicked button with text: %s", button.text)
+                            
+                            # Wait for next page with variable timing
+                            HumanBehavior.random_delay(2.0, 3.5)
+                            current_step += 1
+                            break
                         except:
                             continue
                     else:
@@ -542,7 +714,7 @@ class JobApplier:
             return False
         
         except Exception as e:
-            logger.error(f"Error handling LinkedIn application form: {e}")
+            logger.error("Error handling LinkedIn application form: %s", e)
             return False
     
     def _fill_linkedin_contact_info(self, driver, job: Dict[str, Any]):
@@ -594,8 +766,8 @@ class JobApplier:
             
             # Fill each field with human-like typing
             for field_type, field_element in fields_to_fill:
-                # Add random delay between filling fields
-                HumanBehavior.random_delay(0.5, 2.0)
+                # Wait for the field to be ready, with a short random pause
+                self._wait_and_jitter(driver, field_element)
                 
                 if field_type == "first_name":
                     HumanBehavior.human_like_typing(field_element, self.user_info.get('name', '').split()[0])
@@ -620,8 +792,8 @@ class JobApplier:
                     # Look for fields that might be for hiring manager
                     manager_fields = driver.find_elements(By.CSS_SELECTOR, "input[id*='hiring-manager'], input[id*='recruiter'], input[id*='addressee']")
                     if manager_fields:
-                        # Add delay before filling this special field
-                        HumanBehavior.random_delay(1.0, 2.0)
+                        # Wait for the field to be ready, with a short random pause
+                        self._wait_and_jitter(driver, manager_fields[0])
                         
                         HumanBehavior.human_like_typing(manager_fields[0], hiring_manager_name)
                         logger.info("Filled in hiring manager name")
@@ -629,7 +801,7 @@ class JobApplier:
                     logger.debug("Could not fill in hiring manager name")
         
         except Exception as e:
-            logger.error(f"Error filling LinkedIn contact info: {e}")
+            logger.error("Error filling LinkedIn contact info: %s", e)
     
     def _get_resume_text(self, resume_path: str) -> str:
         """Extract plain text from the applicant's resume (cached)."""
@@ -649,7 +821,7 @@ class JobApplier:
                     with open(resume_path, "r", encoding="utf-8", errors="ignore") as f:
                         text = f.read()
         except Exception as e:
-            logger.debug(f"Could not extract resume text: {e}")
+            logger.debug("Could not extract resume text: %s", e)
         self._resume_text = text or ""
         return self._resume_text
 
@@ -663,21 +835,61 @@ class JobApplier:
             self._qa.job = job
         return self._qa
 
-    def _extract_question_label(self, driver, element) -> str:
+    def _collect_labels(self, driver) -> Dict[str, str]:
+        """Map every ``label[for]`` id on the page to its text in one call."""
+        try:
+            return driver.execute_script(LABELS_BY_FOR_JS) or {}
+        except Exception as e:
+            logger.debug("Could not collect form labels: %s", e)
+            return {}
+
+    def _collect_field_attrs(self, driver, elements: list) -> List[Dict[str, Any]]:
+        """
+        Read id, placeholder, value, visibility, etc. for many elements in one
+        call, falling back to per-element reads if the script fails.
+        """
+        if not elements:
+            return []
+        try:
+            return driver.execute_script(FIELD_ATTRS_JS, elements)
+        except Exception as e:
+            logger.debug("Batched attribute read failed, reading per element: %s", e)
+        attrs = []
+        for el in elements:
+            try:
+                record = {
+                    name: el.get_attribute(name) or ""
+                    for name in ("id", "aria-label", "placeholder", "title", "name", "value", "type")
+                }
+                record.update(
+                    tag=el.tag_name.lower(), displayed=el.is_displayed(),
+                    enabled=el.is_enabled(), checked=el.is_selected(),
+                )
+            except Exception:
+                record = {"displayed": False, "enabled": False}
+            attrs.append(record)
+        return attrs
+
+    def _extract_question_label(self, driver, element, labels: Optional[Dict[str, str]] = None,
+                                attrs: Optional[Dict[str, Any]] = None) -> str:
         """Best-effort extraction of the human-readable question for a field."""
         # 1) <label for="id">
         try:
-            elem_id = element.get_attribute("id")
+            elem_id = attrs["id"] if attrs is not None else element.get_attribute("id")
             if elem_id:
-                label = driver.find_element(By.CSS_SELECTOR, f"label[for='{elem_id}']")
-                if label and label.text.strip():
-                    return label.text.strip()
+                if labels is not None:
+                    text = (labels.get(elem_id) or "").strip()
+                else:
+                    label = driver.find_element(By.CSS_SELECTOR, f"label[for='{elem_id}']")
+                    text = label.text.strip() if label else ""
+                if text:
+                    return text
         except Exception:
             pass
         # 2) aria-label / aria-labelledby / placeholder / name
         for attr in ("aria-label", "placeholder", "title", "name"):
             try:
-                val = element.get_attribute(attr)
+                val = attrs.get(attr) if attrs is not None else element.get_attribute(attr)
                 if val and val.strip():
                     return val.strip()
             except Exception:
@@ -714,42 +926,42 @@ class JobApplier:
             return 0
 
         qa = self._get_question_answerer(job, resume_path)
+        labels = self._collect_labels(driver)
         filled = 0
 
         # --- Text / number inputs and textareas ---
         try:
             fields = driver.find_elements(By.CSS_SELECTOR, "input[type='text'], input[type='number'], input[type='url'], textarea")
-            for field in fields:
+            for field, attrs in zip(fields, self._collect_field_attrs(driver, fields)):
                 try:
-                    if not field.is_displayed() or not field.is_enabled():
+                    if not attrs.get("displayed") or not attrs.get("enabled"):
                         continue
-                    if (field.get_attribute("value") or "").strip():
+                    if (attrs.get("value") or "").strip():
                         continue  # already filled (e.g., prefilled contact info)
-                    question = self._extract_question_label(driver, field)
+                    question = self._extract_question_label(driver, field, labels, attrs)
                     if not question:
                         continue
-                    tag = field.tag_name.lower()
-                    itype = "textarea" if tag == "textarea" else (
-                        "number" if field.get_attribute("type") == "number" else "text"
+                    itype = "textarea" if attrs.get("tag") == "textarea" else (
+                        "number" if attrs.get("type") == "number" else "text"
                     )
                     answer = qa.answer(question, input_type=itype)
                     if answer:
-                        HumanBehavior.random_delay(0.6, 1.8)
+                        self._wait_and_jitter(driver, field)
                         HumanBehavior.human_like_typing(field, str(answer))
                         filled += 1
                 except Exception as e:
-                    logger.debug(f"Could not answer text field: {e}")
+                    logger.debug("Could not answer text field: %s", e)
         except Exception as e:
-            logger.debug(f"No text fields to answer: {e}")
+            logger.debug("No text fields to answer: %s", e)
 
         # --- Dropdown selects ---
         try:
-            from selenium.webdriver.support.ui import Select
-            for select_el in driver.find_elements(By.TAG_NAME, "select"):
+            select_els = driver.find_elements(By.TAG_NAME, "select")
+            for select_el, attrs in zip(select_els, self._collect_field_attrs(driver, select_els)):
                 try:
-                    if not select_el.is_displayed() or not select_el.is_enabled():
+                    if not attrs.get("displayed") or not attrs.get("enabled"):
                         continue
-                    question = self._extract_question_label(driver, select_el)
+                    question = self._extract_question_label(driver, select_el, labels, attrs)
                     options = [
                         o.text.strip()
                         for o in select_el.find_elements(By.TAG_NAME, "option")
@@ -763,53 +975,94 @@ class JobApplier:
                     if not options:
                         continue
                     answer = qa.answer(question or "Select an option", input_type="select", options=options)
-                    HumanBehavior.random_delay(0.6, 1.6)
+                    self._wait_and_jitter(driver, select_el)
                     try:
                         sel.select_by_visible_text(answer)
                     except Exception:
                         sel.select_by_index(1 if len(options) > 1 else 0)
                     filled += 1
                 except Exception as e:
-                    logger.debug(f"Could not answer select: {e}")
+                    logger.debug("Could not answer select: %s", e)
         except Exception as e:
-            logger.debug(f"No selects to answer: {e}")
+            logger.debug("No selects to answer: %s", e)
 
         # --- Radio button groups (group by name) ---
         try:
             radios = driver.find_elements(By.CSS_SELECTOR, "input[type='radio']")
             groups: Dict[str, list] = {}
-            for r in radios:
-                name = r.get_attribute("name") or ""
-                groups.setdefault(name, []).append(r)
+            for r, attrs in zip(radios, self._collect_field_attrs(driver, radios)):
+                groups.setdefault(attrs.get("name") or "", []).append((r, attrs))
             for name, buttons in groups.items():
                 try:
-                    if any(b.is_selected() for b in buttons):
+                    if any(attrs.get("checked") for _, attrs in buttons):
                         continue  # already answered
                     # Build question + option texts from associated labels
                     question = ""
                     option_map = {}
-                    for b in buttons:
-                        label = self._extract_question_label(driver, b) or (b.get_attribute("value") or "")
-                        option_map[label] = b
+                    for b, attrs in buttons:
+                        question_label = self._extract_question_label(driver, b, labels, attrs)
+                        option_map[question_label or attrs.get("value") or ""] = b
                         if not question:
-                            question = self._extract_question_label(driver, b)
+                            question = question_label
                     options = [o for o in option_map.keys() if o]
                     if not options:
                         continue
                     answer = qa.answer(question or "Please choose", input_type="radio", options=options)
-                    target = option_map.get(answer) or buttons[0]
-                    HumanBehavior.random_delay(0.6, 1.6)
+                    target = option_map.get(answer) or buttons[0][0]
+                    self._wait_and_jitter(driver, target)
                     HumanBehavior.human_like_click(driver, target)
                     filled += 1
                 except Exception as e:
-                    logger.debug(f"Could not answer radio group: {e}")
+                    logger.debug("Could not answer radio group: %s", e)
         except Exception as e:
-            logger.debug(f"No radio groups to answer: {e}")
+            logger.debug("No radio groups to answer: %s", e)
 
         if filled:
-            logger.info(f"Intelligently answered {filled} application-form question(s)")
+            logger.info("Intelligently answered %s application-form question(s)", filled)
         return filled
 
+    def _collect_form_fields_js(self, driver) -> List[Dict[str, Any]]:
+        """
+        Describe every fillable field on the current form in one WebDriver call.
+        
+        Each field is tagged in the page with a ``data-jf-idx`` attribute so the
+        matching element can be fetched later with ``_form_field``, only when
+        it is actually going to be clicked or typed into.
+        
+        Args:
+            driver: Selenium WebDriver
+            
+        Returns:
+            List of field records (idx, tag, type, id, placeholder, label, options)
+        """
+        try:
+            return driver.execute_script(COLLECT_FORM_FIELDS_JS) or []
+        except Exception as e:
+            logger.debug("Could not collect form fields: %s", e)
+            return []
+    
+    def _wait_and_jitter(self, driver, element):
+        """
+        Wait until a form field is clickable, then pause briefly.
+        
+        Used instead of a fixed multi-second pause before each field: the wait
+        ends as soon as the field is ready, and the small jitter keeps the
+        timing irregular.
+        
+        Args:
+            driver: Selenium WebDriver
+            element: Field about to be clicked or typed into
+        """
+        try:
+            WebDriverWait(driver, FIELD_WAIT_TIMEOUT).until(EC.element_to_be_clickable(element))
+        except TimeoutException:
+            logger.debug("Field not clickable after %ss; trying anyway", FIELD_WAIT_TIMEOUT)
+        time.sleep(random.uniform(*FIELD_JITTER))
+    
+    def _form_field(self, driver, field: Dict[str, Any]):
+        """Fetch the element for a record returned by ``_collect_form_fields_js``."""
+        return driver.find_element(By.CSS_SELECTOR, f"[data-jf-idx='{field['idx']}']")
+    
     def _fill_linkedin_additional_questions(self, driver, job: Dict[str, Any], cover_letter_path=None):
         """
         Fill in additional questions in LinkedIn application form with human-like interactions.
@@ -827,189 +1080,169 @@ class JobApplier:
             try:
                 self._answer_form_questions(driver, job)
             except Exception as e:
-                logger.debug(f"Intelligent question answering pass failed: {e}")
-
+                logger.debug("Intelligent question answering pass failed: %s", e)
+            
+            # Read every field's tag, placeholder, label and options in a single
+            # round-trip instead of querying each element separately.
+            fields = self._collect_form_fields_js(driver)
+            radio_fields = [f for f in fields if f['type'] == 'radio' and f['value'] == 'Yes']
+            select_fields = [f for f in fields if f['tag'] == 'select']
+            text_fields = [
+                f for f in fields
+                if f['tag'] == 'input' and f['type'] == 'text'
+                and not any(k in f['id'] for k in ('name', 'email', 'phone'))
+            ]
+            textarea_fields = [f for f in fields if f['tag'] == 'textarea']
+            
             # Handle radio buttons for yes/no questions (usually select "Yes" for positive questions)
             try:
-                radio_buttons = driver.find_elements(By.CSS_SELECTOR, "input[type='radio'][value='Yes']")
-                
                 # Randomize order of radio button selection
-                if radio_buttons:
-                    random_indexes = list(range(len(radio_buttons)))
-                    random.shuffle(random_indexes)
-                    
-                    for idx in random_indexes:
-                        try:
-                            # Random delay before selecting each radio button
-                            HumanBehavior.random_delay(0.7, 2.0)
-                            
-                            # Human-like click
-                            HumanBehavior.human_like_click(driver, radio_buttons[idx])
-                            logger.info("Selected 'Yes' for a radio button question")
-                        except:
-                            pass
+                random.shuffle(radio_fields)
+                
+                for field in radio_fields:
+                    try:
+                        radio_button = self._form_field(driver, field)
+                        
+                        # Wait for the radio button to be ready, with a short random pause
+                        self._wait_and_jitter(driver, radio_button)
+                        
+                        # Human-like click
+                        HumanBehavior.human_like_click(driver, radio_button)
+                        logger.info("Selected 'Yes' for a radio button question")
+                    except:
+                        pass
             except:
                 logger.debug("No radio buttons found")
             
             # Handle dropdown selects
             try:
-                selects = driver.find_elements(By.TAG_NAME, "select")
-                
                 # Randomize order of dropdown interaction
-                if selects:
-                    random_indexes = list(range(len(selects)))
-                    random.shuffle(random_indexes)
-                    
-                    for idx in random_indexes:
-                        try:
-                            select = selects[idx]
-                            
-                            # Random delay before clicking dropdown
-                            HumanBehavior.random_delay(0.7, 2.0)
+                random.shuffle(select_fields)
+                
+                for field in select_fields:
+                    try:
+                        # Skip the first option (usually a placeholder)
+                        valid_indexes = [
+                            i for i, text in enumerate(field['options'] or [])
+                            if i > 0 and text.strip()
+                        ]
+                        if not valid_indexes:
+                            continue
+                        
+                        select = self._form_field(driver, field)
+                        
+                        # Choose a random valid option sometimes instead of always the first one
+                        option_text = field['options'][random.choice(valid_indexes)]
+                        
+                        # Opening the dropdown is only visible (and only worth the
+                        # extra round-trips and pauses) when a window is shown
+                        if not self.headless:
+                            # Wait for the dropdown to be ready before clicking it
+                            self._wait_and_jitter(driver, select)
                             
                             # Human-like click to open dropdown
                             HumanBehavior.human_like_click(driver, select)
                             
                             # Small delay as human would look at options
                             HumanBehavior.random_delay(0.5, 1.5)
-                            
-                            # Try to select the first non-empty option
-                            options = select.find_elements(By.TAG_NAME, "option")
-                            
-                            # Skip the first option (usually a placeholder)
-                            valid_options = [opt for opt in options[1:] if opt.text.strip()]
-                            
-                            if valid_options:
-                                # Choose a random valid option sometimes instead of always the first one
-                                option_to_select = random.choice(valid_options)
-                                
-                                # Human-like click
-                                HumanBehavior.human_like_click(driver, option_to_select)
-                                logger.info(f"Selected '{option_to_select.text}' from dropdown")
-                                
-                                # Delay after selection
-                                HumanBehavior.random_delay(0.5, 1.0)
-                        except:
-                            pass
+                        
+                        # Set the value in a single command
+                        Select(select).select_by_visible_text(option_text)
+                        logger.info("Selected '%s' from dropdown", option_text)
+                        
+                        # Delay after selection
+                        if not self.headless:
+                            HumanBehavior.random_delay(0.5, 1.0)
+                    except:
+                        pass
             except:
                 logger.debug("No dropdowns found")
             
             # Handle text inputs for work experience, education, etc.
             try:
-                text_inputs = driver.find_elements(By.CSS_SELECTOR, "input[type='text']:not([id*='name']):not([id*='email']):not([id*='phone'])")
-                
                 # Randomize order of filling text inputs
-                if text_inputs:
-                    random_indexes = list(range(len(text_inputs)))
-                    random.shuffle(random_indexes)
-                    
-                    for idx in random_indexes:
-                        try:
-                            text_input = text_inputs[idx]
-                            placeholder = text_input.get_attribute("placeholder") or ""
-                            
-                            try:
-                                label_elem = driver.find_element(By.CSS_SELECTOR, f"label[for='{text_input.get_attribute('id')}']")
-                                label = label_elem.text if label_elem else ""
-                            except:
-                                label = ""
-                            
-                            # Add delay before filling each field
-                            HumanBehavior.random_delay(1.0, 2.5)
-                            
-                            # Fill based on the field type
-                            if "years" in placeholder.lower() or "years" in label.lower() or "experience" in placeholder.lower() or "experience" in label.lower():
-                                # Add some variation to years of experience
-                                years = str(random.randint(2, 5))
-                                HumanBehavior.human_like_typing(text_input, years)
-                                logger.info(f"Filled in years of experience: {years}")
-                            
-                            elif "salary" in placeholder.lower() or "salary" in label.lower():
-                                # Add some variation to salary expectations
-                                base_salary = 90000
-                                variation = random.randint(-5000, 5000)
-                                salary = str(base_salary + variation)
-                                HumanBehavior.human_like_typing(text_input, salary)
-                                logger.info(f"Filled in salary expectation: {salary}")
-                            
-                            elif "website" in placeholder.lower() or "website" in label.lower() or "portfolio" in placeholder.lower() or "portfolio" in label.lower():
-                                HumanBehavior.human_like_typing(text_input, self.user_info.get('portfolio', ''))
-                                logger.info("Filled in website/portfolio")
-                            
-                            elif "linkedin" in placeholder.lower() or "linkedin" in label.lower():
-                                HumanBehavior.human_like_typing(text_input, self.user_info.get('linkedin', ''))
-                                logger.info("Filled in LinkedIn URL")
-                            
-                            elif "github" in placeholder.lower() or "github" in label.lower():
-                                HumanBehavior.human_like_typing(text_input, self.user_info.get('github', ''))
-                                logger.info("Filled in GitHub URL")
-                        except:
-                            pass
+                random.shuffle(text_fields)
+                
+                for field in text_fields:
+                    try:
+                        # Classify the field from its placeholder and label in one scan
+                        kinds = {
+                            FIELD_KINDS[keyword.lower()]
+                            for keyword in FIELD_KIND_RE.findall(f"{field['placeholder']} {field['label']}")
+                        }
+                        if not kinds:
+                            continue
+                        kind = min(kinds, key=FIELD_KIND_ORDER.index)
+                        description, build_value = FIELD_HANDLERS[kind]
+                        
+                        text_input = self._form_field(driver, field)
+                        
+                        # Wait for the field to be ready, with a short random pause
+                        self._wait_and_jitter(driver, text_input)
+                        
+                        value = build_value(self.user_info)
+                        HumanBehavior.human_like_typing(text_input, value)
+                        logger.info("Filled in %s: %s", description, value)
+                    except:
+                        pass
             except:
                 logger.debug("No additional text inputs found")
             
             # Handle textareas for additional information
             try:
-                textareas = driver.find_elements(By.TAG_NAME, "textarea")
-                
                 # Randomize order of filling textareas
-                if textareas:
-                    random_indexes = list(range(len(textareas)))
-                    random.shuffle(random_indexes)
-                    
-                    for idx in random_indexes:
-                        try:
-                            textarea = textareas[idx]
-                            placeholder = textarea.get_attribute("placeholder") or ""
+                random.shuffle(textarea_fields)
+                
+                for field in textarea_fields:
+                    try:
+                        placeholder = field['placeholder']
+                        label = field['label']
+                        
+                        # Fill based on the field type
+                        if "cover letter" in placeholder.lower() or "cover letter" in label.lower():
+                            if cover_letter_path:
+                                with open(cover_letter_path, 'r', encoding='utf-8') as f:
+                                    cover_letter_text = f.read()
+                                
+                                textarea = self._form_field(driver, field)
+                                self._wait_and_jitter(driver, textarea)
+                                
+                                # Type cover letter with slower, more deliberate typing
+                                HumanBehavior.human_like_typing(textarea, cover_letter_text, min_speed=0.03, max_speed=0.08)
+                                logger.info("Filled in cover letter text")
+                        
+                        elif "additional information" in placeholder.lower() or "additional information" in label.lower():
+                            # Use one of several personalized responses for additional info
+                            additional_info_options = [
+                                "I am very excited about this opportunity and believe my skills and experience make me a strong candidate for this role.",
+                                "I've been following your company's work for some time and am particularly impressed with your recent projects. I believe my background would be a great fit for this position.",
+                                "Thank you for considering my application. I'm passionate about this field and would welcome the opportunity to discuss how my experience aligns with your needs.",
+                                "I'm particularly drawn to this role because it aligns with my professional goals and technical skills. I look forward to potentially joining your team."
+                            ]
+                            selected_info = random.choice(additional_info_options)
                             
-                            try:
-                                label_elem = driver.find_element(By.CSS_SELECTOR, f"label[for='{textarea.get_attribute('id')}']")
-                                label = label_elem.text if label_elem else ""
-                            except:
-                                label = ""
+                            # Add job-specific customization
+                            job_title = job.get('title', 'this position')
+                            company_name = job.get('company_name', 'your company')
                             
-                            # Add longer delay before filling each textarea (they're usually more important)
-                            HumanBehavior.random_delay(1.5, 3.0)
+                            custom_info = f"I'm excited about the {job_title} role at {company_name} and believe my background makes me well-suited for this opportunity."
                             
-                            # Fill based on the field type
-                            if "cover letter" in placeholder.lower() or "cover letter" in label.lower():
-                                if cover_letter_path:
-                                    with open(cover_letter_path, 'r', encoding='utf-8') as f:
-                                        cover_letter_text = f.read()
-                                    
-                                    # Type cover letter with slower, more deliberate typing
-                                    HumanBehavior.human_like_typing(textarea, cover_letter_text, min_speed=0.03, max_speed=0.08)
-                                    logger.info("Filled in cover letter text")
+                            # 50% chance to use custom info
+                            final_text = custom_info if random.random() < 0.5 else selected_info
                             
-                            elif "additional information" in placeholder.lower() or "additional information" in label.lower():
-                                # Use one of several personalized responses for additional info
-                                additional_info_options = [
-                                    "I am very excited about this opportunity and believe my skills and experience make me a strong candidate for this role.",
-                                    "I've been following your company's work for some time and am particularly impressed with your recent projects. I believe my background would be a great fit for this position.",
-                                    "Thank you for considering my application. I'm passionate about this field and would welcome the opportunity to discuss how my experience aligns with your needs.",
-                                    "I'm particularly drawn to this role because it aligns with my professional goals and technical skills. I look forward to potentially joining your team."
-                                ]
-                                selected_info = random.choice(additional_info_options)
-                                
-                                # Add job-specific customization
-                                job_title = job.get('title', 'this position')
-                                company_name = job.get('company_name', 'your company')
-                                
-                                custom_info = f"I'm excited about the {job_title} role at {company_name} and believe my background makes me well-suited for this opportunity."
-                                
-                                # 50% chance to use custom info
-                                final_text = custom_info if random.random() < 0.5 else selected_info
-                                
-                                # Type additional info with human-like typing
-                                HumanBehavior.human_like_typing(textarea, final_text)
-                                logger.info("Filled in additional information")
-                        except:
-                            pass
+                            textarea = self._form_field(driver, field)
+                            self._wait_and_jitter(driver, textarea)
+                            
+                            # Type additional info with human-like typing
+                            HumanBehavior.human_like_typing(textarea, final_text)
+                            logger.info("Filled in additional information")
+                    except:
+                        pass
             except:
                 logger.debug("No textareas found")
         
         except Exception as e:
-            logger.error(f"Error filling LinkedIn additional questions: {e}")
+            logger.error("Error filling LinkedIn additional questions: %s", e)
     
     def _apply_indeed(self, driver, job: Dict[str, Any], resume_path: str, cover_letter_path: Optional[str]) -> bool:
         """
@@ -1046,7 +1279,8 @@ class JobApplier:
         return self._apply_generic(driver, job, resume_path, cover_letter_path, source="ZipRecruiter")
     
     def _apply_generic(self, driver, job: Dict[str, Any], resume_path: str,
-                       cover_letter_path: Optional[str], source: str = "") -> bool:
+                       cover_letter_path: Optional[str], source: str = "",
+                       plan: Optional[FormFillPlan] = None) -> bool:
         """
         Board-agnostic multi-step application filler.
 
@@ -1054,7 +1288,9 @@ class JobApplier:
         resume if a file input is present, intelligently answers all visible
         questions, then clicks the Continue/Next/Submit button. It stops when a
         submit/review action is taken or no further navigation button is found.
+        Board-specific selectors come from ``plan`` (default: FORM_FILL_PLANS[source]).
         """
+        plan = plan or FORM_FILL_PLANS.get(source, DEFAULT_FORM_FILL_PLAN)
         try:
             job_url = job.get("url", "")
             if job_url:
@@ -1062,11 +1298,7 @@ class JobApplier:
                 HumanBehavior.random_delay(2.0, 4.0)
 
             # Click an "Apply"/"Easy Apply"/"Quick Apply" button if present.
-            apply_xpaths = [
-                "//button[contains(translate(., 'APPLY', 'apply'), 'apply')]",
-                "//a[contains(translate(., 'APPLY', 'apply'), 'apply')]",
-            ]
-            for xp in apply_xpaths:
+            for xp in plan.apply_xpaths:
                 try:
                     btn = driver.find_element(By.XPATH, xp)
                     if btn.is_displayed():
@@ -1076,103 +1308,126 @@ class JobApplier:
                 except Exception:
                     continue
 
-            max_steps = 12
-            for _ in range(max_steps):
+            for _ in range(plan.max_steps):
                 # Upload resume if a file input is present and empty.
                 try:
-                    for file_input in driver.find_elements(By.CSS_SELECTOR, "input[type='file']"):
+                    for file_input in driver.find_elements(By.CSS_SELECTOR, plan.file_input_selector):
                         if file_input.is_enabled() and resume_path and os.path.exists(resume_path):
                             file_input.send_keys(os.path.abspath(resume_path))
                             HumanBehavior.random_delay(1.0, 2.0)
                 except Exception as e:
-                    logger.debug(f"No resume upload on this step: {e}")
+                    logger.debug("No resume upload on this step: %s", e)
 
                 # Answer every question on the current step.
                 self._answer_form_questions(driver, job, resume_path)
 
                 # Find the next navigation button.
                 nav = None
-                nav_labels = ["submit application", "submit", "review", "continue", "next"]
-                for label in nav_labels:
+                for nav_xpath in plan.nav_xpaths:
                     try:
-                        nav = driver.find_element(
-                            By.XPATH,
-                            f"//button[contains(translate(normalize-space(.), "
-                            f"'ABCDEFGHIJKLMNOPQRSTUVWXYZ', 'abcdefghijklmnopqrstuvwxyz'), '{label}')]",
-                        )
+                        nav = driver.find_element(By.XPATH, nav_xpath)
                         if nav and nav.is_displayed() and nav.is_enabled():
                             break
                         nav = None
                     except Exception:
                         nav = None
                 if not nav:
-                    logger.info(f"{source}: no further navigation button; ending flow")
+                    logger.info("%s: no further navigation button; ending flow", source)
                     break
 
-                is_submit = any(k in (nav.text or "").lower() for k in ("submit", "review"))
+                is_submit = any(k in (nav.text or "").lower() for k in plan.submit_keywords)
                 HumanBehavior.random_delay(0.8, 2.0)
                 HumanBehavior.human_like_click(driver, nav)
                 HumanBehavior.random_delay(1.5, 3.0)
                 if is_submit:
-                    logger.info(f"{source}: submitted application for {job.get('title', '')}")
+                    logger.info("%s: submitted application for %s", source, job.get('title', ''))
                     return True
 
             return True
         except Exception as e:
-            logger.error(f"Error in generic application flow ({source}): {e}")
+            logger.error("Error in generic application flow (%s): %s", source, e)
             return False
 
-    def _record_application(self, job: Dict[str, Any]):
+    def _append_log(self, path: str, fields: List[str], values: list):
+        """
+        Append one record to a JSON Lines log.
+        
+        The file is opened once per JobApplier. Each record is written as a
+        single line under an exclusive lock (where supported) so several
+        appliers can share the same log.
+        
+        Args:
+            path: Path to the .jsonl file
+            fields: Field names, in order
+            values: Field values matching ``fields``
+        """
+        log_file = self._logs.get(path)
+        if log_file is None:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            self._write_log_schema(path, fields)
+            log_file = self._logs[path] = open(path, "a", encoding="utf-8")
+        
+        line = json.dumps(dict(zip(fields, values)), separators=(",", ":")) + "\n"
+        if fcntl:
+            fcntl.flock(log_file.fileno(), fcntl.LOCK_EX)
+        try:
+            log_file.write(line)
+            log_file.flush()
+        finally:
+            if fcntl:
+                fcntl.flock(log_file.fileno(), fcntl.LOCK_UN)
+    
+    def _write_log_schema(self, path: str, fields: List[str]):
+        """Write ``<log>.schema.json`` listing the log's fields, if missing."""
+        schema_path = os.path.splitext(path)[0] + ".schema.json"
+        if os.path.exists(schema_path):
+            return
+        tmp_path = f"{schema_path}.{os.getpid()}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump({"fields": fields}, f, indent=2)
+        os.replace(tmp_path, schema_path)
+    
+    def close(self):
+        """Close any log files opened by this applier."""
+        for log_file in self._logs.values():
+            log_file.close()
+        self._logs.clear()
+    
+    def _record_application(self, job: JobRecord):
         """
         Record a successful application.
         
         Args:
-            job: Job listing dictionary
+            job: Job record built in apply()
         """
         try:
-            # Create output directory if it doesn't exist
-            output_dir = "data_folder/applications"
-            os.makedirs(output_dir, exist_ok=True)
-            
-            # Record application details
-            with open(os.path.join(output_dir, "applications.csv"), "a", encoding="utf-8") as f:
-                # Write header if file is empty
-                if os.path.getsize(os.path.join(output_dir, "applications.csv")) == 0:
-                    f.write("Date,Company,Title,Location,URL,Source,H1B_Sponsor,HiringManager,HiringManagerEmail\n")
-                
-                # Write application details
-                f.write(f"{time.strftime('%Y-%m-%d')},{job.get('company_name', '')},{job.get('title', '')},{job.get('location', '')},{job.get('url', '')},{job.get('source', '')},{job.get('sponsors_h1b', False)},{job.get('hiring_manager_name', '')},{job.get('hiring_manager_email', '')}\n")
+            self._append_log(APPLICATIONS_LOG, APPLICATIONS_FIELDS, [
+                today(), job.company_name, job.title, job.location, job.url,
+                job.source, job.sponsors_h1b, job.hiring_manager_name, job.hiring_manager_email,
+            ])
         
         except Exception as e:
-            logger.error(f"Error recording application: {e}")
+            logger.error("Error recording application: %s", e)
     
-    def _schedule_follow_up(self, job: Dict[str, Any], days: int):
+    def _schedule_follow_up(self, job: JobRecord, days: int):
         """
         Schedule a follow-up for a job application.
         
         Args:
-            job: Job listing dictionary
+            job: Job record built in apply()
             days: Number of days to wait before following up
         """
         try:
-            # Create output directory if it doesn't exist
-            output_dir = "data_folder/follow_ups"
-            os.makedirs(output_dir, exist_ok=True)
-            
             # Calculate follow-up date
             follow_up_date = time.strftime('%Y-%m-%d', time.localtime(time.time() + days * 86400))
             
-            # Record follow-up details
-            with open(os.path.join(output_dir, "follow_ups.csv"), "a", encoding="utf-8") as f:
-                # Write header if file is empty
-                if os.path.getsize(os.path.join(output_dir, "follow_ups.csv")) == 0:
-                    f.write("FollowUpDate,Company,Title,ContactName,ContactEmail,URL,Applied\n")
-                
-                # Write follow-up details
-                f.write(f"{follow_up_date},{job.get('company_name', '')},{job.get('title', '')},{job.get('hiring_manager_name', '')},{job.get('hiring_manager_email', '')},{job.get('url', '')},{time.strftime('%Y-%m-%d')}\n")
+            self._append_log(FOLLOW_UPS_LOG, FOLLOW_UPS_FIELDS, [
+                follow_up_date, job.company_name, job.title, job.hiring_manager_name,
+                job.hiring_manager_email, job.url, today(),
+            ])
         
         except Exception as e:
-            logger.error(f"Error scheduling follow-up: {e}")
+            logger.error("Error scheduling follow-up: %s", e)
     
     def _send_direct_email(self, job: Dict[str, Any], cover_letter_path: str):
         """
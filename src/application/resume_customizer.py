@@ -1,5 +1,12 @@
 import os
+import json
+import time
 import logging
+import hashlib
+import functools
+import shelve
+import shutil
+from collections import Counter
 from src.utils.ai_client import AIClient
 from typing import Dict, Any
 from pypdf import PdfReader
@@ -9,6 +16,155 @@ import re
 
 logger = logging.getLogger(__name__)
 
+# Common section headers in resumes
+SECTION_PATTERNS = [
+    (r'skills?|technical skills?|core competenc(?:y|ies)', 'skills'),
+    (r'projects?|personal projects?|key projects?', 'projects'),
+    (r'experience|work experience|professional experience|employment', 'experience'),
+    (r'education|academic|qualifications', 'education'),
+    (r'certifications?|licenses?', 'certifications'),
+    (r'summary|profile|objective', 'summary'),
+    (r'contact|personal information', 'contact')
+]
+
+# All section headers fused into one pattern; match.lastgroup names the section
+SECTION_RE = re.compile(
+    '|'.join(f'(?P<{name}>{pattern})' for pattern, name in SECTION_PATTERNS),
+    re.IGNORECASE | re.MULTILINE
+)
+
+# Per section, a regex matching any *other* section's header on a line of its
+# own; used to cut off a streamed customization that runs past its section
+SECTION_STOP_RES = {
+    name: re.compile(
+        r'\n[ \t]*(?:' + '|'.join(other for other, other_name in SECTION_PATTERNS if other_name != name) + r')[ \t]*:?[ \t]*\n',
+        re.IGNORECASE
+    )
+    for _, name in SECTION_PATTERNS
+}
+
+# On-disk cache of section customizations, keyed by a hash of model + prompt
+LLM_CACHE_PATH = "data_folder/.llm_cache"
+
+# Recent customizations indexed by a SimHash of the job description, so a
+# near-duplicate posting reuses the earlier output instead of calling the model
+FINGERPRINT_INDEX_PATH = "data_folder/.jd_fingerprints.json"
+FINGERPRINT_MAX_DISTANCE = 3  # Max differing bits (of 64) to count as a near-duplicate
+FINGERPRINT_MAX_AGE_DAYS = 14
+
+TOKEN_RE = re.compile(r'[a-z0-9+#]+')
+
+
+@functools.lru_cache(maxsize=8)
+def _extract_resume_text(path: str, mtime: float) -> str:
+    """
+    Extract text content from a resume file, cached per (path, mtime).
+    
+    Raises on failure (failures are not cached).
+    
+    Args:
+        path: Path to the resume file
+        mtime: Modification time of the file, part of the cache key
+        
+    Returns:
+        Resume text content
+    """
+    file_ext = os.path.splitext(path)[1].lower()
+    
+    if file_ext == '.pdf':
+        # Extract text from PDF, preferring the native PDFium engine
+        try:
+            return _extract_pdf_text_pdfium(path)
+        except Exception as e:
+            logger.debug(f"pypdfium2 extraction unavailable, falling back to pypdf: {e}")
+        
+        with open(path, 'rb') as file:
+            reader = PdfReader(file)
+            return "\n".join(page.extract_text() or "" for page in reader.pages)
+    
+    elif file_ext == '.docx':
+        # Extract text from DOCX
+        doc = Document(path)
+        return "".join(f"{para.text}\n" for para in doc.paragraphs)
+    
+    elif file_ext == '.txt':
+        # Extract text from TXT
+        with open(path, 'r', encoding='utf-8') as file:
+            return file.read()
+    
+    else:
+        raise ValueError(f"Unsupported resume file format: {file_ext}")
+
+
+def _extract_pdf_text_pdfium(path: str) -> str:
+    """
+    Extract text from a PDF with pypdfium2 (PDFium bindings).
+    
+    Raises:
+        ImportError: If pypdfium2 is not installed
+    
+    Returns:
+        PDF text content
+    """
+    import pypdfium2 as pdfium
+    
+    pdf = pdfium.PdfDocument(path)
+    try:
+        return "\n".join(page.get_textpage().get_text_range() for page in pdf)
+    finally:
+        pdf.close()
+
+
+def _simhash(text: str) -> int:
+    """
+    64-bit SimHash of a text's word counts. Near-duplicate texts produce
+    fingerprints that differ in only a few bits.
+    """
+    weights = [0] * 64
+    for token, count in Counter(TOKEN_RE.findall(text.lower())).items():
+        token_hash = int.from_bytes(hashlib.blake2b(token.encode('utf-8'), digest_size=8).digest(), 'big')
+        for bit in range(64):
+            weights[bit] += count if token_hash >> bit & 1 else -count
+    return sum(1 << bit for bit in range(64) if weights[bit] > 0)
+
+
+@functools.lru_cache(maxsize=8)
+def _parse_sections(resume_content: str) -> Dict[str, str]:
+    """Split resume content into sections (cached per content)."""
+    # Find section boundaries
+    sections = {}
+    section_starts = []
+    
+    # Find all potential section headers in a single scan
+    for match in SECTION_RE.finditer(resume_content):
+        line_start = resume_content.rfind('\n', 0, match.start()) + 1
+        line_end = resume_content.find('\n', match.end())
+        if line_end == -1:
+            line_end = len(resume_content)
+        
+        # Get the full line containing the match
+        line = resume_content[line_start:line_end].strip()
+        
+        # Check if this is likely a section header (short line, possibly with formatting)
+        if len(line) < 50:  # Arbitrary threshold for header length
+            section_starts.append((line_start, match.lastgroup, line))
+    
+    # Sort section starts by position
+    section_starts.sort()
+    
+    # Extract section content
+    for i, (start, name, header) in enumerate(section_starts):
+        end = section_starts[i+1][0] if i < len(section_starts) - 1 else len(resume_content)
+        content = resume_content[start:end].strip()
+        sections[name] = content
+    
+    # If no sections were found, use the entire resume
+    if not sections:
+        sections['full_resume'] = resume_content
+    
+    return sections
+
+
 class ResumeCustomizer:
     """
     Customizes resume based on job description, focusing only on skills and projects.
@@ -65,6 +221,13 @@ class ResumeCustomizer:
                 logger.error("Job description is empty")
                 return self.resume_path
             
+            # Reuse the output of a recent near-identical job description
+            fingerprint = _simhash(job_description)
+            resume_digest = hashlib.sha256(resume_content.encode('utf-8')).hexdigest()
+            reused_path = self._reuse_similar_customization(fingerprint, resume_digest, job)
+            if reused_path:
+                return reused_path
+            
             # Parse resume into sections
             resume_sections = self._parse_resume_sections(resume_content)
             
@@ -82,6 +245,8 @@ class ResumeCustomizer:
             
             # Create customized resume file
             output_path = self._create_customized_resume(merged_content, job)
+            if output_path != self.resume_path:
+                self._remember_customization(fingerprint, resume_digest, output_path)
             
             logger.info(f"Created customized resume with targeted skills and projects: {output_path}")
             return output_path
@@ -94,38 +259,14 @@ class ResumeCustomizer:
         """
         Extract text content from resume file.
         
+        The text is cached per (path, modification time), so the base resume
+        is only read once per batch unless the file changes.
+        
         Returns:
             Resume text content
         """
         try:
-            file_ext = os.path.splitext(self.resume_path)[1].lower()
-            
-            if file_ext == '.pdf':
-                # Extract text from PDF
-                with open(self.resume_path, 'rb') as file:
-                    reader = PdfReader(file)
-                    content = ""
-                    for page in reader.pages:
-                        content += page.extract_text()
-                    return content
-            
-            elif file_ext == '.docx':
-                # Extract text from DOCX
-                doc = Document(self.resume_path)
-                content = ""
-                for para in doc.paragraphs:
-                    content += para.text + "\n"
-                return content
-            
-            elif file_ext == '.txt':
-                # Extract text from TXT
-                with open(self.resume_path, 'r', encoding='utf-8') as file:
-                    return file.read()
-            
-            else:
-                logger.error(f"Unsupported resume file format: {file_ext}")
-                return ""
-        
+            return _extract_resume_text(self.resume_path, os.path.getmtime(self.resume_path))
         except Exception as e:
             logger.error(f"Error extracting resume content: {e}")
             return ""
@@ -140,50 +281,8 @@ class ResumeCustomizer:
         Returns:
             Dictionary of resume sections
         """
-        # Common section headers in resumes
-        section_patterns = [
-            (r'(?i)skills?|technical skills?|core competenc(?:y|ies)', 'skills'),
-            (r'(?i)projects?|personal projects?|key projects?', 'projects'),
-            (r'(?i)experience|work experience|professional experience|employment', 'experience'),
-            (r'(?i)education|academic|qualifications', 'education'),
-            (r'(?i)certifications?|licenses?', 'certifications'),
-            (r'(?i)summary|profile|objective', 'summary'),
-            (r'(?i)contact|personal information', 'contact')
-        ]
-        
-        # Find section boundaries
-        sections = {}
-        section_starts = []
-        
-        # Find all potential section headers
-        for pattern, section_name in section_patterns:
-            for match in re.finditer(pattern, resume_content, re.MULTILINE):
-                line_start = resume_content.rfind('\n', 0, match.start()) + 1
-                line_end = resume_content.find('\n', match.end())
-                if line_end == -1:
-                    line_end = len(resume_content)
-                
-                # Get the full line containing the match
-                line = resume_content[line_start:line_end].strip()
-                
-                # Check if this is likely a section header (short line, possibly with formatting)
-                if len(line) < 50:  # Arbitrary threshold for header length
-                    section_starts.append((line_start, section_name, line))
-        
-        # Sort section starts by position
-        section_starts.sort()
-        
-        # Extract section content
-        for i, (start, name, header) in enumerate(section_starts):
-            end = section_starts[i+1][0] if i < len(section_starts) - 1 else len(resume_content)
-            content = resume_content[start:end].strip()
-            sections[name] = content
-        
-        # If no sections were found, use the entire resume
-        if not sections:
-            sections['full_resume'] = resume_content
-        
-        return sections
+        # Copy so callers can't mutate the cached result
+        return dict(_parse_sections(resume_content))
     
     def _customize_targeted_sections(self, resume_sections: Dict[str, str], 
                                     job_description: str, job_title: str, 
@@ -206,34 +305,56 @@ class ResumeCustomizer:
             # Only customize skills and projects sections
             sections_to_customize = ['skills', 'projects']
             
-            for section_name in sections_to_customize:
-                if section_name in resume_sections:
-                    original_section = resume_sections[section_name]
-                    
-                    prompt = f"""
-                    You are an expert resume customizer. Your task is to customize ONLY the {section_name} section of a resume to better match a job description.
-                    
-                    Original {section_name} section:
-                    {original_section}
-                    
-                    Job Title: {job_title}
-                    Company: {company_name}
-                    Job Description:
-                    {job_description}
-                    
-                    Please customize ONLY the {section_name} section to highlight relevant {section_name} that match the job description.
-                    Keep the same format and structure as the original section, but modify the content to better match the job requirements.
-                    Do not add fictional {section_name} that are not mentioned in the original section.
-                    
-                    Return only the customized {section_name} section text, starting with the section header.
-                    """
-                    
-                    customized_section = self.ai.chat(
-                        system=f"You are an expert resume customizer focusing on {section_name}.",
-                        user=prompt,
-                        max_tokens=2000,
-                        temperature=0.5,
-                    )
+            os.makedirs(os.path.dirname(LLM_CACHE_PATH), exist_ok=True)
+            with shelve.open(LLM_CACHE_PATH) as cache:
+                # Requests not answered from the cache: section name -> (cache key, chat kwargs)
+                pending = {}
+                
+                for section_name in sections_to_customize:
+                    if section_name in resume_sections:
+                        original_section = resume_sections[section_name]
+                        
+                        prompt = f"""
+                        You are an expert resume customizer. Your task is to customize ONLY the {section_name} section of a resume to better match a job description.
+                        
+                        Original {section_name} section:
+                        {original_section}
+                        
+                        Job Title: {job_title}
+                        Company: {company_name}
+                        Job Description:
+                        {job_description}
+                        
+                        Please customize ONLY the {section_name} section to highlight relevant {section_name} that match the job description.
+                        Keep the same format and structure as the original section, but modify the content to better match the job requirements.
+                        Do not add fictional {section_name} that are not mentioned in the original section.
+                        
+                        Return only the customized {section_name} section text, starting with the section header.
+                        """
+                        
+                        system = f"You are an expert resume customizer focusing on {section_name}."
+                        
+                        # Reuse the previous response for an identical prompt
+                        key = self._llm_cache_key(system, prompt)
+                        cached_section = cache.get(key)
+                        if cached_section is not None:
+                            logger.info(f"Using cached customization for {section_name} section")
+                            customized_sections[section_name] = cached_section
+                        else:
+                            pending[section_name] = (key, {
+                                'system': system,
+                                'user': prompt,
+                                'max_tokens': 2000,
+                                'temperature': 0.5,
+                                # Stop streaming if the model moves on to another section
+                                'stop_pattern': SECTION_STOP_RES[section_name],
+                            })
+                
+                # Send the remaining sections to the model concurrently
+                responses = self.ai.chat_many([request for _, request in pending.values()])
+                for (section_name, (key, _)), customized_section in zip(pending.items(), responses):
+                    if customized_section:
+                        cache[key] = customized_section
                     customized_sections[section_name] = customized_section
             
             return customized_sections
@@ -242,6 +363,19 @@ class ResumeCustomizer:
             logger.error(f"Error customizing targeted sections: {e}")
             return {}
     
+    def _llm_cache_key(self, system: str, prompt: str) -> str:
+        """
+        Build the cache key for a customization request.
+        
+        Args:
+            system: System message
+            prompt: User prompt (contains the section text and job description)
+            
+        Returns:
+            Hex digest identifying the model and prompt
+        """
+        return hashlib.sha256("\0".join((self.ai.model, system, prompt)).encode('utf-8')).hexdigest()
+    
     def _merge_resume_sections(self, original_sections: Dict[str, str], 
                               customized_sections: Dict[str, str]) -> str:
         """
@@ -268,12 +402,93 @@ class ResumeCustomizer:
         
         # Reconstruct the resume in the original section order
         section_order = list(original_sections.keys())
-        merged_content = ""
+        return "\n\n".join(merged_sections[section_name] for section_name in section_order).strip()
+    
+    def _load_fingerprints(self) -> list:
+        """
+        Load the recent customization index, dropping expired entries.
+        
+        Returns:
+            List of {"fingerprint", "resume", "path", "created"} entries
+        """
+        try:
+            with open(FINGERPRINT_INDEX_PATH, 'r', encoding='utf-8') as f:
+                entries = json.load(f)
+        except FileNotFoundError:
+            return []
+        except Exception as e:
+            logger.warning(f"Could not read customization index: {e}")
+            return []
         
-        for section_name in section_order:
-            merged_content += merged_sections[section_name] + "\n\n"
+        cutoff = time.time() - FINGERPRINT_MAX_AGE_DAYS * 86400
+        return [entry for entry in entries if entry.get('created', 0) >= cutoff]
+    
+    def _reuse_similar_customization(self, fingerprint: int, resume_digest: str, job: Dict[str, Any]) -> str:
+        """
+        Copy a recent customization made from the same base resume for a
+        near-identical job description (SimHash within FINGERPRINT_MAX_DISTANCE bits).
         
-        return merged_content.strip()
+        Args:
+            fingerprint: SimHash of the job description
+            resume_digest: SHA-256 of the base resume text
+            job: Job listing dictionary
+            
+        Returns:
+            Path to the copied resume, or "" if there is no match
+        """
+        for entry in self._load_fingerprints():
+            if entry['resume'] != resume_digest or not os.path.exists(entry['path']):
+                continue
+            if bin(fingerprint ^ entry['fingerprint']).count('1') > FINGERPRINT_MAX_DISTANCE:
+                continue
+            
+            output_dir = os.path.dirname(entry['path'])
+            output_path = os.path.join(output_dir, self._safe_filename(job) + os.path.splitext(entry['path'])[1])
+            if os.path.abspath(output_path) != os.path.abspath(entry['path']):
+                shutil.copyfile(entry['path'], output_path)
+            logger.info(f"Reused customized resume from a near-identical job description: {entry['path']}")
+            return output_path
+        return ""
+    
+    def _remember_customization(self, fingerprint: int, resume_digest: str, output_path: str):
+        """
+        Add a customization to the index used by _reuse_similar_customization.
+        
+        Args:
+            fingerprint: SimHash of the job description
+            resume_digest: SHA-256 of the base resume text
+            output_path: Path to the customized resume
+        """
+        try:
+            entries = self._load_fingerprints()
+            entries.append({
+                'fingerprint': fingerprint,
+                'resume': resume_digest,
+                'path': output_path,
+                'created': time.time(),
+            })
+            
+            os.makedirs(os.path.dirname(FINGERPRINT_INDEX_PATH), exist_ok=True)
+            tmp_path = f"{FINGERPRINT_INDEX_PATH}.{os.getpid()}.tmp"
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(entries, f)
+            os.replace(tmp_path, FINGERPRINT_INDEX_PATH)
+        except Exception as e:
+            logger.warning(f"Could not update customization index: {e}")
+    
+    def _safe_filename(self, job: Dict[str, Any]) -> str:
+        """
+        Build a filesystem-safe base name from the job's company and title.
+        
+        Args:
+            job: Job listing dictionary
+            
+        Returns:
+            File name without extension
+        """
+        company_name = re.sub(r'[^\w\s-]', '', job.get('company_name', 'company')).strip()
+        job_title = re.sub(r'[^\w\s-]', '', job.get('title', 'job')).strip()
+        return f"{company_name}_{job_title}".replace(' ', '_')
     
     def _create_customized_resume(self, content: str, job: Dict[str, Any]) -> str:
         """
@@ -292,9 +507,7 @@ class ResumeCustomizer:
             os.makedirs(output_dir, exist_ok=True)
             
             # Generate safe filename
-            company_name = re.sub(r'[^\w\s-]', '', job.get('company_name', 'company')).strip()
-            job_title = re.sub(r'[^\w\s-]', '', job.get('title', 'job')).strip()
-            safe_filename = f"{company_name}_{job_title}".replace(' ', '_')
+            safe_filename = self._safe_filename(job)
             
             # Determine output file format based on original resume
             file_ext = os.path.splitext(self.resume_path)[1].lower()
@@ -310,9 +523,10 @@ class ResumeCustomizer:
             elif file_ext == '.docx':
                 # Create DOCX
                 doc = Document()
-                for paragraph in content.split('\n'):
-                    p = doc.add_paragraph(paragraph)
-                    p.style.font.size = Pt(11)
+                # Every paragraph uses the shared Normal style, so size it once
+                doc.styles['Normal'].font.size = Pt(11)
+                for paragraph in content.splitlines():
+                    doc.add_paragraph(paragraph)
                 doc.save(output_path)
                 return output_path
             
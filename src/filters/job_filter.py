@@ -1,9 +1,85 @@
 import logging
-from typing import Dict, List, Any, Optional
+import re
+import sys
+from functools import lru_cache
+from typing import Dict, List, Any, Optional, Tuple, Iterable
 from src.utils.h1b_sponsor_checker import H1BSponsorChecker
 
+try:
+    import hyperscan  # type: ignore[import-untyped,import-not-found]  # optional, SIMD multi-pattern matcher (Linux/macOS x86-64)
+except ImportError:
+    hyperscan = None
+
+try:
+    import ahocorasick  # type: ignore[import-untyped,import-not-found]  # pyahocorasick: optional, scans for all keywords in one pass
+except ImportError:
+    ahocorasick = None
+
 logger = logging.getLogger(__name__)
 
+# An amount or range in a salary string such as "$60,000 - $80,000 a year" or
+# "$45K"; the groups are the dollar sign, then number and K suffix of the low
+# and (optional) high end
+SALARY_RANGE_RE = re.compile(
+    r"(\$)?\s*(\d[\d,]*(?:\.\d+)?)\s*([kK])?"
+    r"(?:\s*(?:-|\u2013|\u2014|\bto\b)\s*\$?\s*(\d[\d,]*(?:\.\d+)?)\s*([kK])?)?"
+)
+
+# Pay period quoted as the unit of an amount ("$30/hr", "$25 an hour",
+# "$5,000 per month", "$40 hourly"), not just mentioned ("40 hours a week")
+SALARY_PERIOD_RE = re.compile(
+    r"(?:\b(?:per|an?)\s+|/\s*)(hour|hr|day|week|month|year|yr|annum)\b"
+    r"|\d\s*[kK]?\s+(hourly|daily|weekly|monthly|yearly|annually)\b"
+)
+
+# Multipliers converting a quoted pay period to a yearly amount
+SALARY_PERIODS = {
+    'hour': 2080, 'hr': 2080, 'hourly': 2080,
+    'day': 260, 'daily': 260,
+    'week': 52, 'weekly': 52,
+    'month': 12, 'monthly': 12,
+    'year': 1, 'yr': 1, 'annum': 1, 'yearly': 1, 'annually': 1,
+}
+
+
+@lru_cache(maxsize=1024)
+def parse_salary(salary) -> Optional[float]:
+    """
+    Convert a scraped salary into a yearly amount.
+    
+    Scrapers store salaries as text, and many listings repeat the same text,
+    so results are cached per distinct value.
+    
+    Args:
+        salary: Salary as a number or text (e.g. "$25 - $30 an hour")
+        
+    Returns:
+        Top of the quoted range per year, or None if no amount is found
+    """
+    if isinstance(salary, (int, float)):
+        return float(salary)
+    
+    # The pay is the first dollar amount or range; other numbers ("401k
+    # match", "40 hours a week") aren't pay. Without a dollar sign, the
+    # first number is taken.
+    text = str(salary).lower()
+    ranges = list(SALARY_RANGE_RE.finditer(text))
+    if not ranges:
+        return None
+    pay = next((match for match in ranges if match.group(1)), ranges[0])
+    _, low, low_thousands, high, high_thousands = pay.groups()
+    if high:
+        amount = float(high.replace(',', '')) * (1000 if high_thousands else 1)
+    else:
+        amount = float(low.replace(',', '')) * (1000 if low_thousands else 1)
+    
+    # An explicitly yearly salary stays as quoted, whatever else it mentions
+    factors = [SALARY_PERIODS[unit or adverb] for unit, adverb in SALARY_PERIOD_RE.findall(text)]
+    if 'annual' in text or 1 in factors:
+        return amount
+    return amount * (factors[0] if factors else 1)
+
+
 class JobFilter:
     """
     Filter job listings based on various criteria including H1B sponsorship.
@@ -17,21 +93,169 @@ class JobFilter:
             config: Configuration dictionary
         """
         self.config = config
-        self.h1b_filter_enabled = config.get('filter_h1b_sponsors', False)
-        self.h1b_checker = H1BSponsorChecker() if self.h1b_filter_enabled else None
+        self.h1b_filter_enabled: bool = config.get('filter_h1b_sponsors', False)
+        self.h1b_checker: Optional[H1BSponsorChecker] = H1BSponsorChecker() if self.h1b_filter_enabled else None
+        # Sponsorship results by normalized company name; scrape batches list
+        # many jobs per company
+        self._h1b_cache: Dict[str, bool] = {}
         
         # Pre-load top sponsors if H1B filter is enabled
-        if self.h1b_filter_enabled:
+        if self.h1b_checker is not None:
             logger.info("Initializing H1B sponsor filter and pre-loading top sponsors...")
             self.h1b_checker.get_top_h1b_sponsors()
         
         # Other filter settings
-        self.keywords = config.get('keywords', [])
-        self.exclude_keywords = config.get('exclude_keywords', [])
-        self.min_salary = config.get('min_salary', 0)
-        self.experience_level = config.get('experience_level', '')
-        self.job_type = config.get('job_type', '')
+        self.keywords: List[str] = config.get('keywords', [])
+        self.exclude_keywords: List[str] = config.get('exclude_keywords', [])
+        self.min_salary: int = config.get('min_salary', 0)
+        self.experience_level: str = config.get('experience_level', '')
+        self.job_type: str = config.get('job_type', '')
+        self._experience_level = self.experience_level.lower()
+        self._job_type = self.job_type.lower()
+        
+        # Lowercased once here rather than for every job
+        self._kw_inc: Tuple[str, ...] = tuple(sys.intern(keyword.lower()) for keyword in self.keywords)
+        self._kw_exc: Tuple[str, ...] = tuple(sys.intern(keyword.lower()) for keyword in self.exclude_keywords)
+        
+        # Hyperscan database matching include and exclude keywords together in
+        # one scan; pattern ids index _scan_terms, includes first
+        self._scan_terms: Tuple[str, ...] = tuple(k for k in self._kw_inc if k) + tuple(k for k in self._kw_exc if k)
+        self._scan_include_count = sum(1 for k in self._kw_inc if k)
+        self._keyword_db = self._build_hyperscan_db(self._scan_terms)
+        
+        # Otherwise Aho-Corasick automatons matching every include/exclude
+        # keyword in a single pass over a job's text (None if pyahocorasick
+        # is unavailable)
+        self._include_automaton = None
+        self._exclude_automaton = None
+        if self._keyword_db is None:
+            self._include_automaton = self._build_automaton(self.keywords)
+            self._exclude_automaton = self._build_automaton(self.exclude_keywords)
+        
+        # Last resort for exclude keywords: one compiled alternation searched
+        # once instead of a substring test per keyword
+        exclude_terms = sorted({k for k in self._kw_exc if k}, key=len, reverse=True)
+        self._exclude_re = re.compile("|".join(map(re.escape, exclude_terms))) if exclude_terms else None
+        
+        self._predicate = self._compile_predicate()
+    
+    def _compile_predicate(self):
+        """
+        Generate the non-H1B checks as one function specialized to this config.
+        
+        Only the checks that are configured are emitted, so the per-job path
+        carries no branches for disabled filters. Checks run cheapest first:
+        field comparisons, then the keyword scan over the description.
+        
+        Returns:
+            Function taking a job dictionary and returning True if it passes
+        """
+        lines = ["def passes(job):"]
+        
+        # Apply experience level filter if specified
+        if self.experience_level:
+            lines += [
+                "    if 'experience_level' in job and job['experience_level'].lower() != experience_level:",
+                "        logger.debug('Filtered out job: experience level mismatch')",
+                "        return False",
+            ]
+        
+        # Apply job type filter if specified
+        if self.job_type:
+            lines += [
+                "    if 'job_type' in job and job['job_type'].lower() != job_type:",
+                "        logger.debug('Filtered out job: job type mismatch')",
+                "        return False",
+            ]
+        
+        # Apply salary filter if available
+        if self.min_salary > 0:
+            lines += [
+                "    if job.get('salary'):",
+                "        salary = parse_salary(job['salary'])",
+                "        if salary is not None and salary < min_salary:",
+                "            logger.debug(f\"Filtered out job: salary {job['salary']} below minimum {min_salary}\")",
+                "            return False",
+            ]
+        
+        # Apply keyword filters to title and description scanned together;
+        # the newline keeps a keyword from matching across the boundary
+        if self.keywords or self.exclude_keywords:
+            lines += [
+                "    haystack = f\"{job.get('title', '')}\\n{job.get('description', '')}\".lower()",
+                "    rejection = keyword_rejection(haystack)",
+                "    if rejection:",
+                "        logger.debug(f'Filtered out job: {rejection}')",
+                "        return False",
+            ]
+        
+        lines.append("    return True")
+        
+        namespace = {
+            'logger': logger,
+            'experience_level': self._experience_level,
+            'job_type': self._job_type,
+            'min_salary': self.min_salary,
+            'parse_salary': parse_salary,
+            'keyword_rejection': self._keyword_rejection,
+        }
+        exec(compile("\n".join(lines), "<job_filter_predicate>", "exec"), namespace)
+        return namespace['passes']
+    
+    @staticmethod
+    def _build_hyperscan_db(terms: Tuple[str, ...]) -> Optional[Any]:
+        """
+        Compile keywords into a Hyperscan block-mode database.
         
+        Args:
+            terms: Lowercased keywords; each one's index is its pattern id
+            
+        Returns:
+            hyperscan.Database, or None if Hyperscan is unavailable, there are
+            no keywords, or compilation fails
+        """
+        if hyperscan is None or not terms:
+            return None
+        
+        try:
+            db = hyperscan.Database(mode=hyperscan.HS_MODE_BLOCK)
+            db.compile(
+                expressions=[re.escape(term).encode('utf-8') for term in terms],
+                ids=list(range(len(terms))),
+                elements=len(terms),
+                flags=[hyperscan.HS_FLAG_SINGLEMATCH] * len(terms),
+            )
+            return db
+        except Exception as e:
+            logger.warning(f"Could not compile keyword database, falling back: {e}")
+            return None
+    
+    @staticmethod
+    def _build_automaton(keywords: List[str]) -> Optional[Any]:
+        """
+        Build an Aho-Corasick automaton over lowercased keywords.
+        
+        Each keyword maps to (index, keyword), where index numbers the distinct
+        lowercased keywords from 0.
+        
+        Args:
+            keywords: Keywords to match
+            
+        Returns:
+            ahocorasick.Automaton, or None if pyahocorasick is unavailable or
+            there are no keywords
+        """
+        if ahocorasick is None or not keywords:
+            return None
+        
+        automaton = ahocorasick.Automaton()
+        for keyword in keywords:
+            lowered = keyword.lower()
+            if lowered and lowered not in automaton:
+                automaton.add_word(lowered, (len(automaton), keyword))
+        automaton.make_automaton()
+        return automaton
+
     def filter_jobs(self, jobs: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """
         Filter job listings based on configured criteria.
@@ -45,8 +269,14 @@ class JobFilter:
         filtered_jobs = []
         h1b_sponsor_count = 0
         
-        for job in jobs:
-            if self._passes_filters(job):
+        # Cheap filters first, then every distinct company among the survivors
+        # is checked for H1B sponsorship once for the whole batch
+        candidates = [job for job in jobs if self._passes_filters(job, check_h1b=False)]
+        if self.h1b_filter_enabled:
+            self._resolve_h1b_sponsors(job.get('company_name', '') for job in candidates)
+        
+        for job in candidates:
+            if not self.h1b_filter_enabled or self._passes_h1b_filter(job):
                 filtered_jobs.append(job)
                 if self.h1b_filter_enabled and job.get('sponsors_h1b', False):
                     h1b_sponsor_count += 1
@@ -57,62 +287,139 @@ class JobFilter:
         
         return filtered_jobs
     
-    def _passes_filters(self, job: Dict[str, Any]) -> bool:
+    def _passes_filters(self, job: Dict[str, Any], check_h1b: bool = True) -> bool:
         """
         Check if a job passes all configured filters.
         
         Args:
             job: Job listing to check
+            check_h1b: Whether to also apply the H1B sponsorship filter
             
         Returns:
             True if the job passes all filters, False otherwise
         """
-        # Apply H1B sponsorship filter if enabled
-        if self.h1b_filter_enabled:
-            company_name = job.get('company_name', '')
-            if not company_name:
-                return False
-                
-            sponsors_h1b = self.h1b_checker.check_h1b_sponsorship(company_name)
-            job['sponsors_h1b'] = sponsors_h1b  # Add this info to the job dict for later use
-            
-            if not sponsors_h1b:
-                logger.debug(f"Filtered out job at {company_name} - does not sponsor H1B")
-                return False
+        # Field, salary and keyword checks, generated for this configuration
+        if not self._predicate(job):
+            return False
+        
+        # Apply H1B sponsorship filter last: it is the only check that may hit
+        # the network, so jobs rejected by the cheap filters never reach it
+        if check_h1b and self.h1b_filter_enabled:
+            return self._passes_h1b_filter(job)
         
-        # Apply keyword filters
-        job_description = job.get('description', '').lower()
-        job_title = job.get('title', '').lower()
+        return True
+    
+    def _keyword_rejection(self, haystack: str) -> Optional[str]:
+        """
+        Check a job's text against the include and exclude keywords.
+        
+        Args:
+            haystack: Lowercased job title and description
+            
+        Returns:
+            Why the job was rejected, or None if it passes
+        """
+        if self._keyword_db is not None:
+            matched = set()
+            self._keyword_db.scan(
+                haystack.encode('utf-8'),
+                match_event_handler=lambda pattern_id, start, end, flags, context: matched.add(pattern_id),
+            )
+            for pattern_id in range(self._scan_include_count):
+                if pattern_id not in matched:
+                    return f"missing keyword '{self._scan_terms[pattern_id]}'"
+            for pattern_id in range(self._scan_include_count, len(self._scan_terms)):
+                if pattern_id in matched:
+                    return f"contains excluded keyword '{self._scan_terms[pattern_id]}'"
+            return None
         
         # Check for required keywords
-        for keyword in self.keywords:
-            if keyword.lower() not in job_description and keyword.lower() not in job_title:
-                logger.debug(f"Filtered out job: missing keyword '{keyword}'")
-                return False
+        if self._include_automaton is not None:
+            found = {index for _, (index, _) in self._include_automaton.iter(haystack)}
+            if len(found) < len(self._include_automaton):
+                missing = next(kw for kw, (index, _) in self._include_automaton.items() if index not in found)
+                return f"missing keyword '{missing}'"
+        else:
+            for keyword in self._kw_inc:
+                if keyword not in haystack:
+                    return f"missing keyword '{keyword}'"
         
         # Check for excluded keywords
-        for keyword in self.exclude_keywords:
-            if keyword.lower() in job_description or keyword.lower() in job_title:
-                logger.debug(f"Filtered out job: contains excluded keyword '{keyword}'")
-                return False
+        if self._exclude_automaton is not None:
+            for _, (_, keyword) in self._exclude_automaton.iter(haystack):
+                return f"contains excluded keyword '{keyword}'"
+        elif self._exclude_re is not None:
+            match = self._exclude_re.search(haystack)
+            if match:
+                return f"contains excluded keyword '{match.group()}'"
         
-        # Apply salary filter if available
-        if 'salary' in job and self.min_salary > 0:
-            salary = job.get('salary', 0)
-            if salary < self.min_salary:
-                logger.debug(f"Filtered out job: salary {salary} below minimum {self.min_salary}")
-                return False
+        return None
+    
+    def _passes_h1b_filter(self, job: Dict[str, Any]) -> bool:
+        """
+        Check if a job is at a company that sponsors H1B visas.
         
-        # Apply experience level filter if specified
-        if self.experience_level and 'experience_level' in job:
-            if job['experience_level'].lower() != self.experience_level.lower():
-                logger.debug(f"Filtered out job: experience level mismatch")
-                return False
+        Args:
+            job: Job listing to check
+            
+        Returns:
+            True if the company sponsors H1B visas, False otherwise
+        """
+        company_name = job.get('company_name', '')
+        if not company_name:
+            return False
+            
+        sponsors_h1b = self._sponsors_h1b(company_name)
+        job['sponsors_h1b'] = sponsors_h1b  # Add this info to the job dict for later use
         
-        # Apply job type filter if specified
-        if self.job_type and 'job_type' in job:
-            if job['job_type'].lower() != self.job_type.lower():
-                logger.debug(f"Filtered out job: job type mismatch")
-                return False
+        if not sponsors_h1b:
+            logger.debug(f"Filtered out job at {company_name} - does not sponsor H1B")
+            return False
         
         return True
+    
+    @staticmethod
+    def _company_key(company_name: str) -> str:
+        """Normalize a company name for the sponsorship cache."""
+        return company_name.strip().casefold()
+    
+    def _resolve_h1b_sponsors(self, company_names: Iterable[str]) -> None:
+        """
+        Check H1B sponsorship for every distinct, not yet cached company.
+        
+        Args:
+            company_names: Iterable of company names (duplicates allowed)
+        """
+        pending: Dict[str, str] = {}
+        for company_name in company_names:
+            if company_name:
+                key = self._company_key(company_name)
+                if key not in self._h1b_cache:
+                    pending.setdefault(key, company_name)
+        
+        checker = self.h1b_checker
+        if pending and checker is not None:
+            logger.info(f"Checking H1B sponsorship for {len(pending)} companies")
+            results = checker.check_h1b_sponsorship_batch(pending.values())
+            for key, company_name in pending.items():
+                self._h1b_cache[key] = results[company_name]
+    
+    def _sponsors_h1b(self, company_name: str) -> bool:
+        """
+        Check H1B sponsorship, memoized per company for the filter's lifetime.
+        
+        Args:
+            company_name: Name of the company
+            
+        Returns:
+            True if the company sponsors H1B visas, False otherwise
+        """
+        key = self._company_key(company_name)
+        sponsors_h1b = self._h1b_cache.get(key)
+        if sponsors_h1b is None:
+            checker = self.h1b_checker
+            if checker is None:
+                return False
+            sponsors_h1b = checker.check_h1b_sponsorship(company_name)
+            self._h1b_cache[key] = sponsors_h1b
+        return sponsors_h1b
@@ -1,7 +1,14 @@
+import asyncio
+import atexit
 import logging
 import time
 import random
-from typing import Dict, List, Any
+from concurrent.futures import Executor, ProcessPoolExecutor
+from typing import Dict, List, Any, Optional, Set
+from urllib.parse import parse_qs, urlencode, urljoin, urlparse
+
+import httpx
+from bs4 import BeautifulSoup
 from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
@@ -10,8 +17,41 @@ from selenium.common.exceptions import TimeoutException, NoSuchElementException
 
 from src.utils.human_behavior import HumanBehavior
 
+try:
+    from selectolax.parser import HTMLParser  # optional, much faster than BeautifulSoup
+except ImportError:
+    HTMLParser = None
+
 logger = logging.getLogger(__name__)
 
+# Requests blocked in the scraping browser; none of them carry job data
+BLOCKED_URL_PATTERNS = [
+    "*.png", "*.jpg", "*.jpeg", "*.gif", "*.webp", "*.svg",
+    "*.woff", "*.woff2", "*.ttf",
+    "*google-analytics.com*", "*googletagmanager.com*", "*doubleclick.net*",
+]
+
+# Search results page; query parameters are the job title and location
+SEARCH_URL = "https://www.indeed.com/jobs"
+SEARCH_PARAMS = ("q", "l")
+
+# Seconds between element checks while waiting; WebDriverWait's default of
+# 0.5s adds up to half a second of idle time to every page
+WAIT_POLL_FREQUENCY = 0.05
+
+# Concurrent HTTP connections for fetching job detail pages per search
+DESCRIPTION_CONNECTIONS = 8
+
+# Result card fields: job key -> (CSS selector, value when missing)
+CARD_FIELDS = {
+    'title': ("h2.jobTitle", "Unknown Title"),
+    'company_name': ("span.companyName", "Unknown Company"),
+    'location': ("div.companyLocation", "Unknown Location"),
+    'salary': ("div.salary-snippet-container", ""),
+    'date_posted': ("span.date", ""),
+}
+CARD_LINK_SELECTOR = "h2.jobTitle a"
+
 class IndeedScraper:
     """
     Scrapes job listings from Indeed.
@@ -33,6 +73,9 @@ class IndeedScraper:
         
         # Initialize human behavior helper
         self.human = HumanBehavior()
+        
+        # Browser session, started on first use and kept for the scraper's lifetime
+        self._driver = None
     
     def _setup_driver(self):
         """Set up the Selenium WebDriver with randomized browser fingerprint."""
@@ -40,6 +83,9 @@ class IndeedScraper:
         if self.headless:
             options.add_argument('--headless')
         
+        # Don't wait for subresources; every lookup waits for its element
+        options.page_load_strategy = 'eager'
+        
         # Randomize user agent if not explicitly set in config
         if not self.user_agent:
             user_agents = [
@@ -65,6 +111,9 @@ class IndeedScraper:
         options.add_experimental_option("excludeSwitches", ["enable-automation"])
         options.add_experimental_option('useAutomationExtension', False)
         
+        # Don't load images
+        options.add_experimental_option("prefs", {"profile.managed_default_content_settings.images": 2})
+        
         driver = webdriver.Chrome(options=options)
         
         # Execute CDP commands to prevent detection
@@ -76,9 +125,69 @@ class IndeedScraper:
             """
         })
         
+        # Block fonts, images and trackers at the network layer
+        driver.execute_cdp_cmd("Network.enable", {})
+        driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": BLOCKED_URL_PATTERNS})
+        
         driver.set_window_size(width, height)
         return driver
     
+    @staticmethod
+    def _search_url(job_title: str, location: str) -> str:
+        """
+        Build the search results URL for a job title and location.
+        
+        Args:
+            job_title: Job title to search for
+            location: Location to search in
+            
+        Returns:
+            URL with properly encoded query parameters
+        """
+        return f"{SEARCH_URL}?{urlencode(dict(zip(SEARCH_PARAMS, (job_title, location))))}"
+    
+    def _open_search_url(self, driver, search_url: str) -> bool:
+        """
+        Open a search results page directly.
+        
+        Args:
+            driver: Selenium WebDriver
+            search_url: Search results URL
+            
+        Returns:
+            True if the results loaded, False otherwise
+        """
+        try:
+            driver.get(search_url)
+            self._wait(driver).until(
+                EC.presence_of_element_located((By.CSS_SELECTOR, "ul.jobsearch-ResultsList"))
+            )
+            logger.info("Opened Indeed search results")
+            return True
+        except TimeoutException:
+            logger.warning("Indeed search results did not load from URL, using the search form")
+            return False
+    
+    def _wait(self, driver) -> WebDriverWait:
+        """Return a WebDriverWait that polls every WAIT_POLL_FREQUENCY seconds."""
+        return WebDriverWait(driver, self.timeout, poll_frequency=WAIT_POLL_FREQUENCY)
+    
+    def _get_driver(self):
+        """Return the scraper's browser session, starting it on first use."""
+        if self._driver is None:
+            self._driver = self._setup_driver()
+            atexit.register(self.close)
+        return self._driver
+    
+    def close(self):
+        """Quit the browser session if one is running."""
+        if self._driver is not None:
+            try:
+                self._driver.quit()
+            except Exception as e:
+                logger.debug(f"Error quitting browser: {e}")
+            self._driver = None
+    
     def scrape_jobs(self) -> List[Dict[str, Any]]:
         """
         Scrape job listings from Indeed.
@@ -87,27 +196,39 @@ class IndeedScraper:
             List of job dictionaries
         """
         jobs = []
+        # Keys of jobs already scraped; the same job shows up across searches
+        seen_jobs = set()
+        
+        driver = self._get_driver()
         
-        driver = self._setup_driver()
+        # Results pages are parsed in a worker process so the parse runs
+        # alongside the driver's own round-trips instead of under the GIL
+        parser_pool = ProcessPoolExecutor(max_workers=1)
         
         try:
             # Get job search parameters
             job_titles = self.job_search.get('job_titles', [])
             locations = self.job_search.get('locations', [])
             
+            # Build every search's results URL up front
+            searches = [
+                (job_title, location, self._search_url(job_title, location))
+                for job_title in job_titles
+                for location in locations
+            ]
+            
             # Search for jobs for each job title and location combination
-            for job_title in job_titles:
-                for location in locations:
-                    logger.info(f"Searching for {job_title} jobs in {location}")
-                    
-                    # Search for jobs
-                    jobs_for_search = self._search_jobs(driver, job_title, location)
-                    
-                    # Add jobs to the list
-                    jobs.extend(jobs_for_search)
-                    
-                    # Add random delay between searches
-                    HumanBehavior.random_delay(2.0, 5.0)
+            for job_title, location, search_url in searches:
+                logger.info(f"Searching for {job_title} jobs in {location}")
+                
+                # Search for jobs
+                jobs_for_search = self._search_jobs(driver, job_title, location, parser_pool, seen_jobs, search_url=search_url)
+                
+                # Add jobs to the list
+                jobs.extend(jobs_for_search)
+                
+                # Add random delay between searches
+                HumanBehavior.random_delay(2.0, 5.0)
             
             logger.info(f"Scraped {len(jobs)} jobs from Indeed")
             
@@ -115,11 +236,13 @@ class IndeedScraper:
             logger.error(f"Error scraping Indeed jobs: {e}")
         
         finally:
-            driver.quit()
+            parser_pool.shutdown()
         
         return jobs
     
-    def _search_jobs(self, driver, job_title: str, location: str) -> List[Dict[str, Any]]:
+    def _search_jobs(self, driver, job_title: str, location: str, parser_pool: Optional[Executor] = None,
+                     seen_jobs: Optional[Set] = None,
+                     search_url: Optional[str] = None) -> List[Dict[str, Any]]:
         """
         Search for jobs on Indeed.
         
@@ -127,6 +250,11 @@ class IndeedScraper:
             driver: Selenium WebDriver
             job_title: Job title to search for
             location: Location to search in
+            parser_pool: Executor to parse the results page in (parsed inline if None)
+            seen_jobs: Keys of jobs already scraped; duplicates are dropped before
+                their details are fetched, and new keys are added
+            search_url: Results page to open directly; the search form is used
+                if it is None or the results don't load
             
         Returns:
             List of job dictionaries
@@ -134,36 +262,38 @@ class IndeedScraper:
         jobs = []
         
         try:
-            # Navigate to Indeed
-            driver.get("https://www.indeed.com/")
-            logger.info("Navigated to Indeed")
-            
-            # Wait for the search form to load
-            WebDriverWait(driver, self.timeout).until(
-                EC.presence_of_element_located((By.ID, "text-input-what"))
-            )
-            
-            # Enter job title with human-like typing
-            job_title_field = driver.find_element(By.ID, "text-input-what")
-            HumanBehavior.human_like_typing(job_title_field, job_title)
-            
-            # Pause briefly like a human would after entering job title
-            HumanBehavior.random_delay(0.8, 1.5)
-            
-            # Enter location with human-like typing
-            location_field = driver.find_element(By.ID, "text-input-where")
-            location_field.clear()
-            HumanBehavior.human_like_typing(location_field, location)
-            
-            # Random delay before clicking search to simulate human thinking
-            HumanBehavior.random_delay(0.5, 1.5)
-            
-            # Find and click the search button with human-like movement
-            search_button = driver.find_element(By.CSS_SELECTOR, "button[type='submit']")
-            HumanBehavior.human_like_click(driver, search_button)
-            
+            # Open the results page directly, falling back to the search form
+            if not (search_url and self._open_search_url(driver, search_url)):
+                # Navigate to Indeed
+                driver.get("https://www.indeed.com/")
+                logger.info("Navigated to Indeed")
+                
+                # Wait for the search form to load
+                self._wait(driver).until(
+                    EC.presence_of_element_located((By.ID, "text-input-what"))
+                )
+                
+                # Enter job title with human-like typing
+                job_title_field = driver.find_element(By.ID, "text-input-what")
+                HumanBehavior.human_like_typing(job_title_field, job_title, fast_mode=self.browser_config.get('fast_typing', False))
+                
+                # Pause briefly like a human would after entering job title
+                HumanBehavior.random_delay(0.8, 1.5)
+                
+                # Enter location with human-like typing
+                location_field = driver.find_element(By.ID, "text-input-where")
+                location_field.clear()
+                HumanBehavior.human_like_typing(location_field, location, fast_mode=self.browser_config.get('fast_typing', False))
+                
+                # Random delay before clicking search to simulate human thinking
+                HumanBehavior.random_delay(0.5, 1.5)
+                
+                # Find and click the search button with human-like movement
+                search_button = driver.find_element(By.CSS_SELECTOR, "button[type='submit']")
+                HumanBehavior.human_like_click(driver, search_button)
+                
             # Wait for search results to load
-            WebDriverWait(driver, self.timeout).until(
+            self._wait(driver).until(
                 EC.presence_of_element_located((By.CSS_SELECTOR, "ul.jobsearch-ResultsList"))
             )
             
@@ -176,25 +306,71 @@ class IndeedScraper:
             # Scroll through results to load more jobs
             self._scroll_through_results(driver)
             
+            # Read the card fields for all listings from one page snapshot,
+            # parsed in the worker while the driver looks up the card elements
+            page_source, page_url = driver.page_source, driver.current_url
+            parse_future = parser_pool.submit(self._parse_job_cards, page_source, page_url) if parser_pool else None
+            
             # Extract job listings
             job_listings = driver.find_elements(By.CSS_SELECTOR, "div.job_seen_beacon")
             logger.info(f"Found {len(job_listings)} job listings")
             
-            # Process each job listing
-            for job_listing in job_listings:
-                try:
-                    # Extract job information
-                    job = self._extract_job_info(driver, job_listing)
-                    
-                    # Add source information
+            try:
+                parsed_cards = parse_future.result() if parse_future else self._parse_job_cards(page_source, page_url)
+            except Exception as e:
+                logger.warning(f"Could not parse job cards from page source: {e}")
+                parsed_cards = []
+            
+            # Fall back to per-element lookups if the snapshot disagrees with
+            # the live DOM
+            if len(parsed_cards) == len(job_listings):
+                cards = list(zip(parsed_cards, job_listings))
+                for job, _ in cards:
                     job['source'] = 'Indeed'
-                    
-                    # Add job to the list
-                    jobs.append(job)
-                    
-                except Exception as e:
-                    logger.error(f"Error extracting job info: {e}")
-                    continue
+            else:
+                cards = []
+                for job_listing in job_listings:
+                    try:
+                        # Extract job information
+                        job = self._extract_job_info(driver, job_listing, open_details=False)
+                        
+                        # Add source information
+                        job['source'] = 'Indeed'
+                        
+                        cards.append((job, job_listing))
+                        
+                    except Exception as e:
+                        logger.error(f"Error extracting job info: {e}")
+                        continue
+            
+            # Drop jobs already scraped by an earlier search before paying for
+            # their details
+            if seen_jobs is not None:
+                unique_cards = []
+                for job, job_listing in cards:
+                    key = self._job_key(job)
+                    if key not in seen_jobs:
+                        seen_jobs.add(key)
+                        unique_cards.append((job, job_listing))
+                if len(unique_cards) < len(cards):
+                    logger.info(f"Skipped {len(cards) - len(unique_cards)} duplicate job listings")
+                cards = unique_cards
+            
+            # Fetch the detail pages concurrently; only those that could not be
+            # fetched are opened in the browser
+            self._fetch_job_details(driver, [job for job, _ in cards])
+            
+            for job, job_listing in cards:
+                if 'description' not in job:
+                    try:
+                        self._open_job_details(driver, job_listing, job)
+                    except Exception as e:
+                        logger.error(f"Error extracting job details: {e}")
+                        job['description'] = ""
+                        job['easy_apply'] = False
+                
+                # Add job to the list
+                jobs.append(job)
             
             logger.info(f"Extracted {len(jobs)} jobs from search results")
             
@@ -213,7 +389,7 @@ class IndeedScraper:
         try:
             # Apply date posted filter (Last 7 days)
             try:
-                date_filter_button = WebDriverWait(driver, self.timeout).until(
+                date_filter_button = self._wait(driver).until(
                     EC.element_to_be_clickable((By.XPATH, "//button[contains(text(), 'Date posted')]"))
                 )
                 HumanBehavior.human_like_click(driver, date_filter_button)
@@ -222,7 +398,7 @@ class IndeedScraper:
                 HumanBehavior.random_delay(0.5, 1.0)
                 
                 # Click on "Last 7 days" option
-                last_7_days_option = WebDriverWait(driver, self.timeout).until(
+                last_7_days_option = self._wait(driver).until(
                     EC.element_to_be_clickable((By.XPATH, "//span[contains(text(), 'Last 7 days')]"))
                 )
                 HumanBehavior.human_like_click(driver, last_7_days_option)
@@ -234,7 +410,7 @@ class IndeedScraper:
             
             # Apply job type filter (Full-time)
             try:
-                job_type_button = WebDriverWait(driver, self.timeout).until(
+                job_type_button = self._wait(driver).until(
                     EC.element_to_be_clickable((By.XPATH, "//button[contains(text(), 'Job type')]"))
                 )
                 HumanBehavior.human_like_click(driver, job_type_button)
@@ -243,13 +419,13 @@ class IndeedScraper:
                 HumanBehavior.random_delay(0.5, 1.0)
                 
                 # Click on "Full-time" option
-                full_time_option = WebDriverWait(driver, self.timeout).until(
+                full_time_option = self._wait(driver).until(
                     EC.element_to_be_clickable((By.XPATH, "//span[contains(text(), 'Full-time')]"))
                 )
                 HumanBehavior.human_like_click(driver, full_time_option)
                 
                 # Click on "Apply" button
-                apply_button = WebDriverWait(driver, self.timeout).until(
+                apply_button = self._wait(driver).until(
                     EC.element_to_be_clickable((By.XPATH, "//button[contains(text(), 'Apply')]"))
                 )
                 HumanBehavior.human_like_click(driver, apply_button)
@@ -261,7 +437,7 @@ class IndeedScraper:
             
             # Apply salary filter ($60,000+)
             try:
-                salary_button = WebDriverWait(driver, self.timeout).until(
+                salary_button = self._wait(driver).until(
                     EC.element_to_be_clickable((By.XPATH, "//button[contains(text(), 'Salary')]"))
                 )
                 HumanBehavior.human_like_click(driver, salary_button)
@@ -270,13 +446,13 @@ class IndeedScraper:
                 HumanBehavior.random_delay(0.5, 1.0)
                 
                 # Click on "$60,000+" option
-                salary_option = WebDriverWait(driver, self.timeout).until(
+                salary_option = self._wait(driver).until(
                     EC.element_to_be_clickable((By.XPATH, "//span[contains(text(), '$60,000+')]"))
                 )
                 HumanBehavior.human_like_click(driver, salary_option)
                 
                 # Click on "Apply" button
-                apply_button = WebDriverWait(driver, self.timeout).until(
+                apply_button = self._wait(driver).until(
                     EC.element_to_be_clickable((By.XPATH, "//button[contains(text(), 'Apply')]"))
                 )
                 HumanBehavior.human_like_click(driver, apply_button)
@@ -288,7 +464,7 @@ class IndeedScraper:
             
             # Apply experience level filter (Entry level)
             try:
-                experience_button = WebDriverWait(driver, self.timeout).until(
+                experience_button = self._wait(driver).until(
                     EC.element_to_be_clickable((By.XPATH, "//button[contains(text(), 'Experience level')]"))
                 )
                 HumanBehavior.human_like_click(driver, experience_button)
@@ -297,13 +473,13 @@ class IndeedScraper:
                 HumanBehavior.random_delay(0.5, 1.0)
                 
                 # Click on "Entry level" option
-                entry_level_option = WebDriverWait(driver, self.timeout).until(
+                entry_level_option = self._wait(driver).until(
                     EC.element_to_be_clickable((By.XPATH, "//span[contains(text(), 'Entry level')]"))
                 )
                 HumanBehavior.human_like_click(driver, entry_level_option)
                 
                 # Click on "Apply" button
-                apply_button = WebDriverWait(driver, self.timeout).until(
+                apply_button = self._wait(driver).until(
                     EC.element_to_be_clickable((By.XPATH, "//button[contains(text(), 'Apply')]"))
                 )
                 HumanBehavior.human_like_click(driver, apply_button)
@@ -335,13 +511,220 @@ class IndeedScraper:
         except Exception as e:
             logger.error(f"Error scrolling through results: {e}")
     
-    def _extract_job_info(self, driver, job_listing) -> Dict[str, Any]:
+    @staticmethod
+    def _job_key(job: Dict[str, Any]):
+        """
+        Identify a job across searches.
+        
+        Indeed job links carry tracking parameters that vary between searches,
+        so the job key ('jk' parameter) is used when present.
+        
+        Args:
+            job: Job dictionary
+            
+        Returns:
+            Hashable key for the job
+        """
+        url = job.get('url', '')
+        if url:
+            job_key = parse_qs(urlparse(url).query).get('jk')
+            return job_key[0] if job_key else url
+        return (job.get('company_name', '').lower(), job.get('title', '').lower())
+    
+    @staticmethod
+    def _parse_job_cards(page_source: str, base_url: str) -> List[Dict[str, Any]]:
+        """
+        Extract the card fields of every job listing from the page HTML.
+        
+        Parsing the page once replaces a WebDriver round-trip per field per
+        card.
+        
+        Args:
+            page_source: Search results page HTML
+            base_url: URL of the page, for resolving relative job links
+            
+        Returns:
+            Job dictionaries in page order
+        """
+        jobs = []
+        
+        if HTMLParser is not None:
+            for card in HTMLParser(page_source).css("div.job_seen_beacon"):
+                job = {}
+                for key, (selector, default) in CARD_FIELDS.items():
+                    node = card.css_first(selector)
+                    job[key] = node.text(separator=" ", strip=True) if node is not None else default
+                link = card.css_first(CARD_LINK_SELECTOR)
+                href = link.attributes.get("href") if link is not None else None
+                job['url'] = urljoin(base_url, href) if href else ""
+                job['sponsors_h1b'] = False
+                jobs.append(job)
+            return jobs
+        
+        soup = BeautifulSoup(page_source, 'lxml')
+        for card in soup.select("div.job_seen_beacon"):
+            job = {}
+            for key, (selector, default) in CARD_FIELDS.items():
+                element = card.select_one(selector)
+                job[key] = element.get_text(" ", strip=True) if element is not None else default
+            link = card.select_one(CARD_LINK_SELECTOR)
+            href = link.get("href") if link is not None else None
+            job['url'] = urljoin(base_url, href) if href else ""
+            job['sponsors_h1b'] = False
+            jobs.append(job)
+        return jobs
+    
+    def _fetch_job_details(self, driver, jobs: List[Dict[str, Any]]):
+        """
+        Fetch job descriptions concurrently over HTTP.
+        
+        The browser's cookies are reused so the requests look like the same
+        visitor. Jobs whose page could not be fetched are left without a
+        'description' key.
+        
+        Args:
+            driver: Selenium WebDriver
+            jobs: Job dictionaries to update in place
+        """
+        targets = [job for job in jobs if job.get('url')]
+        if not targets:
+            return
+        
+        # A failure here leaves the cards without descriptions rather than
+        # losing every card collected for the search
+        try:
+            cookies = {cookie['name']: cookie['value'] for cookie in driver.get_cookies()}
+            details = asyncio.run(self._fetch_all_details([job['url'] for job in targets], cookies))
+        except Exception as e:
+            logger.warning(f"Could not fetch Indeed job pages: {e}")
+            return
+        
+        for job, detail in zip(targets, details):
+            if detail:
+                job.update(detail)
+        
+        fetched = sum(1 for job in targets if 'description' in job)
+        logger.info(f"Fetched {fetched}/{len(targets)} job descriptions over HTTP")
+    
+    async def _fetch_all_details(self, urls: List[str], cookies: Dict[str, str]) -> List[Optional[Dict[str, Any]]]:
+        """
+        Fetch and parse several job detail pages on one async HTTP client.
+        
+        Args:
+            urls: Job URLs
+            cookies: Cookies to send with every request
+            
+        Returns:
+            Parsed details (or None) for each URL, in order
+        """
+        client_kwargs = {
+            'headers': {'User-Agent': self.user_agent},
+            'cookies': cookies,
+            'limits': httpx.Limits(max_connections=DESCRIPTION_CONNECTIONS),
+            'timeout': self.timeout,
+            'follow_redirects': True,
+        }
+        try:
+            client = httpx.AsyncClient(http2=True, **client_kwargs)
+        except ImportError:
+            # HTTP/2 needs the optional h2 package
+            client = httpx.AsyncClient(**client_kwargs)
+        
+        async with client:
+            return await asyncio.gather(*(self._fetch_job_detail(client, url) for url in urls))
+    
+    async def _fetch_job_detail(self, client: httpx.AsyncClient, url: str) -> Optional[Dict[str, Any]]:
+        """
+        Fetch a job's detail page and extract its description.
+        
+        Args:
+            client: Async HTTP client
+            url: Job URL
+            
+        Returns:
+            Dictionary with 'description' and 'easy_apply', or None if the page
+            could not be fetched or has no description (e.g. a CAPTCHA page)
+        """
+        try:
+            response = await client.get(url)
+            if response.status_code != 200:
+                return None
+            return self._parse_job_detail(response.text)
+        except Exception as e:
+            logger.debug(f"Could not fetch job details from {url}: {e}")
+            return None
+    
+    @staticmethod
+    def _parse_job_detail(html: str) -> Optional[Dict[str, Any]]:
+        """
+        Extract the description and Easy Apply flag from a job detail page.
+        
+        Args:
+            html: Page HTML
+            
+        Returns:
+            Dictionary with 'description' and 'easy_apply', or None if the page
+            has no job description
+        """
+        if HTMLParser is not None:
+            tree = HTMLParser(html)
+            description_node = tree.css_first("#jobDescriptionText")
+            if description_node is None:
+                return None
+            return {
+                'description': description_node.text(separator="\n", strip=True),
+                'easy_apply': tree.css_first("#indeedApplyButton") is not None,
+            }
+        
+        soup = BeautifulSoup(html, 'lxml')
+        description_element = soup.find(id="jobDescriptionText")
+        if description_element is None:
+            return None
+        
+        return {
+            'description': description_element.get_text("\n", strip=True),
+            'easy_apply': soup.find(id="indeedApplyButton") is not None,
+        }
+    
+    def _open_job_details(self, driver, job_listing, job: Dict[str, Any]):
+        """
+        Click a job listing and read its description from the details pane.
+        
+        Args:
+            driver: Selenium WebDriver
+            job_listing: Job listing element
+            job: Job dictionary to update in place
+        """
+        # Click on job listing to view details
+        HumanBehavior.human_like_click(driver, job_listing)
+        
+        # Wait for job details to load
+        self._wait(driver).until(
+            EC.presence_of_element_located((By.ID, "jobDescriptionText"))
+        )
+        
+        # Extract job description
+        try:
+            description_element = driver.find_element(By.ID, "jobDescriptionText")
+            job['description'] = description_element.text.strip()
+        except NoSuchElementException:
+            job['description'] = ""
+        
+        # Check if job has Easy Apply
+        try:
+            apply_button = driver.find_element(By.CSS_SELECTOR, "button#indeedApplyButton")
+            job['easy_apply'] = True
+        except NoSuchElementException:
+            job['easy_apply'] = False
+    
+    def _extract_job_info(self, driver, job_listing, open_details: bool = True) -> Dict[str, Any]:
         """
         Extract job information from a job listing.
         
         Args:
             driver: Selenium WebDriver
             job_listing: Job listing element
+            open_details: Whether to click the listing and read its description
             
         Returns:
             Job dictionary
@@ -391,27 +774,8 @@ class IndeedScraper:
             except NoSuchElementException:
                 job['date_posted'] = ""
             
-            # Click on job listing to view details
-            HumanBehavior.human_like_click(driver, job_listing)
-            
-            # Wait for job details to load
-            WebDriverWait(driver, self.timeout).until(
-                EC.presence_of_element_located((By.ID, "jobDescriptionText"))
-            )
-            
-            # Extract job description
-            try:
-                description_element = driver.find_element(By.ID, "jobDescriptionText")
-                job['description'] = description_element.text.strip()
-            except NoSuchElementException:
-                job['description'] = ""
-            
-            # Check if job has Easy Apply
-            try:
-                apply_button = driver.find_element(By.CSS_SELECTOR, "button#indeedApplyButton")
-                job['easy_apply'] = True
-            except NoSuchElementException:
-                job['easy_apply'] = False
+            if open_details:
+                self._open_job_details(driver, job_listing, job)
             
             # Set default H1B sponsorship to False (will be checked later)
             job['sponsors_h1b'] = False
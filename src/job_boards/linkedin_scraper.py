@@ -1,20 +1,261 @@
+import asyncio
+import atexit
+import hashlib
+import json
 import logging
+import os
+import queue
+import shelve
+import threading
 import time
 import random
 import re
-from typing import Dict, List, Any
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date
+from typing import Dict, List, Any, Optional
+from urllib.parse import urlencode
+
+import httpx
+from bs4 import BeautifulSoup
 from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.common.exceptions import TimeoutException, NoSuchElementException, ElementClickInterceptedException
+from selenium.common.exceptions import TimeoutException, ElementClickInterceptedException
 from selenium.webdriver.common.keys import Keys
 from selenium.webdriver.common.action_chains import ActionChains
 
 from src.utils.human_behavior import HumanBehavior
 
+try:
+    from selectolax.parser import HTMLParser  # optional, much faster than BeautifulSoup
+except ImportError:
+    HTMLParser = None
+
 logger = logging.getLogger(__name__)
 
+# Requests blocked in the scraping browser; none of them carry job data
+BLOCKED_URL_PATTERNS = [
+    "*.png", "*.jpg", "*.jpeg", "*.gif", "*.webp", "*.svg",
+    "*.woff", "*.woff2", "*.ttf",
+    "*.mp4", "*.webm",
+    "*google-analytics.com*", "*googletagmanager.com*", "*doubleclick.net*",
+    # LinkedIn's own tracking beacons
+    "*/li/track*",
+]
+
+# User agents to pick from when BROWSER["user_agent"] is not set
+USER_AGENTS = [
+    "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36",
+    "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.114 Safari/537.36",
+    "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36 Edg/91.0.864.59",
+    "Mozilla/5.0 (Windows NT 10.0; Win64; x64; rv:89.0) Gecko/20100101 Firefox/89.0"
+]
+
+# Chrome switches shared by every scraping browser; the last two hide the
+# automation flag from navigator.webdriver checks and skip image decoding
+# for anything the blocked URLs miss
+DRIVER_ARGUMENTS = (
+    '--disable-gpu',
+    '--no-sandbox',
+    '--disable-dev-shm-usage',
+    '--disable-blink-features=AutomationControlled',
+    '--blink-settings=imagesEnabled=false',
+)
+
+# Chrome preferences shared by every scraping browser
+DRIVER_PREFS = {
+    "download.default_directory": "data_folder",
+    "download.prompt_for_download": False,
+    "download.directory_upgrade": True,
+    "safebrowsing.enabled": True,
+    # Disable saving passwords
+    "credentials_enable_service": False,
+    "profile.password_manager_enabled": False,
+    # Don't load images
+    "profile.managed_default_content_settings.images": 2
+}
+
+# Runs before every page's own scripts to hide the WebDriver flag
+STEALTH_JS = "Object.defineProperty(navigator, 'webdriver', {get: () => undefined})"
+
+# Search results page; query parameters are the job title and location
+SEARCH_URL = "https://www.linkedin.com/jobs/search/"
+SEARCH_PARAMS = ("keywords", "location")
+
+# Query parameters for the filters _apply_advanced_filters would otherwise
+# click through: most recent first, past week, internship/entry/associate,
+# internship/full-time, on-site/remote/hybrid, Easy Apply, $60,000+
+SEARCH_FILTER_PARAMS = (
+    ("sortBy", "DD"),
+    ("f_TPR", "r604800"),
+    ("f_E", "1,2,3"),
+    ("f_JT", "I,F"),
+    ("f_WT", "1,2,3"),
+    ("f_AL", "true"),
+    ("f_SB2", "2"),
+)
+
+# Logged-in browsers running searches in parallel, unless
+# LINKEDIN["search_workers"] says otherwise
+DEFAULT_SEARCH_WORKERS = 4
+
+# Extracts all fields of the open job's details pane in one call
+JOB_DETAILS_JS = """
+const text = (selector) => {
+    const element = document.querySelector(selector);
+    return element ? element.innerText.trim() : null;
+};
+return {
+    title: text('h2.jobs-details-top-card__job-title'),
+    company_name: text('a.jobs-details-top-card__company-url') ?? text('span.jobs-details-top-card__company-name'),
+    location: text('span.jobs-details-top-card__bullet'),
+    url: window.location.href,
+    description: text('div.jobs-description-content__text'),
+    easy_apply: document.querySelector("button[data-control-name='jobdetails_topcard_inapply']") !== null,
+    salary: text('span.jobs-details-top-card__salary-info'),
+    date_posted: text('span.jobs-details-top-card__posted-date'),
+    applicants: text('span.jobs-details-top-card__applicant-count'),
+};
+"""
+
+# Result card fields: job key -> CSS selector (logged-in and guest layouts)
+CARD_FIELDS = {
+    'title': "a.job-card-list__title, h3.base-search-card__title",
+    'company_name': "span.job-card-container__primary-description, a.job-card-container__company-name, h4.base-search-card__subtitle",
+    'location': "li.job-card-container__metadata-item, span.job-search-card__location",
+    'date_posted': "time",
+}
+CARD_LINK_SELECTOR = "a[href*='/jobs/view/']"
+JOB_ID_RE = re.compile(r"/jobs/view/(?:[^/?#]*-)?(\d+)")
+JOB_VIEW_URL = "https://www.linkedin.com/jobs/view/{}/"
+
+# Public job page fields: job key -> CSS selector. The page is served as
+# static HTML to signed-out visitors, so it can be fetched without a browser
+DETAIL_PAGE_FIELDS = {
+    'title': "h1.top-card-layout__title",
+    'company_name': "a.topcard__org-name-link",
+    'location': "span.topcard__flavor--bullet",
+    'description': "div.show-more-less-html__markup",
+    'salary': "div.compensation__salary",
+    'date_posted': "span.posted-time-ago__text",
+    'applicants': "span.num-applicants__caption, figcaption.num-applicants__caption",
+}
+# Apply buttons on the public job page; Easy Apply jobs say so on the button
+DETAIL_PAGE_APPLY_SELECTOR = "div.top-card-layout__cta-container"
+
+# Concurrent HTTP connections for fetching job pages per search
+DETAIL_CONNECTIONS = 5
+
+# Values for details-pane fields whose element is missing
+JOB_DETAIL_DEFAULTS = {
+    'title': "Unknown Title",
+    'company_name': "Unknown Company",
+    'location': "Unknown Location",
+    'url': "",
+    'description': "",
+    'easy_apply': False,
+    'salary': "",
+    'date_posted': "",
+    'applicants': "",
+}
+
+# Seconds between element checks while waiting; WebDriverWait's default of
+# 0.5s adds up to half a second of idle time to every page
+WAIT_POLL_FREQUENCY = 0.05
+
+# Seconds to wait for the UI change a click should cause (a checkbox
+# ticking, a dropdown closing) before moving on anyway
+SETTLE_TIMEOUT = 5
+
+# Result list items on a search results page
+RESULT_ITEM_SELECTOR = "li.jobs-search-results__list-item"
+
+# Scrolls through the results list at most, and seconds to wait after each
+# for more results to load
+MAX_RESULT_SCROLLS = 10
+SCROLL_LOAD_TIMEOUT = 3
+
+# Scrolling stops once this many scrolls in a row load nothing new, or once
+# a full page of results (25 on LinkedIn) has loaded
+SCROLL_STABLE_LIMIT = 2
+RESULT_PAGE_SIZE = 25
+
+# Element locators, as (By, selector) pairs for find_element(*LOC) and
+# expected conditions
+
+# Login page
+LOC_USERNAME_INPUT = (By.ID, "username")
+LOC_PASSWORD_INPUT = (By.ID, "password")
+LOC_SIGN_IN_BUTTON = (By.CSS_SELECTOR, "button[type='submit']")
+LOC_GLOBAL_NAV = (By.ID, "global-nav")
+
+# Search form and results
+LOC_TITLE_INPUT = (By.CSS_SELECTOR, "input[aria-label='Search by title, skill, or company']")
+LOC_LOCATION_INPUT = (By.CSS_SELECTOR, "input[aria-label='City, state, or zip code']")
+LOC_SEARCH_BUTTON = (By.CSS_SELECTOR, "button[data-tracking-control-name='public_jobs_jobs-search-bar_base-search-button']")
+LOC_RESULTS_LIST = (By.CSS_SELECTOR, "ul.jobs-search__results-list")
+LOC_RESULT_ITEM = (By.CSS_SELECTOR, RESULT_ITEM_SELECTOR)
+LOC_JOB_DETAILS = (By.CSS_SELECTOR, "div.jobs-details")
+
+# Sort dropdown and All filters modal
+LOC_SORT_DROPDOWN = (By.CSS_SELECTOR, "button.artdeco-dropdown__trigger--placement-bottom")
+LOC_MOST_RECENT_OPTION = (By.XPATH, "//span[text()='Most recent']")
+LOC_ALL_FILTERS_BUTTON = (By.XPATH, "//button[contains(text(), 'All filters')]")
+LOC_ADVANCED_FILTERS = (By.CSS_SELECTOR, "div.jobs-search-box__advanced-filters")
+LOC_DATE_POSTED_SECTION = (By.XPATH, "//h3[text()='Date posted']/ancestor::section")
+LOC_EXPERIENCE_SECTION = (By.XPATH, "//h3[text()='Experience level']/ancestor::section")
+LOC_JOB_TYPE_SECTION = (By.XPATH, "//h3[text()='Job type']/ancestor::section")
+LOC_WORKPLACE_SECTION = (By.XPATH, "//h3[text()='On-site/remote']/ancestor::section")
+LOC_EASY_APPLY_SECTION = (By.XPATH, "//h3[text()='Easy Apply']/ancestor::section")
+LOC_SALARY_SECTION = (By.XPATH, "//h3[text()='Salary']/ancestor::section")
+LOC_FEATURES_SECTION = (By.XPATH, "//h3[text()='LinkedIn features']/ancestor::section")
+
+# Options within a modal section
+LOC_PAST_WEEK_LABEL = (By.XPATH, ".//label[contains(text(), 'Past week')]")
+LOC_ENTRY_LEVEL_LABEL = (By.XPATH, ".//label[contains(text(), 'Entry level')]")
+LOC_ASSOCIATE_LABEL = (By.XPATH, ".//label[contains(text(), 'Associate')]")
+LOC_INTERNSHIP_LABEL = (By.XPATH, ".//label[contains(text(), 'Internship')]")
+LOC_FULL_TIME_LABEL = (By.XPATH, ".//label[contains(text(), 'Full-time')]")
+LOC_ON_SITE_LABEL = (By.XPATH, ".//label[contains(text(), 'On-site')]")
+LOC_REMOTE_LABEL = (By.XPATH, ".//label[contains(text(), 'Remote')]")
+LOC_HYBRID_LABEL = (By.XPATH, ".//label[contains(text(), 'Hybrid')]")
+LOC_EASY_APPLY_LABEL = (By.XPATH, ".//label[contains(text(), 'Easy Apply')]")
+LOC_MIN_SALARY_INPUT = (By.CSS_SELECTOR, "input[aria-label='Minimum salary']")
+LOC_VERIFICATIONS_LABEL = (By.XPATH, ".//label[contains(text(), 'Has verifications')]")
+LOC_SHOW_RESULTS_BUTTON = (By.XPATH, "//button[contains(text(), 'Show results')]")
+
+# Filter bar buttons and dropdown options, used when the modal won't open
+LOC_EASY_APPLY_BUTTON = (By.XPATH, "//button[contains(text(), 'Easy Apply')]")
+LOC_DATE_POSTED_BUTTON = (By.XPATH, "//button[contains(text(), 'Date posted')]")
+LOC_PAST_WEEK_OPTION = (By.XPATH, "//span[contains(text(), 'Past week')]")
+LOC_EXPERIENCE_BUTTON = (By.XPATH, "//button[contains(text(), 'Experience level')]")
+LOC_ENTRY_LEVEL_OPTION = (By.XPATH, "//span[contains(text(), 'Entry level')]")
+LOC_ASSOCIATE_OPTION = (By.XPATH, "//span[contains(text(), 'Associate')]")
+LOC_INTERNSHIP_OPTION = (By.XPATH, "//span[contains(text(), 'Internship')]")
+
+# On-disk cache of search results, keyed by a hash of the search and the day,
+# so a rerun within SEARCH_CACHE_TTL seconds skips the browser entirely
+SEARCH_CACHE_PATH = "data_folder/.linkedin_search_cache"
+SEARCH_CACHE_TTL = 12 * 60 * 60
+
+# Chrome profiles kept between runs so the LinkedIn session survives, one
+# subdirectory per browser since Chrome locks a profile while it is open;
+# LINKEDIN["profile_dir"] overrides the location
+DEFAULT_PROFILE_DIR = "data_folder/.linkedin_profiles"
+
+# Seconds to wait for the signed-in nav bar before logging in with credentials
+LOGGED_IN_CHECK_TIMEOUT = 3
+
+# Session cookies saved after a login, restored when a browser profile has
+# lost its session; readable by the owner only
+SESSION_COOKIES_PATH = "data_folder/.linkedin_cookies.json"
+
+# Seconds to wait for the user to complete a security verification, and
+# seconds between checks of whether they have
+VERIFICATION_TIMEOUT = 120
+VERIFICATION_POLL_INTERVAL = 0.5
+
 class LinkedInScraper:
     """
     Scrapes job listings from LinkedIn.
@@ -37,67 +278,251 @@ class LinkedInScraper:
         # LinkedIn credentials
         self.linkedin_username = config.get('LINKEDIN', {}).get('username', '')
         self.linkedin_password = config.get('LINKEDIN', {}).get('password', '')
+        self.search_workers = max(1, config.get('LINKEDIN', {}).get('search_workers', DEFAULT_SEARCH_WORKERS))
+        self.force_refresh = config.get('LINKEDIN', {}).get('force_refresh', False)
+        self.profile_dir = config.get('LINKEDIN', {}).get('profile_dir', DEFAULT_PROFILE_DIR)
         
         # Initialize human behavior helper
         self.human = HumanBehavior()
+        
+        # Logged-in browser sessions, started on first use and kept for the
+        # scraper's lifetime
+        self._drivers = []
+        
+        # URLs of jobs already scraped by this run's searches, shared by the
+        # pool workers so a job is only extracted once
+        self._seen_urls = set()
+        self._seen_urls_lock = threading.Lock()
     
-    def _setup_driver(self):
-        """Set up the Selenium WebDriver with randomized browser fingerprint."""
+    def _build_options(self, worker: int = 0) -> webdriver.ChromeOptions:
+        """
+        Build the Chrome options for a scraping browser.
+        
+        ChromeOptions objects are single-use, so a fresh one is built from the
+        module-level switches and preferences for every browser.
+        
+        Args:
+            worker: Index of the browser in the pool, which picks its profile
+            
+        Returns:
+            Chrome options
+        """
         options = webdriver.ChromeOptions()
         if self.headless:
             options.add_argument('--headless')
         
-        # Randomize user agent if not explicitly set in config
-        if not self.user_agent:
-            user_agents = [
-                "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36",
-                "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.114 Safari/537.36",
-                "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36 Edg/91.0.864.59",
-                "Mozilla/5.0 (Windows NT 10.0; Win64; x64; rv:89.0) Gecko/20100101 Firefox/89.0"
-            ]
-            self.user_agent = random.choice(user_agents)
+        # Persistent profile so a previous run's login is reused
+        profile_path = os.path.abspath(os.path.join(self.profile_dir, f"worker-{worker}"))
+        os.makedirs(profile_path, exist_ok=True)
+        options.add_argument(f'--user-data-dir={profile_path}')
+        options.add_argument('--profile-directory=Default')
         
-        options.add_argument(f'user-agent={self.user_agent}')
+        # Don't wait for subresources; every lookup waits for its element
+        options.page_load_strategy = 'eager'
         
-        # Add randomized window dimensions to vary fingerprint
-        width = random.randint(1200, 1920)
-        height = random.randint(800, 1080)
+        # Randomize user agent if not explicitly set in config; every browser
+        # in the pool then shares it
+        if not self.user_agent:
+            self.user_agent = random.choice(USER_AGENTS)
+        options.add_argument(f'user-agent={self.user_agent}')
         
-        options.add_argument('--disable-gpu')
-        options.add_argument('--no-sandbox')
-        options.add_argument('--disable-dev-shm-usage')
+        for argument in DRIVER_ARGUMENTS:
+            options.add_argument(argument)
         
         # Disable automation flags to avoid detection
-        options.add_argument("--disable-blink-features=AutomationControlled")
         options.add_experimental_option("excludeSwitches", ["enable-automation"])
         options.add_experimental_option('useAutomationExtension', False)
+        options.add_experimental_option("prefs", DRIVER_PREFS)
         
-        # Add preferences to handle downloads and file uploads
-        prefs = {
-            "download.default_directory": "data_folder",
-            "download.prompt_for_download": False,
-            "download.directory_upgrade": True,
-            "safebrowsing.enabled": True,
-            # Disable saving passwords
-            "credentials_enable_service": False,
-            "profile.password_manager_enabled": False
-        }
-        options.add_experimental_option("prefs", prefs)
+        return options
+    
+    def _setup_driver(self, worker: int = 0):
+        """
+        Set up the Selenium WebDriver with randomized browser fingerprint.
         
-        driver = webdriver.Chrome(options=options)
+        Args:
+            worker: Index of the browser in the pool, which picks its profile
+        """
+        driver = webdriver.Chrome(options=self._build_options(worker))
+        
+        # Every lookup that may miss uses find_elements or an explicit wait,
+        # so an implicit wait would only slow misses down
+        driver.implicitly_wait(0)
         
         # Execute CDP commands to prevent detection
-        driver.execute_cdp_cmd("Page.addScriptToEvaluateOnNewDocument", {
-            "source": """
-                Object.defineProperty(navigator, 'webdriver', {
-                    get: () => undefined
-                })
-            """
-        })
-        
-        driver.set_window_size(width, height)
+        driver.execute_cdp_cmd("Page.addScriptToEvaluateOnNewDocument", {"source": STEALTH_JS})
+        
+        # Block fonts, images and trackers at the network layer
+        driver.execute_cdp_cmd("Network.enable", {})
+        driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": BLOCKED_URL_PATTERNS})
+        
+        # Add randomized window dimensions to vary fingerprint
+        driver.set_window_size(random.randint(1200, 1920), random.randint(800, 1080))
         return driver
     
+    @staticmethod
+    def _search_url(job_title: str, location: str) -> str:
+        """
+        Build the filtered search results URL for a job title and location.
+        
+        Args:
+            job_title: Job title to search for
+            location: Location to search in
+            
+        Returns:
+            URL with properly encoded query parameters
+        """
+        params = list(zip(SEARCH_PARAMS, (job_title, location))) + list(SEARCH_FILTER_PARAMS)
+        return f"{SEARCH_URL}?{urlencode(params, safe=',')}"
+    
+    def _open_search_url(self, driver, search_url: str) -> bool:
+        """
+        Open a search results page directly.
+        
+        Args:
+            driver: Selenium WebDriver
+            search_url: Search results URL
+            
+        Returns:
+            True if the results loaded, False otherwise
+        """
+        try:
+            driver.get(search_url)
+            self._wait(driver).until(
+                EC.presence_of_element_located(LOC_RESULTS_LIST)
+            )
+            logger.info("Opened LinkedIn search results")
+            return True
+        except TimeoutException:
+            logger.warning("LinkedIn search results did not load from URL, using the search form")
+            return False
+    
+    def _wait(self, driver) -> WebDriverWait:
+        """Return a WebDriverWait that polls every WAIT_POLL_FREQUENCY seconds."""
+        return WebDriverWait(driver, self.timeout, poll_frequency=WAIT_POLL_FREQUENCY)
+    
+    def _settle(self, driver, condition, timeout: float = SETTLE_TIMEOUT) -> bool:
+        """
+        Wait for the page change a click should cause.
+        
+        Unlike _wait(), a timeout is not an error: the click already happened,
+        so the caller carries on.
+        
+        Args:
+            driver: Selenium WebDriver
+            condition: Expected condition to wait for
+            timeout: Maximum seconds to wait
+            
+        Returns:
+            True if the condition was met, False on timeout
+        """
+        try:
+            WebDriverWait(driver, timeout, poll_frequency=WAIT_POLL_FREQUENCY).until(condition)
+            return True
+        except TimeoutException:
+            logger.debug("Timed out waiting for the page to update")
+            return False
+    
+    def _click_checkbox_label(self, driver, label):
+        """
+        Click a filter checkbox's label and wait for the checkbox to tick.
+        
+        Args:
+            driver: Selenium WebDriver
+            label: Label element of the checkbox
+        """
+        HumanBehavior.instant_click(driver, label)
+        checkbox_id = label.get_attribute("for")
+        if checkbox_id:
+            self._settle(driver, EC.element_located_selection_state_to_be((By.ID, checkbox_id), True))
+    
+    @staticmethod
+    def _first_element(parent, locator):
+        """
+        Return the first element matching a locator, or None.
+        
+        Unlike find_element(), a miss returns immediately instead of raising,
+        so optional elements cost no exception or implicit wait.
+        
+        Args:
+            parent: WebDriver or element to search within
+            locator: (By, selector) pair
+            
+        Returns:
+            The element, or None if there is none
+        """
+        elements = parent.find_elements(*locator)
+        return elements[0] if elements else None
+    
+    def _select_filter_options(self, driver, section_locator, option_locators) -> int:
+        """
+        Tick checkboxes within one section of the All filters modal.
+        
+        Options missing from the page are skipped.
+        
+        Args:
+            driver: Selenium WebDriver
+            section_locator: Locator of the modal section
+            option_locators: Locators of the option labels, relative to the section
+            
+        Returns:
+            Number of options ticked
+        """
+        section = self._first_element(driver, section_locator)
+        if section is None:
+            return 0
+        
+        selected = 0
+        for option_locator in option_locators:
+            option = self._first_element(section, option_locator)
+            if option is None:
+                continue
+            try:
+                self._click_checkbox_label(driver, option)
+                selected += 1
+            except Exception as e:
+                logger.debug(f"Could not tick filter option {option_locator[1]}: {e}")
+        return selected
+    
+    def _get_drivers(self, count: int) -> List:
+        """
+        Return up to `count` logged-in browser sessions, starting any missing.
+        
+        If an extra session fails to log in, the ones already running are
+        used; only a failure to start the first session is raised.
+        
+        Args:
+            count: Number of sessions wanted
+            
+        Returns:
+            List of Selenium WebDrivers
+        """
+        while len(self._drivers) < count:
+            driver = self._setup_driver(len(self._drivers))
+            try:
+                self._login(driver)
+            except Exception as e:
+                driver.quit()
+                if not self._drivers:
+                    raise
+                logger.warning(f"Could not start another LinkedIn session, using {len(self._drivers)}: {e}")
+                break
+            
+            if not self._drivers:
+                atexit.register(self.close)
+            self._drivers.append(driver)
+        
+        return self._drivers[:count]
+    
+    def close(self):
+        """Quit all browser sessions."""
+        for driver in self._drivers:
+            try:
+                driver.quit()
+            except Exception as e:
+                logger.debug(f"Error quitting browser: {e}")
+        self._drivers = []
+    
     def scrape_jobs(self) -> List[Dict[str, Any]]:
         """
         Scrape job listings from LinkedIn.
@@ -106,46 +531,122 @@ class LinkedInScraper:
             List of job dictionaries
         """
         jobs = []
+        # Keys of jobs already scraped; the same job shows up across searches
+        seen_jobs = set()
+        self._seen_urls.clear()
         
         # Check if LinkedIn credentials are provided
         if not self.linkedin_username or not self.linkedin_password:
             logger.error("LinkedIn credentials not provided")
             return jobs
         
-        driver = self._setup_driver()
-        
         try:
-            # Log in to LinkedIn
-            self._login(driver)
-            
             # Get job search parameters
             job_titles = self.job_search.get('job_titles', [])
             locations = self.job_search.get('locations', [])
             
-            # Search for jobs for each job title and location combination
-            for job_title in job_titles:
-                for location in locations:
-                    logger.info(f"Searching for {job_title} jobs in {location}")
-                    
-                    # Search for jobs
-                    jobs_for_search = self._search_jobs(driver, job_title, location)
-                    
-                    # Add jobs to the list
-                    jobs.extend(jobs_for_search)
+            # Build every search's results URL up front
+            searches = [
+                (job_title, location, self._search_url(job_title, location))
+                for job_title in job_titles
+                for location in locations
+            ]
+            
+            if not searches:
+                return jobs
+            
+            os.makedirs(os.path.dirname(SEARCH_CACHE_PATH), exist_ok=True)
+            with shelve.open(SEARCH_CACHE_PATH) as cache:
+                # Results per search, in search order; None until scraped
+                results = []
+                # Searches not answered from the cache: (index in results, cache key, search)
+                pending = []
+                now = time.time()
+                
+                for search in searches:
+                    cache_key = self._search_cache_key(search[2])
+                    cached = None if self.force_refresh else cache.get(cache_key)
+                    if cached and now - cached['time'] < SEARCH_CACHE_TTL:
+                        logger.info(f"Using cached results for {search[0]} jobs in {search[1]}")
+                        results.append(cached['jobs'])
+                        self._seen_urls.update(job['url'] for job in cached['jobs'] if job.get('url'))
+                    else:
+                        pending.append((len(results), cache_key, search))
+                        results.append(None)
+                
+                if pending:
+                    # Run the searches in parallel, one logged-in browser per worker
+                    drivers = self._get_drivers(min(self.search_workers, len(pending)))
+                    driver_pool = queue.Queue()
+                    for driver in drivers:
+                        driver_pool.put(driver)
                     
-                    # Add random delay between searches
-                    HumanBehavior.random_delay(2.0, 5.0)
+                    with ThreadPoolExecutor(max_workers=len(drivers)) as executor:
+                        scraped = executor.map(lambda item: self._search_with_pool(driver_pool, *item[2]), pending)
+                        
+                        for (index, cache_key, _), jobs_for_search in zip(pending, scraped):
+                            results[index] = jobs_for_search
+                            # An empty result is as likely a failed search as a real
+                            # one, so only cache searches that found something
+                            if jobs_for_search:
+                                cache[cache_key] = {'time': time.time(), 'jobs': jobs_for_search}
+            
+            for jobs_for_search in results:
+                # Add jobs not already found by an earlier search
+                for job in jobs_for_search:
+                    key = job.get('url') or (job.get('company_name', '').lower(), job.get('title', '').lower())
+                    if key not in seen_jobs:
+                        seen_jobs.add(key)
+                        jobs.append(job)
             
             logger.info(f"Scraped {len(jobs)} jobs from LinkedIn")
             
         except Exception as e:
             logger.error(f"Error scraping LinkedIn jobs: {e}")
         
-        finally:
-            driver.quit()
-        
         return jobs
     
+    def _search_cache_key(self, search_url: str) -> str:
+        """
+        Build the search results cache key for a search.
+        
+        Args:
+            search_url: Results page URL, which carries the job title and location
+            
+        Returns:
+            Hex digest identifying the search, its filters and today's date
+        """
+        filters = json.dumps(
+            {name: self.job_search.get(name) for name in ('experience_level', 'job_type')},
+            sort_keys=True,
+        )
+        return hashlib.sha1(f"{search_url}|{filters}|{date.today().isoformat()}".encode('utf-8')).hexdigest()
+    
+    def _search_with_pool(self, driver_pool: queue.Queue, job_title: str, location: str, search_url: str) -> List[Dict[str, Any]]:
+        """
+        Run one search on a browser checked out of the pool.
+        
+        Args:
+            driver_pool: Queue of idle logged-in WebDrivers
+            job_title: Job title to search for
+            location: Location to search in
+            search_url: Results page to open directly
+            
+        Returns:
+            List of job dictionaries
+        """
+        driver = driver_pool.get()
+        try:
+            logger.info(f"Searching for {job_title} jobs in {location}")
+            jobs = self._search_jobs(driver, job_title, location, search_url=search_url)
+            
+            # Add random delay before this browser's next search
+            HumanBehavior.random_delay(2.0, 5.0)
+            
+            return jobs
+        finally:
+            driver_pool.put(driver)
+    
     def _login(self, driver):
         """
         Log in to LinkedIn.
@@ -154,18 +655,29 @@ class LinkedInScraper:
             driver: Selenium WebDriver
         """
         try:
+            # The profile may still hold a session from an earlier run
+            driver.get("https://www.linkedin.com/feed/")
+            if self._settle(driver, EC.presence_of_element_located(LOC_GLOBAL_NAV), LOGGED_IN_CHECK_TIMEOUT):
+                logger.info("Already logged in to LinkedIn")
+                return
+            
+            # Otherwise try the cookies saved by the last login
+            if self._restore_session_cookies(driver):
+                logger.info("Restored LinkedIn session from saved cookies")
+                return
+            
             # Navigate to LinkedIn login page
             driver.get("https://www.linkedin.com/login")
             logger.info("Navigated to LinkedIn login page")
             
             # Wait for the login form to load
-            WebDriverWait(driver, self.timeout).until(
-                EC.presence_of_element_located((By.ID, "username"))
+            self._wait(driver).until(
+                EC.presence_of_element_located(LOC_USERNAME_INPUT)
             )
             
             # Enter credentials with human-like typing
-            username_field = driver.find_element(By.ID, "username")
-            password_field = driver.find_element(By.ID, "password")
+            username_field = driver.find_element(*LOC_USERNAME_INPUT)
+            password_field = driver.find_element(*LOC_PASSWORD_INPUT)
             
             # Type username with human-like behavior
             HumanBehavior.human_like_typing(username_field, self.linkedin_username)
@@ -180,12 +692,12 @@ class LinkedInScraper:
             HumanBehavior.random_delay(0.5, 1.5)
             
             # Find and click the sign-in button with human-like movement
-            sign_in_button = driver.find_element(By.CSS_SELECTOR, "button[type='submit']")
+            sign_in_button = driver.find_element(*LOC_SIGN_IN_BUTTON)
             HumanBehavior.human_like_click(driver, sign_in_button)
             
             # Wait for login to complete
-            WebDriverWait(driver, self.timeout).until(
-                EC.presence_of_element_located((By.ID, "global-nav"))
+            self._wait(driver).until(
+                EC.presence_of_element_located(LOC_GLOBAL_NAV)
             )
             
             logger.info("Successfully logged in to LinkedIn")
@@ -198,10 +710,11 @@ class LinkedInScraper:
                 print("The application will continue once verification is complete.")
                 
                 # Wait for manual verification (up to 2 minutes)
-                for _ in range(24):  # 24 * 5 seconds = 2 minutes
+                deadline = time.monotonic() + VERIFICATION_TIMEOUT
+                while time.monotonic() < deadline:
                     if "checkpoint" not in driver.current_url and "security-verification" not in driver.current_url:
                         break
-                    time.sleep(5)
+                    time.sleep(VERIFICATION_POLL_INTERVAL)
                 
                 if "checkpoint" in driver.current_url or "security-verification" in driver.current_url:
                     logger.error("LinkedIn security verification timed out")
@@ -209,6 +722,9 @@ class LinkedInScraper:
                 
                 logger.info("LinkedIn security verification completed")
             
+            # Keep the session for browsers that have to log in later
+            self._save_session_cookies(driver)
+            
             # Wait a moment for the page to fully load
             HumanBehavior.random_delay(1.0, 2.0)
             
@@ -216,7 +732,49 @@ class LinkedInScraper:
             logger.error(f"Error logging in to LinkedIn: {e}")
             raise
     
-    def _search_jobs(self, driver, job_title: str, location: str) -> List[Dict[str, Any]]:
+    def _restore_session_cookies(self, driver) -> bool:
+        """
+        Load saved session cookies into the browser and check they still work.
+        
+        Args:
+            driver: Selenium WebDriver, on a linkedin.com page
+            
+        Returns:
+            True if the browser is now logged in, False otherwise
+        """
+        try:
+            with open(SESSION_COOKIES_PATH, 'r', encoding='utf-8') as f:
+                cookies = json.load(f)
+        except (OSError, ValueError):
+            return False
+        
+        for cookie in cookies:
+            try:
+                driver.add_cookie(cookie)
+            except Exception as e:
+                logger.debug(f"Could not restore cookie {cookie.get('name')}: {e}")
+        
+        driver.get("https://www.linkedin.com/feed/")
+        return self._settle(driver, EC.presence_of_element_located(LOC_GLOBAL_NAV), LOGGED_IN_CHECK_TIMEOUT)
+    
+    def _save_session_cookies(self, driver):
+        """
+        Save the browser's LinkedIn cookies, readable by the owner only.
+        
+        Args:
+            driver: Selenium WebDriver, logged in
+        """
+        try:
+            os.makedirs(os.path.dirname(SESSION_COOKIES_PATH), exist_ok=True)
+            fd = os.open(SESSION_COOKIES_PATH, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                json.dump(driver.get_cookies(), f)
+            # os.open only applies the mode to new files
+            os.chmod(SESSION_COOKIES_PATH, 0o600)
+        except OSError as e:
+            logger.warning(f"Could not save LinkedIn session cookies: {e}")
+    
+    def _search_jobs(self, driver, job_title: str, location: str, search_url: Optional[str] = None) -> List[Dict[str, Any]]:
         """
         Search for jobs on LinkedIn.
         
@@ -224,6 +782,8 @@ class LinkedInScraper:
             driver: Selenium WebDriver
             job_title: Job title to search for
             location: Location to search in
+            search_url: Results page to open directly; the search form is used
+                if it is None or the results don't load
             
         Returns:
             List of job dictionaries
@@ -231,57 +791,90 @@ class LinkedInScraper:
         jobs = []
         
         try:
-            # Navigate to LinkedIn Jobs page
-            driver.get("https://www.linkedin.com/jobs/")
-            logger.info("Navigated to LinkedIn Jobs page")
-            
-            # Wait for the search form to load
-            WebDriverWait(driver, self.timeout).until(
-                EC.presence_of_element_located((By.CSS_SELECTOR, "input[aria-label='Search by title, skill, or company']"))
-            )
-            
-            # Enter job title with human-like typing
-            job_title_field = driver.find_element(By.CSS_SELECTOR, "input[aria-label='Search by title, skill, or company']")
-            HumanBehavior.human_like_typing(job_title_field, job_title)
-            
-            # Pause briefly like a human would after entering job title
-            HumanBehavior.random_delay(0.8, 1.5)
-            
-            # Enter location with human-like typing
-            location_field = driver.find_element(By.CSS_SELECTOR, "input[aria-label='City, state, or zip code']")
-            location_field.clear()
-            HumanBehavior.human_like_typing(location_field, location)
-            
-            # Random delay before clicking search to simulate human thinking
-            HumanBehavior.random_delay(0.5, 1.5)
-            
-            # Find and click the search button with human-like movement
-            search_button = driver.find_element(By.CSS_SELECTOR, "button[data-tracking-control-name='public_jobs_jobs-search-bar_base-search-button']")
-            HumanBehavior.human_like_click(driver, search_button)
-            
-            # Wait for search results to load
-            WebDriverWait(driver, self.timeout).until(
-                EC.presence_of_element_located((By.CSS_SELECTOR, "ul.jobs-search__results-list"))
-            )
-            
-            # Apply all the specified filters
-            self._apply_advanced_filters(driver)
+            # Open the filtered results page directly, falling back to the
+            # search form and clicking through the filters
+            if not (search_url and self._open_search_url(driver, search_url)):
+                # Navigate to LinkedIn Jobs page
+                driver.get("https://www.linkedin.com/jobs/")
+                logger.info("Navigated to LinkedIn Jobs page")
+                
+                # Wait for the search form to load
+                self._wait(driver).until(
+                    EC.presence_of_element_located(LOC_TITLE_INPUT)
+                )
+                
+                job_title_field = driver.find_element(*LOC_TITLE_INPUT)
+                location_field = driver.find_element(*LOC_LOCATION_INPUT)
+                location_field.clear()
+                
+                # The search box is not what triggers LinkedIn's bot checks, so
+                # by default it skips the human-like keystrokes and pauses
+                if self.browser_config.get('linkedin_fast_search_typing', True):
+                    job_title_field.send_keys(job_title)
+                    location_field.send_keys(location)
+                else:
+                    # Enter job title with human-like typing
+                    HumanBehavior.human_like_typing(job_title_field, job_title)
+                    
+                    # Pause briefly like a human would after entering job title
+                    HumanBehavior.random_delay(0.8, 1.5)
+                    
+                    # Enter location with human-like typing
+                    HumanBehavior.human_like_typing(location_field, location)
+                    
+                    # Random delay before clicking search to simulate human thinking
+                    HumanBehavior.random_delay(0.5, 1.5)
+                
+                # Find and click the search button with human-like movement
+                search_button = driver.find_element(*LOC_SEARCH_BUTTON)
+                HumanBehavior.human_like_click(driver, search_button)
+                
+                # Wait for search results to load
+                self._wait(driver).until(
+                    EC.presence_of_element_located(LOC_RESULTS_LIST)
+                )
+                
+                # Apply all the specified filters
+                self._apply_advanced_filters(driver)
             
             # Wait for filtered results to load
-            HumanBehavior.random_delay(2.0, 4.0)
+            self._settle(driver, EC.presence_of_element_located(LOC_RESULT_ITEM))
             
             # Scroll through results to load more jobs
             self._scroll_through_results(driver)
             
             # Extract job listings
-            job_listings = driver.find_elements(By.CSS_SELECTOR, "li.jobs-search-results__list-item")
+            job_listings = driver.find_elements(*LOC_RESULT_ITEM)
             logger.info(f"Found {len(job_listings)} job listings")
             
+            # Card-level fields for every listing, read from one HTML snapshot
+            cards = self._parse_job_cards(driver)
+            if len(cards) != len(job_listings):
+                cards = [{}] * len(job_listings)
+            
+            # Skip listings another search already scraped
+            new_listings = [
+                (job_listing, card) for job_listing, card in zip(job_listings, cards)
+                if self._claim_job_url(card.get('url'))
+            ]
+            if len(new_listings) < len(job_listings):
+                logger.info(f"Skipping {len(job_listings) - len(new_listings)} jobs already scraped")
+            job_listings = [job_listing for job_listing, _ in new_listings]
+            cards = [card for _, card in new_listings]
+            
+            # Fetch job pages over HTTP; listings whose page could not be
+            # read are clicked and read from the details pane instead
+            details = self._fetch_job_details(cards)
+            
             # Process each job listing
-            for job_listing in job_listings:
+            for job_listing, card, detail in zip(job_listings, cards, details):
                 try:
                     # Extract job information
-                    job = self._extract_job_info(driver, job_listing)
+                    if detail:
+                        job = self._merge_job_details(card, detail)
+                        logger.info(f"Fetched job info: {job['title']} at {job['company_name']}")
+                    else:
+                        job = self._extract_job_info(driver, job_listing, card)
                     
                     # Add source information
                     job['source'] = 'LinkedIn'
@@ -313,39 +906,36 @@ class LinkedInScraper:
             # 1. Sort by Most Recent
             try:
                 # Click on the sort dropdown
-                sort_button = WebDriverWait(driver, self.timeout).until(
-                    EC.element_to_be_clickable((By.CSS_SELECTOR, "button.artdeco-dropdown__trigger--placement-bottom"))
+                sort_button = self._wait(driver).until(
+                    EC.element_to_be_clickable(LOC_SORT_DROPDOWN)
                 )
                 HumanBehavior.human_like_click(driver, sort_button)
                 
-                # Wait for dropdown to appear
-                HumanBehavior.random_delay(0.5, 1.0)
-                
-                # Click on "Most recent" option
-                most_recent_option = WebDriverWait(driver, self.timeout).until(
-                    EC.element_to_be_clickable((By.XPATH, "//span[text()='Most recent']"))
+                # Click on "Most recent" option once the dropdown shows it
+                most_recent_option = self._wait(driver).until(
+                    EC.element_to_be_clickable(LOC_MOST_RECENT_OPTION)
                 )
                 HumanBehavior.human_like_click(driver, most_recent_option)
                 
+                # Wait for the dropdown to close
+                self._settle(driver, EC.invisibility_of_element(most_recent_option))
                 logger.info("Set sort to Most Recent")
-                HumanBehavior.random_delay(1.0, 2.0)
             except Exception as e:
                 logger.warning(f"Could not set sort to Most Recent: {e}")
             
             # 2. Click on "All filters" button to access more filters
             try:
-                all_filters_button = WebDriverWait(driver, self.timeout).until(
-                    EC.element_to_be_clickable((By.XPATH, "//button[contains(text(), 'All filters')]"))
+                all_filters_button = self._wait(driver).until(
+                    EC.element_to_be_clickable(LOC_ALL_FILTERS_BUTTON)
                 )
                 HumanBehavior.human_like_click(driver, all_filters_button)
                 
                 # Wait for filter modal to appear
-                WebDriverWait(driver, self.timeout).until(
-                    EC.presence_of_element_located((By.CSS_SELECTOR, "div.jobs-search-box__advanced-filters"))
+                self._wait(driver).until(
+                    EC.presence_of_element_located(LOC_ADVANCED_FILTERS)
                 )
                 
                 logger.info("Opened All Filters modal")
-                HumanBehavior.random_delay(1.0, 2.0)
             except Exception as e:
                 logger.warning(f"Could not open All Filters modal: {e}")
                 # Try to find individual filter buttons instead
@@ -353,123 +943,67 @@ class LinkedInScraper:
                 return
             
             # 3. Set Date Posted to "Past Week"
-            try:
-                date_posted_section = driver.find_element(By.XPATH, "//h3[text()='Date posted']/ancestor::section")
-                past_week_option = date_posted_section.find_element(By.XPATH, ".//label[contains(text(), 'Past week')]")
-                HumanBehavior.human_like_click(driver, past_week_option)
-                
+            if self._select_filter_options(driver, LOC_DATE_POSTED_SECTION, [LOC_PAST_WEEK_LABEL]):
                 logger.info("Set Date Posted to Past Week")
-                HumanBehavior.random_delay(0.5, 1.0)
-            except Exception as e:
-                logger.warning(f"Could not set Date Posted filter: {e}")
+            else:
+                logger.warning("Could not set Date Posted filter")
             
             # 4. Set Experience Level to "Entry Level, Associate, Internship"
-            try:
-                experience_section = driver.find_element(By.XPATH, "//h3[text()='Experience level']/ancestor::section")
-                
-                # Select Entry Level
-                entry_level_option = experience_section.find_element(By.XPATH, ".//label[contains(text(), 'Entry level')]")
-                HumanBehavior.human_like_click(driver, entry_level_option)
-                
-                # Select Associate
-                associate_option = experience_section.find_element(By.XPATH, ".//label[contains(text(), 'Associate')]")
-                HumanBehavior.human_like_click(driver, associate_option)
-                
-                # Select Internship
-                internship_option = experience_section.find_element(By.XPATH, ".//label[contains(text(), 'Internship')]")
-                HumanBehavior.human_like_click(driver, internship_option)
-                
+            if self._select_filter_options(driver, LOC_EXPERIENCE_SECTION,
+                                           [LOC_ENTRY_LEVEL_LABEL, LOC_ASSOCIATE_LABEL, LOC_INTERNSHIP_LABEL]):
                 logger.info("Set Experience Level filters")
-                HumanBehavior.random_delay(0.5, 1.0)
-            except Exception as e:
-                logger.warning(f"Could not set Experience Level filters: {e}")
+            else:
+                logger.warning("Could not set Experience Level filters")
             
             # 5. Set Job Type to "Internship, Full Time"
-            try:
-                job_type_section = driver.find_element(By.XPATH, "//h3[text()='Job type']/ancestor::section")
-                
-                # Select Internship
-                internship_option = job_type_section.find_element(By.XPATH, ".//label[contains(text(), 'Internship')]")
-                HumanBehavior.human_like_click(driver, internship_option)
-                
-                # Select Full-time
-                full_time_option = job_type_section.find_element(By.XPATH, ".//label[contains(text(), 'Full-time')]")
-                HumanBehavior.human_like_click(driver, full_time_option)
-                
+            if self._select_filter_options(driver, LOC_JOB_TYPE_SECTION, [LOC_INTERNSHIP_LABEL, LOC_FULL_TIME_LABEL]):
                 logger.info("Set Job Type filters")
-                HumanBehavior.random_delay(0.5, 1.0)
-            except Exception as e:
-                logger.warning(f"Could not set Job Type filters: {e}")
+            else:
+                logger.warning("Could not set Job Type filters")
             
             # 6. Set Remote options to "On-site, Remote, Hybrid"
-            try:
-                remote_section = driver.find_element(By.XPATH, "//h3[text()='On-site/remote']/ancestor::section")
-                
-                # Select On-site
-                onsite_option = remote_section.find_element(By.XPATH, ".//label[contains(text(), 'On-site')]")
-                HumanBehavior.human_like_click(driver, onsite_option)
-                
-                # Select Remote
-                remote_option = remote_section.find_element(By.XPATH, ".//label[contains(text(), 'Remote')]")
-                HumanBehavior.human_like_click(driver, remote_option)
-                
-                # Select Hybrid
-                hybrid_option = remote_section.find_element(By.XPATH, ".//label[contains(text(), 'Hybrid')]")
-                HumanBehavior.human_like_click(driver, hybrid_option)
-                
+            if self._select_filter_options(driver, LOC_WORKPLACE_SECTION,
+                                           [LOC_ON_SITE_LABEL, LOC_REMOTE_LABEL, LOC_HYBRID_LABEL]):
                 logger.info("Set Remote options filters")
-                HumanBehavior.random_delay(0.5, 1.0)
-            except Exception as e:
-                logger.warning(f"Could not set Remote options filters: {e}")
+            else:
+                logger.warning("Could not set Remote options filters")
             
             # 7. Set Easy Apply filter
-            try:
-                easy_apply_section = driver.find_element(By.XPATH, "//h3[text()='Easy Apply']/ancestor::section")
-                easy_apply_option = easy_apply_section.find_element(By.XPATH, ".//label[contains(text(), 'Easy Apply')]")
-                HumanBehavior.human_like_click(driver, easy_apply_option)
-                
+            if self._select_filter_options(driver, LOC_EASY_APPLY_SECTION, [LOC_EASY_APPLY_LABEL]):
                 logger.info("Set Easy Apply filter")
-                HumanBehavior.random_delay(0.5, 1.0)
-            except Exception as e:
-                logger.warning(f"Could not set Easy Apply filter: {e}")
+            else:
+                logger.warning("Could not set Easy Apply filter")
             
             # 8. Set Salary to $60,000+
-            try:
-                salary_section = driver.find_element(By.XPATH, "//h3[text()='Salary']/ancestor::section")
-                
-                # Find the salary input field
-                salary_input = salary_section.find_element(By.CSS_SELECTOR, "input[aria-label='Minimum salary']")
-                HumanBehavior.human_like_typing(salary_input, "60000")
-                
-                logger.info("Set Salary filter to $60,000+")
-                HumanBehavior.random_delay(0.5, 1.0)
-            except Exception as e:
-                logger.warning(f"Could not set Salary filter: {e}")
+            salary_section = self._first_element(driver, LOC_SALARY_SECTION)
+            salary_input = self._first_element(salary_section, LOC_MIN_SALARY_INPUT) if salary_section else None
+            if salary_input is None:
+                logger.warning("Could not set Salary filter: no minimum salary field")
+            else:
+                try:
+                    HumanBehavior.human_like_typing(salary_input, "60000")
+                    logger.info("Set Salary filter to $60,000+")
+                except Exception as e:
+                    logger.warning(f"Could not set Salary filter: {e}")
             
             # 9. Set Has Verifications filter if available
-            try:
-                verifications_section = driver.find_element(By.XPATH, "//h3[text()='LinkedIn features']/ancestor::section")
-                verifications_option = verifications_section.find_element(By.XPATH, ".//label[contains(text(), 'Has verifications')]")
-                HumanBehavior.human_like_click(driver, verifications_option)
-                
+            if self._select_filter_options(driver, LOC_FEATURES_SECTION, [LOC_VERIFICATIONS_LABEL]):
                 logger.info("Set Has Verifications filter")
-                HumanBehavior.random_delay(0.5, 1.0)
-            except Exception as e:
-                logger.warning(f"Could not set Has Verifications filter: {e}")
+            else:
+                logger.debug("Has Verifications filter not available")
             
             # 10. Apply filters by clicking the Show Results button
             try:
-                show_results_button = driver.find_element(By.XPATH, "//button[contains(text(), 'Show results')]")
+                show_results_button = driver.find_element(*LOC_SHOW_RESULTS_BUTTON)
                 HumanBehavior.human_like_click(driver, show_results_button)
                 
                 logger.info("Applied all filters")
                 
-                # Wait for filtered results to load
-                WebDriverWait(driver, self.timeout).until(
-                    EC.presence_of_element_located((By.CSS_SELECTOR, "ul.jobs-search__results-list"))
+                # Wait for the modal to close and the filtered results to load
+                self._settle(driver, EC.invisibility_of_element_located(LOC_ADVANCED_FILTERS))
+                self._wait(driver).until(
+                    EC.presence_of_element_located(LOC_RESULTS_LIST)
                 )
-                
-                HumanBehavior.random_delay(2.0, 4.0)
             except Exception as e:
                 logger.warning(f"Could not apply filters: {e}")
         
@@ -488,61 +1022,64 @@ class LinkedInScraper:
             
             # 1. Easy Apply filter
             try:
-                easy_apply_button = driver.find_element(By.XPATH, "//button[contains(text(), 'Easy Apply')]")
+                easy_apply_button = driver.find_element(*LOC_EASY_APPLY_BUTTON)
                 HumanBehavior.human_like_click(driver, easy_apply_button)
+                
+                # Wait for the toggle to show as pressed (or the results to re-render)
+                self._settle(driver, lambda d: EC.staleness_of(easy_apply_button)(d)
+                             or easy_apply_button.get_attribute("aria-pressed") == "true")
                 logger.info("Applied Easy Apply filter")
-                HumanBehavior.random_delay(1.0, 2.0)
             except Exception as e:
                 logger.warning(f"Could not apply Easy Apply filter individually: {e}")
             
             # 2. Date Posted filter
             try:
-                date_posted_button = driver.find_element(By.XPATH, "//button[contains(text(), 'Date posted')]")
+                date_posted_button = driver.find_element(*LOC_DATE_POSTED_BUTTON)
                 HumanBehavior.human_like_click(driver, date_posted_button)
                 
-                # Wait for dropdown to appear
-                HumanBehavior.random_delay(0.5, 1.0)
-                
-                # Select Past Week
-                past_week_option = driver.find_element(By.XPATH, "//span[contains(text(), 'Past week')]")
+                # Select Past Week once the dropdown shows it
+                past_week_option = self._wait(driver).until(
+                    EC.element_to_be_clickable(LOC_PAST_WEEK_OPTION)
+                )
                 HumanBehavior.human_like_click(driver, past_week_option)
                 
+                # Wait for the dropdown to close
+                self._settle(driver, EC.invisibility_of_element(past_week_option))
                 logger.info("Applied Date Posted filter")
-                HumanBehavior.random_delay(1.0, 2.0)
             except Exception as e:
                 logger.warning(f"Could not apply Date Posted filter individually: {e}")
             
             # 3. Experience Level filter
             try:
-                experience_button = driver.find_element(By.XPATH, "//button[contains(text(), 'Experience level')]")
+                experience_button = driver.find_element(*LOC_EXPERIENCE_BUTTON)
                 HumanBehavior.human_like_click(driver, experience_button)
                 
-                # Wait for dropdown to appear
-                HumanBehavior.random_delay(0.5, 1.0)
-                
-                # Select Entry level
-                entry_level_option = driver.find_element(By.XPATH, "//span[contains(text(), 'Entry level')]")
+                # Select Entry level once the dropdown shows it
+                entry_level_option = self._wait(driver).until(
+                    EC.element_to_be_clickable(LOC_ENTRY_LEVEL_OPTION)
+                )
                 HumanBehavior.human_like_click(driver, entry_level_option)
                 
                 # Select Associate
-                associate_option = driver.find_element(By.XPATH, "//span[contains(text(), 'Associate')]")
+                associate_option = driver.find_element(*LOC_ASSOCIATE_OPTION)
                 HumanBehavior.human_like_click(driver, associate_option)
                 
                 # Select Internship
-                internship_option = driver.find_element(By.XPATH, "//span[contains(text(), 'Internship')]")
+                internship_option = driver.find_element(*LOC_INTERNSHIP_OPTION)
                 HumanBehavior.human_like_click(driver, internship_option)
                 
                 # Apply selections
-                apply_button = driver.find_element(By.XPATH, "//button[contains(text(), 'Show results')]")
+                apply_button = driver.find_element(*LOC_SHOW_RESULTS_BUTTON)
                 HumanBehavior.human_like_click(driver, apply_button)
                 
+                # Wait for the dropdown to close
+                self._settle(driver, EC.invisibility_of_element(apply_button))
                 logger.info("Applied Experience Level filter")
-                HumanBehavior.random_delay(1.0, 2.0)
             except Exception as e:
                 logger.warning(f"Could not apply Experience Level filter individually: {e}")
             
             # Wait for filtered results to load
-            HumanBehavior.random_delay(2.0, 4.0)
+            self._settle(driver, EC.presence_of_element_located(LOC_RESULT_ITEM))
             
         except Exception as e:
             logger.error(f"Error applying individual filters: {e}")
@@ -555,104 +1092,261 @@ class LinkedInScraper:
             driver: Selenium WebDriver
         """
         try:
-            # Scroll down a few times to load more results
-            for _ in range(5):
+            count_script = f"return document.querySelectorAll('{RESULT_ITEM_SELECTOR}').length"
+            count = driver.execute_script(count_script)
+            
+            # Scroll until the results stop growing or a full page is loaded
+            stable = 0
+            for _ in range(MAX_RESULT_SCROLLS):
+                if count >= RESULT_PAGE_SIZE:
+                    break
+                
                 # Scroll down with human-like behavior
                 HumanBehavior.scroll_page(driver, "down")
                 
                 # Wait for new results to load
-                HumanBehavior.random_delay(1.0, 2.0)
+                previous = count
+                if self._settle(driver, lambda d: d.execute_script(count_script) > previous, SCROLL_LOAD_TIMEOUT):
+                    stable = 0
+                    count = driver.execute_script(count_script)
+                else:
+                    stable += 1
+                    if stable >= SCROLL_STABLE_LIMIT:
+                        break
         
         except Exception as e:
             logger.error(f"Error scrolling through results: {e}")
     
-    def _extract_job_info(self, driver, job_listing) -> Dict[str, Any]:
+    @staticmethod
+    def _parse_job_cards(driver) -> List[Dict[str, Any]]:
         """
-        Extract job information from a job listing.
+        Extract the card-level fields of every result from the page HTML.
+        
+        The cards' HTML is fetched in one call and parsed locally, so reading
+        title, company, location, URL and date costs no WebDriver round-trips.
         
         Args:
             driver: Selenium WebDriver
-            job_listing: Job listing element
             
         Returns:
-            Job dictionary
+            Job dictionaries in result order (empty on failure)
         """
-        job = {}
-        
         try:
-            # Click on the job listing to view details
-            HumanBehavior.human_like_click(driver, job_listing)
-            
-            # Wait for job details to load
-            WebDriverWait(driver, self.timeout).until(
-                EC.presence_of_element_located((By.CSS_SELECTOR, "div.jobs-details"))
+            card_html = driver.execute_script(
+                f"return Array.from(document.querySelectorAll('{RESULT_ITEM_SELECTOR}'), item => item.outerHTML)"
             )
+        except Exception as e:
+            logger.warning(f"Could not read job cards: {e}")
+            return []
+        
+        cards = []
+        for html in card_html:
+            card = BeautifulSoup(html, 'lxml')
+            job = {}
+            for key, selector in CARD_FIELDS.items():
+                element = card.select_one(selector)
+                if element is not None:
+                    job[key] = element.get_text(" ", strip=True)
             
-            # Extract job title
-            try:
-                job_title_element = driver.find_element(By.CSS_SELECTOR, "h2.jobs-details-top-card__job-title")
-                job['title'] = job_title_element.text.strip()
-            except NoSuchElementException:
-                job['title'] = "Unknown Title"
+            # Canonical job URL, without search tracking parameters
+            link = card.select_one(CARD_LINK_SELECTOR)
+            job_id = card.select_one("[data-job-id]")
+            match = JOB_ID_RE.search(link.get("href", "")) if link is not None else None
+            if match:
+                job['url'] = JOB_VIEW_URL.format(match.group(1))
+            elif job_id is not None and job_id["data-job-id"].isdigit():
+                job['url'] = JOB_VIEW_URL.format(job_id["data-job-id"])
             
-            # Extract company name
-            try:
-                company_name_element = driver.find_element(By.CSS_SELECTOR, "a.jobs-details-top-card__company-url")
-                job['company_name'] = company_name_element.text.strip()
-            except NoSuchElementException:
-                try:
-                    company_name_element = driver.find_element(By.CSS_SELECTOR, "span.jobs-details-top-card__company-name")
-                    job['company_name'] = company_name_element.text.strip()
-                except NoSuchElementException:
-                    job['company_name'] = "Unknown Company"
+            cards.append(job)
+        return cards
+    
+    def _claim_job_url(self, url: Optional[str]) -> bool:
+        """
+        Record a job URL as scraped, unless another search already has.
+        
+        Args:
+            url: Job URL from the result card; listings without one are
+                always kept
             
-            # Extract location
-            try:
-                location_element = driver.find_element(By.CSS_SELECTOR, "span.jobs-details-top-card__bullet")
-                job['location'] = location_element.text.strip()
-            except NoSuchElementException:
-                job['location'] = "Unknown Location"
+        Returns:
+            True if the job should be scraped, False if it is a duplicate
+        """
+        if not url:
+            return True
+        with self._seen_urls_lock:
+            if url in self._seen_urls:
+                return False
+            self._seen_urls.add(url)
+            return True
+    
+    def _fetch_job_details(self, cards: List[Dict[str, Any]]) -> List[Optional[Dict[str, Any]]]:
+        """
+        Fetch the public job page of every card concurrently over HTTP.
+        
+        The pages are requested signed out: the signed-in job page is
+        rendered by JavaScript, while the public one has every field in its
+        HTML.
+        
+        Args:
+            cards: Card-level job dictionaries
             
-            # Extract job URL
-            job['url'] = driver.current_url
+        Returns:
+            Parsed details (or None) for each card, in order
+        """
+        details = [None] * len(cards)
+        targets = [index for index, card in enumerate(cards) if card.get('url')]
+        if not targets:
+            return details
+        
+        try:
+            fetched = asyncio.run(self._fetch_all_details([cards[index]['url'] for index in targets]))
+        except Exception as e:
+            logger.warning(f"Could not fetch LinkedIn job pages: {e}")
+            return details
+        
+        for index, detail in zip(targets, fetched):
+            details[index] = detail
+        
+        logger.info(f"Fetched {sum(1 for detail in fetched if detail)}/{len(targets)} job pages over HTTP")
+        return details
+    
+    async def _fetch_all_details(self, urls: List[str]) -> List[Optional[Dict[str, Any]]]:
+        """
+        Fetch and parse several job pages on one async HTTP client.
+        
+        Args:
+            urls: Job URLs
             
-            # Extract job description
-            try:
-                description_element = driver.find_element(By.CSS_SELECTOR, "div.jobs-description-content__text")
-                job['description'] = description_element.text.strip()
-            except NoSuchElementException:
-                job['description'] = ""
+        Returns:
+            Parsed details (or None) for each URL, in order
+        """
+        client_kwargs = {
+            'headers': {'User-Agent': self.user_agent},
+            'limits': httpx.Limits(max_connections=DETAIL_CONNECTIONS),
+            'timeout': self.timeout,
+            'follow_redirects': True,
+        }
+        try:
+            client = httpx.AsyncClient(http2=True, **client_kwargs)
+        except ImportError:
+            # HTTP/2 needs the optional h2 package
+            client = httpx.AsyncClient(**client_kwargs)
+        
+        async with client:
+            return await asyncio.gather(*(self._fetch_job_detail(client, url) for url in urls))
+    
+    async def _fetch_job_detail(self, client: httpx.AsyncClient, url: str) -> Optional[Dict[str, Any]]:
+        """
+        Fetch a job's public page and extract its fields.
+        
+        Args:
+            client: Async HTTP client
+            url: Job URL
             
-            # Check if job has Easy Apply
-            try:
-                easy_apply_button = driver.find_element(By.CSS_SELECTOR, "button[data-control-name='jobdetails_topcard_inapply']")
-                job['easy_apply'] = True
-            except NoSuchElementException:
-                job['easy_apply'] = False
+        Returns:
+            Job fields found on the page, or None if the page could not be
+            fetched or has no description (e.g. a sign-in wall)
+        """
+        try:
+            response = await client.get(url)
+            if response.status_code != 200:
+                return None
+            return self._parse_job_detail(response.text)
+        except Exception as e:
+            logger.debug(f"Could not fetch job page {url}: {e}")
+            return None
+    
+    @staticmethod
+    def _parse_job_detail(html: str) -> Optional[Dict[str, Any]]:
+        """
+        Extract job fields from a public job page.
+        
+        Args:
+            html: Page HTML
             
-            # Extract salary information if available
-            try:
-                salary_element = driver.find_element(By.CSS_SELECTOR, "span.jobs-details-top-card__salary-info")
-                job['salary'] = salary_element.text.strip()
-            except NoSuchElementException:
-                job['salary'] = ""
+        Returns:
+            Job fields found on the page, or None if it has no job description
+        """
+        detail = {}
+        if HTMLParser is not None:
+            tree = HTMLParser(html)
+            for key, selector in DETAIL_PAGE_FIELDS.items():
+                node = tree.css_first(selector)
+                if node is not None:
+                    detail[key] = node.text(separator="\n" if key == 'description' else " ", strip=True)
+            apply_node = tree.css_first(DETAIL_PAGE_APPLY_SELECTOR)
+            apply_text = apply_node.text() if apply_node is not None else ""
+        else:
+            soup = BeautifulSoup(html, 'lxml')
+            for key, selector in DETAIL_PAGE_FIELDS.items():
+                element = soup.select_one(selector)
+                if element is not None:
+                    detail[key] = element.get_text("\n" if key == 'description' else " ", strip=True)
+            apply_element = soup.select_one(DETAIL_PAGE_APPLY_SELECTOR)
+            apply_text = apply_element.get_text() if apply_element is not None else ""
+        
+        if not detail.get('description'):
+            return None
+        
+        detail['easy_apply'] = "Easy Apply" in apply_text
+        return detail
+    
+    @staticmethod
+    def _merge_job_details(card: Dict[str, Any], details: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Combine a listing's card fields with the fields read from its details.
+        
+        Detail values win, except for the URL: the card's is the canonical job
+        URL, the details pane's is the search with a job id attached. Fields
+        missing from both get their JOB_DETAIL_DEFAULTS value.
+        
+        Args:
+            card: Fields parsed from the listing's card
+            details: Fields from the details pane or job page; None or a
+                missing key means the field was not found
             
-            # Extract job posting date
-            try:
-                date_element = driver.find_element(By.CSS_SELECTOR, "span.jobs-details-top-card__posted-date")
-                job['date_posted'] = date_element.text.strip()
-            except NoSuchElementException:
-                job['date_posted'] = ""
+        Returns:
+            Job dictionary
+        """
+        job = dict(card)
+        for key, default in JOB_DETAIL_DEFAULTS.items():
+            value = details.get(key)
+            if value is not None and not (key == 'url' and job.get('url')):
+                job[key] = value
+            elif key not in job:
+                job[key] = default
+        
+        # Set default H1B sponsorship to False (will be checked later)
+        job['sponsors_h1b'] = False
+        return job
+    
+    def _extract_job_info(self, driver, job_listing, card: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """
+        Extract job information from a job listing.
+        
+        Args:
+            driver: Selenium WebDriver
+            job_listing: Job listing element
+            card: Fields already parsed from the listing's card, used where the
+                details pane has none
             
-            # Extract number of applicants if available
-            try:
-                applicants_element = driver.find_element(By.CSS_SELECTOR, "span.jobs-details-top-card__applicant-count")
-                job['applicants'] = applicants_element.text.strip()
-            except NoSuchElementException:
-                job['applicants'] = ""
+        Returns:
+            Job dictionary
+        """
+        job = dict(card or {})
+        
+        try:
+            # Click on the job listing to view details
+            HumanBehavior.human_like_click(driver, job_listing)
+            
+            # Wait for job details to load
+            self._wait(driver).until(
+                EC.presence_of_element_located(LOC_JOB_DETAILS)
+            )
             
-            # Set default H1B sponsorship to False (will be checked later)
-            job['sponsors_h1b'] = False
+            # Extract every field from the details pane in one round-trip;
+            # fields whose element is missing come back as None
+            job = self._merge_job_details(job, driver.execute_script(JOB_DETAILS_JS))
             
             logger.info(f"Extracted job info: {job['title']} at {job['company_name']}")
             
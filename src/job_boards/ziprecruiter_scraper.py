@@ -1,7 +1,16 @@
+import asyncio
+import atexit
 import logging
+import queue
 import time
 import random
-from typing import Dict, List, Any
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Any, Optional
+from urllib.parse import urlencode
+
+import httpx
+from bs4 import BeautifulSoup
 from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
@@ -10,8 +19,129 @@ from selenium.common.exceptions import TimeoutException, NoSuchElementException
 
 from src.utils.human_behavior import HumanBehavior
 
+try:
+    from selectolax.parser import HTMLParser  # optional, much faster than BeautifulSoup
+except ImportError:
+    HTMLParser = None
+
 logger = logging.getLogger(__name__)
 
+# Requests blocked in the scraping browser; none of them carry job data
+BLOCKED_URL_PATTERNS = [
+    "*.png", "*.jpg", "*.jpeg", "*.gif", "*.webp", "*.svg",
+    "*.woff", "*.woff2", "*.ttf",
+    "*google-analytics.com*", "*googletagmanager.com*", "*doubleclick.net*",
+]
+
+# User agents to pick from when BROWSER["user_agent"] is not set
+USER_AGENTS = [
+    "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36",
+    "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.114 Safari/537.36",
+    "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36 Edg/91.0.864.59",
+    "Mozilla/5.0 (Windows NT 10.0; Win64; x64; rv:89.0) Gecko/20100101 Firefox/89.0"
+]
+
+# Chrome switches shared by every scraping browser; the last one hides the
+# automation flag from navigator.webdriver checks
+DRIVER_ARGUMENTS = (
+    '--disable-gpu',
+    '--no-sandbox',
+    '--disable-dev-shm-usage',
+    '--disable-blink-features=AutomationControlled',
+)
+
+# Chrome preferences shared by every scraping browser; don't load images
+DRIVER_PREFS = {"profile.managed_default_content_settings.images": 2}
+
+# Runs before every page's own scripts to hide the WebDriver flag
+STEALTH_JS = "Object.defineProperty(navigator, 'webdriver', {get: () => undefined})"
+
+# Range of randomized window sizes, as (min, max) pixels
+WINDOW_WIDTH_RANGE = (1200, 1920)
+WINDOW_HEIGHT_RANGE = (800, 1080)
+
+# Search results page; query parameters are the job title and location
+SEARCH_URL = "https://www.ziprecruiter.com/jobs-search"
+SEARCH_PARAMS = ("search", "location")
+
+# Query parameters for the filters _apply_filters would otherwise click
+# through: posted in the last 7 days, full-time, $60,000+
+SEARCH_FILTER_PARAMS = (
+    ("days", "7"),
+    ("refine_by_employment", "employment_type:full_time"),
+    ("refine_by_salary", "60000"),
+)
+
+# Filter dropdowns as (button text, option text, name for logging); the URL
+# parameters above cover all but the ones in UI_ONLY_FILTERS
+SEARCH_FILTERS = (
+    ("Date Posted", "Last 7 days", "Date Posted"),
+    ("Job Type", "Full-time", "Job Type"),
+    ("Salary", "$60,000+", "Salary"),
+    ("Experience", "Entry level", "Experience Level"),
+)
+UI_ONLY_FILTERS = SEARCH_FILTERS[3:]
+
+# Seconds between element checks while waiting; WebDriverWait's default of
+# 0.5s adds up to half a second of idle time to every page
+WAIT_POLL_FREQUENCY = 0.05
+
+# Seconds to wait for the page to settle after a filter click before moving
+# on anyway, and the short random pause kept after it for human-like pacing
+SETTLE_TIMEOUT = 5
+SETTLE_JITTER = (0.1, 0.4)
+
+# True once the page has finished loading and shows results
+PAGE_SETTLED_JS = "return document.readyState === 'complete' && document.querySelector('article.job_result') !== null"
+
+# Scrolls through the results at most, and seconds to wait after each for
+# more results to load
+MAX_RESULT_SCROLLS = 10
+SCROLL_LOAD_TIMEOUT = 3
+
+# Scrolling stops once this many scrolls in a row load nothing new
+SCROLL_STABLE_LIMIT = 2
+
+# Number of result cards currently on the page
+RESULT_COUNT_JS = "return document.querySelectorAll('article.job_result').length"
+
+# Browsers running searches in parallel, unless ZIPRECRUITER["search_workers"]
+# says otherwise; kept small to stay under ZipRecruiter's rate limits
+DEFAULT_SEARCH_WORKERS = 3
+
+# Concurrent HTTP connections for fetching job detail pages per search
+DESCRIPTION_CONNECTIONS = 8
+
+# Extracts the card-level fields of every result in one call; fields whose
+# element is missing come back as null
+CARDS_JS = """
+const text = (card, selector) => {
+    const element = card.querySelector(selector);
+    return element ? element.innerText.trim() : null;
+};
+return Array.from(document.querySelectorAll('article.job_result'), card => {
+    const link = card.querySelector('a.job_link');
+    return {
+        title: text(card, 'h2.job_title'),
+        company_name: text(card, 'a.company_name'),
+        location: text(card, 'a.location'),
+        url: link ? link.href : null,
+        salary: text(card, 'span.salary'),
+        date_posted: text(card, 'span.date'),
+    };
+});
+"""
+
+# Values for card fields whose element is missing
+CARD_DEFAULTS = {
+    'title': "Unknown Title",
+    'company_name': "Unknown Company",
+    'location': "Unknown Location",
+    'url': "",
+    'salary': "",
+    'date_posted': "",
+}
+
 class ZipRecruiterScraper:
     """
     Scrapes job listings from ZipRecruiter.
@@ -30,55 +160,189 @@ class ZipRecruiterScraper:
         self.timeout = self.browser_config.get('timeout', 30)
         self.user_agent = self.browser_config.get('user_agent', '')
         self.headless = self.browser_config.get('headless', False)
+        self.search_workers = max(1, config.get('ZIPRECRUITER', {}).get('search_workers', DEFAULT_SEARCH_WORKERS))
         
         # Initialize human behavior helper
         self.human = HumanBehavior()
+        
+        # Browser sessions, started on first use and kept for the scraper's lifetime
+        self._drivers = []
+        
+        # URLs of jobs already scraped in this run, shared by the search workers
+        self._seen_urls = set()
+        self._seen_urls_lock = threading.Lock()
     
-    def _setup_driver(self):
-        """Set up the Selenium WebDriver with randomized browser fingerprint."""
+    def _build_options(self) -> webdriver.ChromeOptions:
+        """
+        Build the Chrome options for a scraping browser.
+        
+        ChromeOptions objects are single-use, so a fresh one is built from the
+        module-level switches and preferences for every browser.
+        
+        Returns:
+            Chrome options
+        """
         options = webdriver.ChromeOptions()
         if self.headless:
             options.add_argument('--headless')
         
-        # Randomize user agent if not explicitly set in config
-        if not self.user_agent:
-            user_agents = [
-                "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36",
-                "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.114 Safari/537.36",
-                "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36 Edg/91.0.864.59",
-                "Mozilla/5.0 (Windows NT 10.0; Win64; x64; rv:89.0) Gecko/20100101 Firefox/89.0"
-            ]
-            self.user_agent = random.choice(user_agents)
+        # Don't wait for subresources; every lookup waits for its element
+        options.page_load_strategy = 'eager'
         
+        # Randomize user agent if not explicitly set in config; every browser
+        # in the pool then shares it
+        if not self.user_agent:
+            self.user_agent = random.choice(USER_AGENTS)
         options.add_argument(f'user-agent={self.user_agent}')
         
-        # Add randomized window dimensions to vary fingerprint
-        width = random.randint(1200, 1920)
-        height = random.randint(800, 1080)
-        
-        options.add_argument('--disable-gpu')
-        options.add_argument('--no-sandbox')
-        options.add_argument('--disable-dev-shm-usage')
+        for argument in DRIVER_ARGUMENTS:
+            options.add_argument(argument)
         
         # Disable automation flags to avoid detection
-        options.add_argument("--disable-blink-features=AutomationControlled")
         options.add_experimental_option("excludeSwitches", ["enable-automation"])
         options.add_experimental_option('useAutomationExtension', False)
+        options.add_experimental_option("prefs", DRIVER_PREFS)
         
-        driver = webdriver.Chrome(options=options)
+        return options
+    
+    def _setup_driver(self):
+        """Set up the Selenium WebDriver with randomized browser fingerprint."""
+        driver = webdriver.Chrome(options=self._build_options())
         
         # Execute CDP commands to prevent detection
-        driver.execute_cdp_cmd("Page.addScriptToEvaluateOnNewDocument", {
-            "source": """
-                Object.defineProperty(navigator, 'webdriver', {
-                    get: () => undefined
-                })
-            """
-        })
-        
-        driver.set_window_size(width, height)
+        driver.execute_cdp_cmd("Page.addScriptToEvaluateOnNewDocument", {"source": STEALTH_JS})
+        
+        # Block fonts, images and trackers at the network layer
+        driver.execute_cdp_cmd("Network.enable", {})
+        driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": BLOCKED_URL_PATTERNS})
+        
+        # Add randomized window dimensions to vary fingerprint
+        driver.set_window_size(random.randint(*WINDOW_WIDTH_RANGE), random.randint(*WINDOW_HEIGHT_RANGE))
         return driver
     
+    @staticmethod
+    def _search_url(job_title: str, location: str) -> str:
+        """
+        Build the filtered search results URL for a job title and location.
+        
+        Args:
+            job_title: Job title to search for
+            location: Location to search in
+            
+        Returns:
+            URL with properly encoded query parameters
+        """
+        params = list(zip(SEARCH_PARAMS, (job_title, location))) + list(SEARCH_FILTER_PARAMS)
+        return f"{SEARCH_URL}?{urlencode(params)}"
+    
+    def _open_search_url(self, driver, search_url: str) -> bool:
+        """
+        Open a search results page directly.
+        
+        Args:
+            driver: Selenium WebDriver
+            search_url: Search results URL
+            
+        Returns:
+            True if the results loaded, False otherwise
+        """
+        try:
+            driver.get(search_url)
+            self._wait(driver).until(
+                EC.presence_of_element_located((By.CSS_SELECTOR, "article.job_result"))
+            )
+            logger.info("Opened ZipRecruiter search results")
+            return True
+        except TimeoutException:
+            logger.warning("ZipRecruiter search results did not load from URL, using the search form")
+            return False
+    
+    def _wait(self, driver) -> WebDriverWait:
+        """Return a WebDriverWait that polls every WAIT_POLL_FREQUENCY seconds."""
+        return WebDriverWait(driver, self.timeout, poll_frequency=WAIT_POLL_FREQUENCY)
+    
+    def _settle(self, driver, condition, timeout: float = SETTLE_TIMEOUT) -> bool:
+        """
+        Wait for the page change a click should cause.
+        
+        Unlike _wait(), a timeout is not an error: the click already happened,
+        so the caller carries on.
+        
+        Args:
+            driver: Selenium WebDriver
+            condition: Expected condition to wait for
+            timeout: Maximum seconds to wait
+            
+        Returns:
+            True if the condition was met, False on timeout
+        """
+        try:
+            WebDriverWait(driver, timeout, poll_frequency=WAIT_POLL_FREQUENCY).until(condition)
+            return True
+        except TimeoutException:
+            logger.debug("Timed out waiting for the page to update")
+            return False
+    
+    def _wait_settled(self, driver, old_url: str, old_card=None, timeout: float = SETTLE_TIMEOUT):
+        """
+        Wait until the results page has reloaded, then pause briefly.
+        
+        The page from before the reload already looks loaded, so first wait
+        for it to go away: the URL changes or its first result card is
+        detached.
+        
+        Args:
+            driver: Selenium WebDriver
+            old_url: URL of the page before the reload
+            old_card: First result card of the page before the reload, if any
+            timeout: Maximum seconds to wait for each step
+        """
+        def page_replaced(d) -> bool:
+            if d.current_url != old_url:
+                return True
+            return old_card is not None and EC.staleness_of(old_card)(d)
+        
+        if self._settle(driver, page_replaced, timeout):
+            self._settle(driver, lambda d: d.execute_script(PAGE_SETTLED_JS), timeout)
+        time.sleep(random.uniform(*SETTLE_JITTER))
+    
+    def _get_drivers(self, count: int) -> List:
+        """
+        Return up to `count` browser sessions, starting any missing.
+        
+        If an extra session fails to start, the ones already running are
+        used; only a failure to start the first session is raised.
+        
+        Args:
+            count: Number of sessions wanted
+            
+        Returns:
+            List of Selenium WebDrivers
+        """
+        while len(self._drivers) < count:
+            try:
+                driver = self._setup_driver()
+            except Exception as e:
+                if not self._drivers:
+                    raise
+                logger.warning(f"Could not start another ZipRecruiter browser, using {len(self._drivers)}: {e}")
+                break
+            
+            if not self._drivers:
+                atexit.register(self.close)
+            self._drivers.append(driver)
+        
+        return self._drivers[:count]
+    
+    def close(self):
+        """Quit all browser sessions."""
+        for driver in self._drivers:
+            try:
+                driver.quit()
+            except Exception as e:
+                logger.debug(f"Error quitting browser: {e}")
+        self._drivers = []
+    
     def scrape_jobs(self) -> List[Dict[str, Any]]:
         """
         Scrape job listings from ZipRecruiter.
@@ -87,39 +351,75 @@ class ZipRecruiterScraper:
             List of job dictionaries
         """
         jobs = []
-        
-        driver = self._setup_driver()
+        # Keys of jobs already scraped; the same job shows up across searches
+        seen_jobs = set()
+        self._seen_urls.clear()
         
         try:
             # Get job search parameters
             job_titles = self.job_search.get('job_titles', [])
             locations = self.job_search.get('locations', [])
             
-            # Search for jobs for each job title and location combination
-            for job_title in job_titles:
-                for location in locations:
-                    logger.info(f"Searching for {job_title} jobs in {location}")
-                    
-                    # Search for jobs
-                    jobs_for_search = self._search_jobs(driver, job_title, location)
-                    
-                    # Add jobs to the list
-                    jobs.extend(jobs_for_search)
-                    
-                    # Add random delay between searches
-                    HumanBehavior.random_delay(2.0, 5.0)
+            # Build every search's results URL up front
+            searches = [
+                (job_title, location, self._search_url(job_title, location))
+                for job_title in job_titles
+                for location in locations
+            ]
+            
+            if not searches:
+                return jobs
+            
+            # Run the searches in parallel, one browser per worker
+            drivers = self._get_drivers(min(self.search_workers, len(searches)))
+            driver_pool = queue.Queue()
+            for driver in drivers:
+                driver_pool.put(driver)
+            
+            with ThreadPoolExecutor(max_workers=len(drivers)) as executor:
+                results = executor.map(lambda search: self._search_with_pool(driver_pool, *search), searches)
+                
+                for jobs_for_search in results:
+                    # Add jobs not already found by an earlier search
+                    for job in jobs_for_search:
+                        key = job.get('url') or (job.get('company_name', '').lower(), job.get('title', '').lower())
+                        if key not in seen_jobs:
+                            seen_jobs.add(key)
+                            jobs.append(job)
             
             logger.info(f"Scraped {len(jobs)} jobs from ZipRecruiter")
             
         except Exception as e:
             logger.error(f"Error scraping ZipRecruiter jobs: {e}")
         
-        finally:
-            driver.quit()
-        
         return jobs
     
-    def _search_jobs(self, driver, job_title: str, location: str) -> List[Dict[str, Any]]:
+    def _search_with_pool(self, driver_pool: queue.Queue, job_title: str, location: str, search_url: str) -> List[Dict[str, Any]]:
+        """
+        Run one search on a browser checked out of the pool.
+        
+        Args:
+            driver_pool: Queue of idle WebDrivers
+            job_title: Job title to search for
+            location: Location to search in
+            search_url: Results page to open directly
+            
+        Returns:
+            List of job dictionaries
+        """
+        driver = driver_pool.get()
+        try:
+            logger.info(f"Searching for {job_title} jobs in {location}")
+            jobs = self._search_jobs(driver, job_title, location, search_url=search_url)
+            
+            # Add random delay before this browser's next search
+            HumanBehavior.random_delay(2.0, 5.0)
+            
+            return jobs
+        finally:
+            driver_pool.put(driver)
+    
+    def _search_jobs(self, driver, job_title: str, location: str, search_url: Optional[str] = None) -> List[Dict[str, Any]]:
         """
         Search for jobs on ZipRecruiter.
         
@@ -127,6 +427,8 @@ class ZipRecruiterScraper:
             driver: Selenium WebDriver
             job_title: Job title to search for
             location: Location to search in
+            search_url: Results page to open directly; the search form is used
+                if it is None or the results don't load
             
         Returns:
             List of job dictionaries
@@ -134,44 +436,47 @@ class ZipRecruiterScraper:
         jobs = []
         
         try:
-            # Navigate to ZipRecruiter
-            driver.get("https://www.ziprecruiter.com/")
-            logger.info("Navigated to ZipRecruiter")
-            
-            # Wait for the search form to load
-            WebDriverWait(driver, self.timeout).until(
-                EC.presence_of_element_located((By.ID, "keyword"))
-            )
-            
-            # Enter job title with human-like typing
-            job_title_field = driver.find_element(By.ID, "keyword")
-            HumanBehavior.human_like_typing(job_title_field, job_title)
-            
-            # Pause briefly like a human would after entering job title
-            HumanBehavior.random_delay(0.8, 1.5)
-            
-            # Enter location with human-like typing
-            location_field = driver.find_element(By.ID, "location")
-            location_field.clear()
-            HumanBehavior.human_like_typing(location_field, location)
-            
-            # Random delay before clicking search to simulate human thinking
-            HumanBehavior.random_delay(0.5, 1.5)
-            
-            # Find and click the search button with human-like movement
-            search_button = driver.find_element(By.CSS_SELECTOR, "button[type='submit']")
-            HumanBehavior.human_like_click(driver, search_button)
-            
-            # Wait for search results to load
-            WebDriverWait(driver, self.timeout).until(
-                EC.presence_of_element_located((By.CSS_SELECTOR, "article.job_result"))
-            )
-            
-            # Apply filters
-            self._apply_filters(driver)
-            
-            # Wait for filtered results to load
-            HumanBehavior.random_delay(2.0, 4.0)
+            # Open the filtered results page directly, falling back to the
+            # search form and clicking through the filters
+            if search_url and self._open_search_url(driver, search_url):
+                # Only filters the URL can't carry need the dropdowns
+                self._apply_filters(driver, UI_ONLY_FILTERS)
+            else:
+                # Navigate to ZipRecruiter
+                driver.get("https://www.ziprecruiter.com/")
+                logger.info("Navigated to ZipRecruiter")
+                
+                # Wait for the search form to load
+                self._wait(driver).until(
+                    EC.presence_of_element_located((By.ID, "keyword"))
+                )
+                
+                # Enter job title with human-like typing
+                job_title_field = driver.find_element(By.ID, "keyword")
+                HumanBehavior.human_like_typing(job_title_field, job_title, fast_mode=self.browser_config.get('fast_typing', False))
+                
+                # Pause briefly like a human would after entering job title
+                HumanBehavior.random_delay(0.8, 1.5)
+                
+                # Enter location with human-like typing
+                location_field = driver.find_element(By.ID, "location")
+                location_field.clear()
+                HumanBehavior.human_like_typing(location_field, location, fast_mode=self.browser_config.get('fast_typing', False))
+                
+                # Random delay before clicking search to simulate human thinking
+                HumanBehavior.random_delay(0.5, 1.5)
+                
+                # Find and click the search button with human-like movement
+                search_button = driver.find_element(By.CSS_SELECTOR, "button[type='submit']")
+                HumanBehavior.human_like_click(driver, search_button)
+                
+                # Wait for search results to load
+                self._wait(driver).until(
+                    EC.presence_of_element_located((By.CSS_SELECTOR, "article.job_result"))
+                )
+                
+                # Apply filters
+                self._apply_filters(driver)
             
             # Scroll through results to load more jobs
             self._scroll_through_results(driver)
@@ -180,21 +485,41 @@ class ZipRecruiterScraper:
             job_listings = driver.find_elements(By.CSS_SELECTOR, "article.job_result")
             logger.info(f"Found {len(job_listings)} job listings")
             
-            # Process each job listing
-            for job_listing in job_listings:
-                try:
-                    # Extract job information
-                    job = self._extract_job_info(driver, job_listing)
-                    
-                    # Add source information
-                    job['source'] = 'ZipRecruiter'
-                    
-                    # Add job to the list
-                    jobs.append(job)
-                    
-                except Exception as e:
-                    logger.error(f"Error extracting job info: {e}")
-                    continue
+            # Card-level fields for every listing in one call, falling back
+            # to reading each card if the results changed in between
+            cards = self._extract_cards(driver)
+            if len(cards) != len(job_listings):
+                cards = [self._extract_job_info(driver, job_listing, open_details=False) for job_listing in job_listings]
+            
+            # Skip listings already scraped, including sponsored jobs shown
+            # more than once on the same page
+            new_listings = [
+                (job_listing, card) for job_listing, card in zip(job_listings, cards)
+                if self._claim_job_url(card.get('url'))
+            ]
+            if len(new_listings) < len(job_listings):
+                logger.info(f"Skipping {len(job_listings) - len(new_listings)} jobs already scraped")
+            job_listings = [job_listing for job_listing, _ in new_listings]
+            cards = [card for _, card in new_listings]
+            
+            # Fetch the detail pages concurrently; only those that could not be
+            # fetched are opened in the browser
+            self._fetch_job_details(driver, cards)
+            
+            for job, job_listing in zip(cards, job_listings):
+                if 'description' not in job:
+                    try:
+                        self._open_job_details(driver, job_listing, job)
+                    except Exception as e:
+                        logger.error(f"Error extracting job details: {e}")
+                        job['description'] = ""
+                        job['easy_apply'] = False
+                
+                # Add source information
+                job['source'] = 'ZipRecruiter'
+                
+                # Add job to the list
+                jobs.append(job)
             
             logger.info(f"Extracted {len(jobs)} jobs from search results")
             
@@ -203,124 +528,76 @@ class ZipRecruiterScraper:
         
         return jobs
     
-    def _apply_filters(self, driver):
+    def _claim_job_url(self, url: Optional[str]) -> bool:
+        """
+        Record a job URL as scraped, unless another listing already has.
+        
+        Args:
+            url: Job URL from the result card; listings without one are
+                always kept
+            
+        Returns:
+            True if the job should be scraped, False if it is a duplicate
+        """
+        if not url:
+            return True
+        with self._seen_urls_lock:
+            if url in self._seen_urls:
+                return False
+            self._seen_urls.add(url)
+            return True
+    
+    def _apply_filters(self, driver, filters=SEARCH_FILTERS):
         """
         Apply filters to the job search.
         
         Args:
             driver: Selenium WebDriver
+            filters: Filter dropdowns to apply, as in SEARCH_FILTERS
         """
         try:
-            # Apply date posted filter (Last 7 days)
-            try:
-                date_filter_button = WebDriverWait(driver, self.timeout).until(
-                    EC.element_to_be_clickable((By.XPATH, "//button[contains(text(), 'Date Posted')]"))
-                )
-                HumanBehavior.human_like_click(driver, date_filter_button)
-                
-                # Wait for dropdown to appear
-                HumanBehavior.random_delay(0.5, 1.0)
-                
-                # Click on "Last 7 days" option
-                last_7_days_option = WebDriverWait(driver, self.timeout).until(
-                    EC.element_to_be_clickable((By.XPATH, "//label[contains(text(), 'Last 7 days')]"))
-                )
-                HumanBehavior.human_like_click(driver, last_7_days_option)
-                
-                # Click on "Apply" button
-                apply_button = WebDriverWait(driver, self.timeout).until(
-                    EC.element_to_be_clickable((By.XPATH, "//button[contains(text(), 'Apply')]"))
-                )
-                HumanBehavior.human_like_click(driver, apply_button)
-                
-                logger.info("Applied Date Posted filter")
-                HumanBehavior.random_delay(1.0, 2.0)
-            except Exception as e:
-                logger.warning(f"Could not apply Date Posted filter: {e}")
-            
-            # Apply job type filter (Full-time)
-            try:
-                job_type_button = WebDriverWait(driver, self.timeout).until(
-                    EC.element_to_be_clickable((By.XPATH, "//button[contains(text(), 'Job Type')]"))
-                )
-                HumanBehavior.human_like_click(driver, job_type_button)
-                
-                # Wait for dropdown to appear
-                HumanBehavior.random_delay(0.5, 1.0)
-                
-                # Click on "Full-time" option
-                full_time_option = WebDriverWait(driver, self.timeout).until(
-                    EC.element_to_be_clickable((By.XPATH, "//label[contains(text(), 'Full-time')]"))
-                )
-                HumanBehavior.human_like_click(driver, full_time_option)
-                
-                # Click on "Apply" button
-                apply_button = WebDriverWait(driver, self.timeout).until(
-                    EC.element_to_be_clickable((By.XPATH, "//button[contains(text(), 'Apply')]"))
-                )
-                HumanBehavior.human_like_click(driver, apply_button)
-                
-                logger.info("Applied Job Type filter")
-                HumanBehavior.random_delay(1.0, 2.0)
-            except Exception as e:
-                logger.warning(f"Could not apply Job Type filter: {e}")
-            
-            # Apply salary filter ($60,000+)
-            try:
-                salary_button = WebDriverWait(driver, self.timeout).until(
-                    EC.element_to_be_clickable((By.XPATH, "//button[contains(text(), 'Salary')]"))
-                )
-                HumanBehavior.human_like_click(driver, salary_button)
-                
-                # Wait for dropdown to appear
-                HumanBehavior.random_delay(0.5, 1.0)
-                
-                # Click on "$60,000+" option
-                salary_option = WebDriverWait(driver, self.timeout).until(
-                    EC.element_to_be_clickable((By.XPATH, "//label[contains(text(), '$60,000+')]"))
-                )
-                HumanBehavior.human_like_click(driver, salary_option)
-                
-                # Click on "Apply" button
-                apply_button = WebDriverWait(driver, self.timeout).until(
-                    EC.element_to_be_clickable((By.XPATH, "//button[contains(text(), 'Apply')]"))
-                )
-                HumanBehavior.human_like_click(driver, apply_button)
-                
-                logger.info("Applied Salary filter")
-                HumanBehavior.random_delay(1.0, 2.0)
-            except Exception as e:
-                logger.warning(f"Could not apply Salary filter: {e}")
+            for button_text, option_text, name in filters:
+                self._apply_dropdown_filter(driver, button_text, option_text, name)
+        except Exception as e:
+            logger.error(f"Error applying filters: {e}")
+    
+    def _apply_dropdown_filter(self, driver, button_text: str, option_text: str, name: str):
+        """
+        Open a filter dropdown, pick an option and apply it.
+        
+        Args:
+            driver: Selenium WebDriver
+            button_text: Text of the dropdown button
+            option_text: Text of the option's label
+            name: Filter name for logging
+        """
+        try:
+            filter_button = self._wait(driver).until(
+                EC.element_to_be_clickable((By.XPATH, f"//button[contains(text(), '{button_text}')]"))
+            )
+            HumanBehavior.human_like_click(driver, filter_button)
             
-            # Apply experience level filter (Entry level)
-            try:
-                experience_button = WebDriverWait(driver, self.timeout).until(
-                    EC.element_to_be_clickable((By.XPATH, "//button[contains(text(), 'Experience')]"))
-                )
-                HumanBehavior.human_like_click(driver, experience_button)
-                
-                # Wait for dropdown to appear
-                HumanBehavior.random_delay(0.5, 1.0)
-                
-                # Click on "Entry level" option
-                entry_level_option = WebDriverWait(driver, self.timeout).until(
-                    EC.element_to_be_clickable((By.XPATH, "//label[contains(text(), 'Entry level')]"))
-                )
-                HumanBehavior.human_like_click(driver, entry_level_option)
-                
-                # Click on "Apply" button
-                apply_button = WebDriverWait(driver, self.timeout).until(
-                    EC.element_to_be_clickable((By.XPATH, "//button[contains(text(), 'Apply')]"))
-                )
-                HumanBehavior.human_like_click(driver, apply_button)
-                
-                logger.info("Applied Experience Level filter")
-                HumanBehavior.random_delay(1.0, 2.0)
-            except Exception as e:
-                logger.warning(f"Could not apply Experience Level filter: {e}")
+            # Click on the option once the dropdown shows it
+            option = self._wait(driver).until(
+                EC.element_to_be_clickable((By.XPATH, f"//label[contains(text(), '{option_text}')]"))
+            )
+            HumanBehavior.human_like_click(driver, option)
             
+            # Click on "Apply" button, remembering the unfiltered page so the
+            # wait below can tell when it has been replaced
+            apply_button = self._wait(driver).until(
+                EC.element_to_be_clickable((By.XPATH, "//button[contains(text(), 'Apply')]"))
+            )
+            old_url = driver.current_url
+            old_cards = driver.find_elements(By.CSS_SELECTOR, "article.job_result")
+            HumanBehavior.human_like_click(driver, apply_button)
+            
+            # Wait for the dropdown to close and the filtered results to load
+            self._settle(driver, EC.invisibility_of_element(apply_button))
+            self._wait_settled(driver, old_url, old_cards[0] if old_cards else None)
+            logger.info(f"Applied {name} filter")
         except Exception as e:
-            logger.error(f"Error applying filters: {e}")
+            logger.warning(f"Could not apply {name} filter: {e}")
     
     def _scroll_through_results(self, driver):
         """
@@ -330,24 +607,198 @@ class ZipRecruiterScraper:
             driver: Selenium WebDriver
         """
         try:
-            # Scroll down a few times to load more results
-            for _ in range(5):
+            count = driver.execute_script(RESULT_COUNT_JS)
+            
+            # Scroll until the results stop growing
+            stable = 0
+            for _ in range(MAX_RESULT_SCROLLS):
                 # Scroll down with human-like behavior
                 HumanBehavior.scroll_page(driver, "down")
                 
                 # Wait for new results to load
-                HumanBehavior.random_delay(1.0, 2.0)
+                previous = count
+                if self._settle(driver, lambda d: d.execute_script(RESULT_COUNT_JS) > previous, SCROLL_LOAD_TIMEOUT):
+                    stable = 0
+                    count = driver.execute_script(RESULT_COUNT_JS)
+                else:
+                    stable += 1
+                    if stable >= SCROLL_STABLE_LIMIT:
+                        break
         
         except Exception as e:
             logger.error(f"Error scrolling through results: {e}")
     
-    def _extract_job_info(self, driver, job_listing) -> Dict[str, Any]:
+    def _extract_cards(self, driver) -> List[Dict[str, Any]]:
+        """
+        Extract the card-level fields of every result with one script call.
+        
+        Args:
+            driver: Selenium WebDriver
+            
+        Returns:
+            Job dictionaries in result order (empty on failure)
+        """
+        try:
+            cards = driver.execute_script(CARDS_JS)
+        except Exception as e:
+            logger.warning(f"Could not read job cards: {e}")
+            return []
+        
+        jobs = []
+        for card in cards:
+            job = {key: card.get(key) or default for key, default in CARD_DEFAULTS.items()}
+            
+            # Set default H1B sponsorship to False (will be checked later)
+            job['sponsors_h1b'] = False
+            jobs.append(job)
+        return jobs
+    
+    def _fetch_job_details(self, driver, jobs: List[Dict[str, Any]]):
+        """
+        Fetch job descriptions concurrently over HTTP.
+        
+        The browser's cookies are reused so the requests look like the same
+        visitor. Jobs whose page could not be fetched are left without a
+        'description' key.
+        
+        Args:
+            driver: Selenium WebDriver
+            jobs: Job dictionaries to update in place
+        """
+        targets = [job for job in jobs if job.get('url')]
+        if not targets:
+            return
+        
+        # A failure here leaves the cards without descriptions rather than
+        # losing every card collected for the search
+        try:
+            cookies = {cookie['name']: cookie['value'] for cookie in driver.get_cookies()}
+            details = asyncio.run(self._fetch_all_details([job['url'] for job in targets], cookies))
+        except Exception as e:
+            logger.warning(f"Could not fetch ZipRecruiter job pages: {e}")
+            return
+        
+        for job, detail in zip(targets, details):
+            if detail:
+                job.update(detail)
+        
+        fetched = sum(1 for job in targets if 'description' in job)
+        logger.info(f"Fetched {fetched}/{len(targets)} job descriptions over HTTP")
+    
+    async def _fetch_all_details(self, urls: List[str], cookies: Dict[str, str]) -> List[Optional[Dict[str, Any]]]:
+        """
+        Fetch and parse several job detail pages on one async HTTP client.
+        
+        Args:
+            urls: Job URLs
+            cookies: Cookies to send with every request
+            
+        Returns:
+            Parsed details (or None) for each URL, in order
+        """
+        async with httpx.AsyncClient(
+            headers={'User-Agent': self.user_agent},
+            cookies=cookies,
+            limits=httpx.Limits(max_connections=DESCRIPTION_CONNECTIONS),
+            timeout=self.timeout,
+            follow_redirects=True,
+        ) as client:
+            return await asyncio.gather(*(self._fetch_job_detail(client, url) for url in urls))
+    
+    async def _fetch_job_detail(self, client: httpx.AsyncClient, url: str) -> Optional[Dict[str, Any]]:
+        """
+        Fetch a job's detail page and extract its description.
+        
+        Args:
+            client: Async HTTP client
+            url: Job URL
+            
+        Returns:
+            Dictionary with 'description' and 'easy_apply', or None if the page
+            could not be fetched or has no description
+        """
+        try:
+            response = await client.get(url)
+            if response.status_code != 200:
+                return None
+            return self._parse_job_detail(response.text)
+        except Exception as e:
+            logger.debug(f"Could not fetch job details from {url}: {e}")
+            return None
+    
+    @staticmethod
+    def _parse_job_detail(html: str) -> Optional[Dict[str, Any]]:
+        """
+        Extract the description and Easy Apply flag from a job detail page.
+        
+        Args:
+            html: Page HTML
+            
+        Returns:
+            Dictionary with 'description' and 'easy_apply', or None if the page
+            has no job description
+        """
+        if HTMLParser is not None:
+            tree = HTMLParser(html)
+            description_node = tree.css_first("div.job_description")
+            if description_node is None:
+                return None
+            apply_node = tree.css_first("button.apply_now")
+            return {
+                'description': description_node.text(separator="\n", strip=True),
+                'easy_apply': apply_node is not None and "Apply Now" in apply_node.text(),
+            }
+        
+        soup = BeautifulSoup(html, 'lxml')
+        description_element = soup.select_one("div.job_description")
+        if description_element is None:
+            return None
+        
+        apply_element = soup.select_one("button.apply_now")
+        return {
+            'description': description_element.get_text("\n", strip=True),
+            'easy_apply': apply_element is not None and "Apply Now" in apply_element.get_text(),
+        }
+    
+    def _open_job_details(self, driver, job_listing, job: Dict[str, Any]):
+        """
+        Click a job listing and read its description from the details pane.
+        
+        Args:
+            driver: Selenium WebDriver
+            job_listing: Job listing element
+            job: Job dictionary to update in place
+        """
+        # Click on job listing to view details
+        HumanBehavior.human_like_click(driver, job_listing)
+        
+        # Wait for job details to load
+        self._wait(driver).until(
+            EC.presence_of_element_located((By.CSS_SELECTOR, "div.job_description"))
+        )
+        
+        # Extract job description
+        try:
+            description_element = driver.find_element(By.CSS_SELECTOR, "div.job_description")
+            job['description'] = description_element.text.strip()
+        except NoSuchElementException:
+            job['description'] = ""
+        
+        # Check if job has Easy Apply
+        try:
+            apply_button = driver.find_element(By.CSS_SELECTOR, "button.apply_now")
+            job['easy_apply'] = "Apply Now" in apply_button.text
+        except NoSuchElementException:
+            job['easy_apply'] = False
+    
+    def _extract_job_info(self, driver, job_listing, open_details: bool = True) -> Dict[str, Any]:
         """
         Extract job information from a job listing.
         
         Args:
             driver: Selenium WebDriver
             job_listing: Job listing element
+            open_details: Whether to click the listing and read its description
             
         Returns:
             Job dictionary
@@ -397,27 +848,8 @@ class ZipRecruiterScraper:
             except NoSuchElementException:
                 job['date_posted'] = ""
             
-            # Click on job listing to view details
-            HumanBehavior.human_like_click(driver, job_listing)
-            
-            # Wait for job details to load
-            WebDriverWait(driver, self.timeout).until(
-                EC.presence_of_element_located((By.CSS_SELECTOR, "div.job_description"))
-            )
-            
-            # Extract job description
-            try:
-                description_element = driver.find_element(By.CSS_SELECTOR, "div.job_description")
-                job['description'] = description_element.text.strip()
-            except NoSuchElementException:
-                job['description'] = ""
-            
-            # Check if job has Easy Apply
-            try:
-                apply_button = driver.find_element(By.CSS_SELECTOR, "button.apply_now")
-                job['easy_apply'] = "Apply Now" in apply_button.text
-            except NoSuchElementException:
-                job['easy_apply'] = False
+            if open_details:
+                self._open_job_details(driver, job_listing, job)
             
             # Set default H1B sponsorship to False (will be checked later)
             job['sponsors_h1b'] = False
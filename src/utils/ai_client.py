@@ -15,17 +15,65 @@ Usage:
         max_tokens=200,
     )
 
+Several independent prompts can be sent concurrently with `chat_many`, which
+takes a list of `chat()` keyword-argument dicts and returns the texts in order.
+
+Passing `stop_pattern` (a compiled regex) streams the response and stops
+reading as soon as the pattern appears, returning only the text before it.
+
+The underlying HTTP connection is kept alive (HTTP/2 when the `h2` package is
+installed) and reused by every call made through the same AIClient.
+
 The API key is resolved (in order) from:
     1. config['AI_SETTINGS']['api_key']
     2. the OPENAI_API_KEY environment variable
 """
 
 import os
+import asyncio
 import logging
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, Pattern
 
 logger = logging.getLogger(__name__)
 
+# Idle keep-alive connections to hold open to the OpenAI API
+MAX_KEEPALIVE_CONNECTIONS = 4
+
+
+class _StreamCollector:
+    """Accumulates streamed deltas and detects an early-stop pattern."""
+
+    # How much already-received text is re-scanned with each new delta, so a
+    # stop pattern split across chunk boundaries is still found.
+    TAIL_CHARS = 200
+
+    def __init__(self, stop_pattern: Pattern):
+        self.stop_pattern = stop_pattern
+        self.chunks: List[str] = []
+        self.length = 0
+        self.tail = ""
+        self.cut: Optional[int] = None
+
+    def feed(self, chunk) -> bool:
+        """Add one stream chunk; return True once the stop pattern is seen."""
+        delta = (chunk.choices[0].delta.content or "") if chunk.choices else ""
+        if not delta:
+            return False
+        self.chunks.append(delta)
+        self.length += len(delta)
+        self.tail = (self.tail + delta)[-(self.TAIL_CHARS + len(delta)):]
+        match = self.stop_pattern.search(self.tail)
+        if match:
+            self.cut = self.length - len(self.tail) + match.start()
+            return True
+        return False
+
+    def text(self) -> str:
+        text = "".join(self.chunks)
+        if self.cut is not None:
+            text = text[:self.cut]
+        return text.strip()
+
 
 class AIClient:
     """Thin wrapper around the OpenAI chat completions API."""
@@ -53,8 +101,11 @@ class AIClient:
         """Lazily construct and cache the OpenAI client."""
         if self._client is None and self.api_key:
             try:
-                from openai import OpenAI
-                self._client = OpenAI(api_key=self.api_key)
+                from openai import OpenAI, DefaultHttpxClient
+                self._client = OpenAI(
+                    api_key=self.api_key,
+                    http_client=self._http_client(DefaultHttpxClient),
+                )
             except Exception as e:  # ImportError or client init error
                 logger.error(f"Could not initialize OpenAI client: {e}")
                 self._client = None
@@ -67,10 +118,14 @@ class AIClient:
         temperature: float = 0.7,
         max_tokens: int = 1000,
         model: Optional[str] = None,
+        stop_pattern: Optional[Pattern] = None,
     ) -> str:
         """
         Run a single-turn chat completion and return the response text.
 
+        If `stop_pattern` is given the response is streamed and reading stops
+        at the first match; only the text before the match is returned.
+
         Returns an empty string on any failure so callers can fall back
         gracefully rather than crashing the application flow.
         """
@@ -78,19 +133,111 @@ class AIClient:
             logger.error("AIClient.chat called but no OpenAI client is available.")
             return ""
 
-        messages: List[Dict[str, str]] = []
-        if system:
-            messages.append({"role": "system", "content": system})
-        messages.append({"role": "user", "content": user})
-
         try:
             response = self.client.chat.completions.create(
                 model=model or self.model,
-                messages=messages,
+                messages=self._build_messages(user, system),
                 temperature=temperature,
                 max_tokens=max_tokens,
+                stream=stop_pattern is not None,
             )
-            return (response.choices[0].message.content or "").strip()
+            if stop_pattern is None:
+                return (response.choices[0].message.content or "").strip()
+
+            collector = _StreamCollector(stop_pattern)
+            try:
+                for chunk in response:
+                    if collector.feed(chunk):
+                        break
+            finally:
+                response.close()
+            return collector.text()
         except Exception as e:
             logger.error(f"OpenAI chat completion failed: {e}")
             return ""
+
+    def chat_many(self, requests: List[Dict[str, Any]]) -> List[str]:
+        """
+        Run several chat completions concurrently and return their texts in
+        the same order as `requests`.
+
+        Each request is a dict of `chat()` keyword arguments. Like `chat()`,
+        a failed request yields an empty string.
+        """
+        if not requests:
+            return []
+        if not self.available:
+            logger.error("AIClient.chat_many called but no OpenAI client is available.")
+            return [""] * len(requests)
+
+        try:
+            return asyncio.run(self._chat_many(requests))
+        except Exception as e:  # e.g. called from inside a running event loop
+            logger.warning(f"Concurrent chat failed, falling back to sequential calls: {e}")
+            return [self.chat(**request) for request in requests]
+
+    async def _chat_many(self, requests: List[Dict[str, Any]]) -> List[str]:
+        """Fan the requests out on one AsyncOpenAI client bound to this event loop."""
+        from openai import AsyncOpenAI, DefaultAsyncHttpxClient
+        async with AsyncOpenAI(
+            api_key=self.api_key,
+            http_client=self._http_client(DefaultAsyncHttpxClient),
+        ) as client:
+            return await asyncio.gather(*(self._achat(client, **request) for request in requests))
+
+    async def _achat(
+        self,
+        client,
+        user: str,
+        system: Optional[str] = None,
+        temperature: float = 0.7,
+        max_tokens: int = 1000,
+        model: Optional[str] = None,
+        stop_pattern: Optional[Pattern] = None,
+    ) -> str:
+        """Async counterpart of `chat()` using the given AsyncOpenAI client."""
+        try:
+            response = await client.chat.completions.create(
+                model=model or self.model,
+                messages=self._build_messages(user, system),
+                temperature=temperature,
+                max_tokens=max_tokens,
+                stream=stop_pattern is not None,
+            )
+            if stop_pattern is None:
+                return (response.choices[0].message.content or "").strip()
+
+            collector = _StreamCollector(stop_pattern)
+            try:
+                async for chunk in response:
+                    if collector.feed(chunk):
+                        break
+            finally:
+                await response.close()
+            return collector.text()
+        except Exception as e:
+            logger.error(f"OpenAI chat completion failed: {e}")
+            return ""
+
+    @staticmethod
+    def _http_client(client_class):
+        """
+        Build a keep-alive httpx client for the OpenAI SDK, using HTTP/2 when
+        the optional `h2` package is installed (HTTP/1.1 otherwise).
+        """
+        import httpx
+        limits = httpx.Limits(max_keepalive_connections=MAX_KEEPALIVE_CONNECTIONS)
+        try:
+            return client_class(http2=True, limits=limits)
+        except ImportError:
+            logger.debug("h2 not installed; using HTTP/1.1 keep-alive for OpenAI calls")
+            return client_class(limits=limits)
+
+    @staticmethod
+    def _build_messages(user: str, system: Optional[str] = None) -> List[Dict[str, str]]:
+        """Build the message list for a single-turn chat."""
+        messages: List[Dict[str, str]] = []
+        if system:
+            messages.append({"role": "system", "content": system})
+        messages.append({"role": "user", "content": user})
+        return messages
@@ -1,33 +1,133 @@
+import asyncio
 import logging
+import os
 import re
-import socket
+import shelve
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from typing import Any, Dict, List, Optional
 from urllib.parse import urlparse
 
+import dns.resolver
+import httpx
 import requests
 from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
 from selenium import webdriver
 from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.common.by import By
 from selenium.webdriver.remote.webdriver import WebDriver
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.support.ui import WebDriverWait
+from urllib3.util.retry import Retry
 
 from src.utils.email_pattern_finder import EmailPatternFinder
 
 logger = logging.getLogger(__name__)
 
+# Company site pages likely to list people, fetched concurrently
+COMPANY_PAGE_PATHS = ["/about", "/about-us", "/contact", "/contact-us", "/team", "/our-team"]
+
+# Concurrent connections to one company site
+COMPANY_PAGE_CONNECTIONS = 6
+
+# Retries of a page that failed with a server error, and the delay before the
+# first retry in seconds (doubled for each further retry)
+PAGE_FETCH_RETRIES = 2
+PAGE_RETRY_BACKOFF = 0.5
+
+# Bytes of a company page read at most; names and titles sit in the first
+# few kilobytes of markup, and the rest is often inlined scripts and media
+MAX_PAGE_BYTES = 512 * 1024
+
+# On-disk cache of company domains (by company name) and of the people found
+# on company sites (by domain), shared across runs. Empty results expire
+# sooner so a company whose site was down is retried the next day
+CONTACT_CACHE_PATH = "data_folder/.company_contacts_cache"
+CONTACT_CACHE_TTL = 7 * 24 * 60 * 60
+CONTACT_CACHE_EMPTY_TTL = 24 * 60 * 60
+
+# Domains tried for a company before searching the web, filled with the
+# company name reduced to letters and digits, and seconds to wait for each
+DOMAIN_GUESSES = ["{}.com", "www.{}.com", "{}.io", "{}.ai"]
+DOMAIN_GUESS_TIMEOUT = 5
+
+# Legal suffixes dropped from a company name before guessing its domain
+COMPANY_SUFFIX_RE = re.compile(r"[\s,]+(inc|llc|ltd|corp|corporation|co|company|group)\.?$", re.IGNORECASE)
+
+# Tags that hold a person's name on team pages
+NAME_TAGS = ["h1", "h2", "h3", "h4", "h5", "h6", "p"]
+
+# Text that marks a "name" element as contact details rather than a person
+CONTACT_DETAIL_RE = re.compile(r"(email|phone|tel|fax|website)", re.IGNORECASE)
+
+# Seconds to wait for a DNS answer when checking a mail domain
+DNS_LIFETIME = 3
+
+# Shared resolver, so /etc/resolv.conf is read once
+_resolver = dns.resolver.Resolver(configure=True)
+
+# Threads running mail-domain lookups in the background
+DNS_WORKERS = 4
+_dns_pool = ThreadPoolExecutor(max_workers=DNS_WORKERS, thread_name_prefix="mx-lookup")
+
+
+def _is_name_or_title_class(css_class: Optional[str]) -> bool:
+    """Class filter for elements holding a person's name or title."""
+    if not css_class:
+        return False
+    css_class = css_class.lower()
+    return "name" in css_class or "title" in css_class
+
+
+def _is_title_class(css_class: Optional[str]) -> bool:
+    """Class filter for elements holding a person's title."""
+    return bool(css_class) and "title" in css_class.lower()
+
+
+@lru_cache(maxsize=4096)
+def domain_accepts_mail(domain: str) -> bool:
+    """
+    Check whether a domain can receive email.
+    
+    A domain without MX records still accepts mail at its A record, so that
+    counts too.
+    
+    Args:
+        domain: Mail domain
+        
+    Returns:
+        True if the domain has MX (or, failing that, A) records
+    """
+    try:
+        _resolver.resolve(domain, 'MX', lifetime=DNS_LIFETIME)
+        return True
+    except dns.resolver.NoAnswer:
+        pass
+    except Exception:
+        return False
+    
+    try:
+        _resolver.resolve(domain, 'A', lifetime=DNS_LIFETIME)
+        return True
+    except Exception:
+        return False
+
+
 class CompanyContactFinder:
     """
     A class to find contact information for companies.
     """
     
-    def __init__(self, config: Dict[str, Any]):
+    def __init__(self, config: Dict[str, Any], refresh: bool = False):
         """
         Initialize the company contact finder.
         
         Args:
             config: Configuration dictionary
+            refresh: Look everything up again instead of using cached results;
+                the fresh results are still written to the cache
         """
         self.config = config
         self.browser_config = config.get('BROWSER', {})
@@ -45,6 +145,18 @@ class CompanyContactFinder:
         
         # Cache for company domains
         self.company_domains = {}
+        self.refresh = refresh
+        
+        # Keep-alive session for the synchronous requests, retrying gateway errors
+        self._http = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=32,
+            pool_maxsize=32,
+            max_retries=Retry(total=3, backoff_factor=0.5, status_forcelist=[502, 503, 504]),
+        )
+        self._http.mount('https://', adapter)
+        self._http.mount('http://', adapter)
+        self._http.headers.update({'User-Agent': self.user_agent})
 
     def find_company_contacts(self, company_name: str, company_website: str = "") -> List[Dict[str, str]]:
         """
@@ -65,12 +177,24 @@ class CompanyContactFinder:
             logger.warning(f"Could not find domain for {company_name}")
             return contacts
         
+        # Every address at the domain shares its mail servers, so one lookup
+        # decides for all contacts; it runs while the website is scraped
+        accepts_mail = _dns_pool.submit(domain_accepts_mail, domain)
+        
         # 2. Scrape company website for names and titles
         names_and_titles = self._scrape_company_website(domain)
         
-        # 3. Generate email addresses
+        if not names_and_titles:
+            return contacts
+        
+        if not accepts_mail.result():
+            logger.warning(f"{domain} does not accept email")
+            return contacts
+        
+        # 3. Generate email addresses, all in the domain's format
+        format_type = self.email_pattern_finder.find_email_pattern(domain, domain)
         for name, title in names_and_titles:
-            email = self._generate_email(name, domain)
+            email = self._generate_email(name, domain, format_type)
             if email:
                 contacts.append({"name": name, "title": title, "email": email})
         
@@ -100,15 +224,66 @@ class CompanyContactFinder:
         if company_name in self.company_domains:
             return self.company_domains[company_name]
         
+        cached = self._cache_get(f"domain:{company_name}")
+        if cached is not None:
+            self.company_domains[company_name] = cached
+            return cached
+        
+        domain = self._guess_company_domain(company_name) or self._search_company_domain(company_name)
+        self._cache_set(f"domain:{company_name}", domain)
+        if domain:
+            self.company_domains[company_name] = domain
+        return domain
+
+    def _guess_company_domain(self, company_name: str) -> str:
+        """
+        Find the company domain by trying the usual domains for its name.
+        
+        Args:
+            company_name: Name of the company
+            
+        Returns:
+            The company domain name, or "" if none of the guesses answered.
+        """
+        slug = re.sub(r"[^a-z0-9]", "", COMPANY_SUFFIX_RE.sub("", company_name.strip()).lower())
+        if not slug:
+            return ""
+        
+        for guess in DOMAIN_GUESSES:
+            try:
+                response = self._http.head(f"https://{guess.format(slug)}", allow_redirects=True, timeout=DOMAIN_GUESS_TIMEOUT)
+            except requests.RequestException:
+                continue
+            
+            # Some sites refuse HEAD requests but still exist
+            if response.ok or response.status_code == 405:
+                domain = urlparse(response.url).netloc
+                if domain.startswith("www."):
+                    domain = domain[len("www."):]
+                if domain:
+                    return domain
+        
+        return ""
+
+    def _search_company_domain(self, company_name: str) -> str:
+        """
+        Find the company domain name with a web search.
+        
+        Args:
+            company_name: Name of the company
+            
+        Returns:
+            The company domain name, or "" if none was found.
+        """
         try:
             # Use a search engine to find the company website
             search_query = f"site:{company_name}.com {company_name}"
             search_url = f"https://www.google.com/search?q={search_query}"
             
-            response = requests.get(search_url, headers={'User-Agent': self.user_agent}, timeout=self.timeout)
+            response = self._http.get(search_url, timeout=self.timeout)
             response.raise_for_status()
             
-            soup = BeautifulSoup(response.content, "html.parser")
+            soup = BeautifulSoup(response.content, "lxml")
             
             # Extract the first result
             first_result = soup.find("a", href=True)
@@ -117,7 +292,6 @@ class CompanyContactFinder:
                 parsed_url = urlparse(url)
                 domain = parsed_url.netloc
                 if domain:
-                    self.company_domains[company_name] = domain
                     return domain
         
         except Exception as e:
@@ -129,42 +303,133 @@ class CompanyContactFinder:
         """
         Scrape the company website for names and titles.
         
+        The candidate pages are fetched concurrently, so a company costs about
+        one round-trip instead of one per page.
+        
         Args:
             domain: Domain name of the company
             
         Returns:
             A list of tuples containing names and titles.
         """
+        cached = self._cache_get(f"people:{domain}")
+        if cached is not None:
+            return cached
+        
         names_and_titles = []
         
         try:
             # Construct URLs for common "About Us" and "Contact Us" pages
-            urls = [
-                f"https://{domain}/about",
-                f"https://{domain}/about-us",
-                f"https://{domain}/contact",
-                f"https://{domain}/contact-us",
-                f"https://{domain}/team",
-                f"https://{domain}/our-team",
-            ]
+            urls = [f"https://{domain}{path}" for path in COMPANY_PAGE_PATHS]
             
-            # Scrape each URL
-            for url in urls:
-                try:
-                    response = requests.get(url, headers={'User-Agent': self.user_agent}, timeout=self.timeout)
-                    response.raise_for_status()
-                    soup = BeautifulSoup(response.content, "html.parser")
+            for html in asyncio.run(self._fetch_company_pages(urls)):
+                if html:
+                    soup = BeautifulSoup(html, "lxml")
                     
                     # Extract names and titles from the page
                     names_and_titles.extend(self._extract_names_and_titles(soup))
-                except requests.exceptions.RequestException as e:
-                    logger.warning(f"Error scraping {url}: {e}")
         
         except Exception as e:
             logger.error(f"Error scraping company website: {e}")
         
+        self._cache_set(f"people:{domain}", names_and_titles)
         return names_and_titles
 
+    async def _fetch_company_pages(self, urls: List[str]) -> List[Optional[bytes]]:
+        """
+        Fetch several pages of a company site on one async HTTP client.
+        
+        Args:
+            urls: Page URLs
+            
+        Returns:
+            HTML (or None on failure) for each URL, in order
+        """
+        async with httpx.AsyncClient(
+            headers={'User-Agent': self.user_agent},
+            limits=httpx.Limits(max_connections=COMPANY_PAGE_CONNECTIONS),
+            timeout=self.timeout,
+            follow_redirects=True,
+        ) as client:
+            return await asyncio.gather(*(self._fetch_company_page(client, url) for url in urls))
+
+    async def _fetch_company_page(self, client: httpx.AsyncClient, url: str) -> Optional[bytes]:
+        """
+        Fetch one page, retrying server errors with exponential backoff.
+        
+        The body is streamed and cut off after MAX_PAGE_BYTES; responses that
+        are not HTML are dropped without reading them.
+        
+        Args:
+            client: Async HTTP client
+            url: Page URL
+            
+        Returns:
+            Page HTML (possibly truncated), or None if it could not be fetched
+        """
+        for attempt in range(PAGE_FETCH_RETRIES + 1):
+            try:
+                async with client.stream('GET', url) as response:
+                    if response.status_code >= 500 and attempt < PAGE_FETCH_RETRIES:
+                        await asyncio.sleep(PAGE_RETRY_BACKOFF * 2 ** attempt)
+                        continue
+                    response.raise_for_status()
+                    
+                    if 'html' not in response.headers.get('Content-Type', 'text/html'):
+                        logger.debug(f"Skipping {url}: not an HTML page")
+                        return None
+                    
+                    body = bytearray()
+                    async for chunk in response.aiter_bytes():
+                        body += chunk
+                        if len(body) >= MAX_PAGE_BYTES:
+                            break
+                    return bytes(body[:MAX_PAGE_BYTES])
+            except httpx.HTTPError as e:
+                logger.warning(f"Error scraping {url}: {e}")
+                return None
+        return None
+
+    def _cache_get(self, key: str):
+        """
+        Look up an unexpired entry in the on-disk contact cache.
+        
+        Args:
+            key: Cache key
+            
+        Returns:
+            The cached value, or None if there is none, it has expired or the
+            finder is refreshing
+        """
+        if self.refresh:
+            return None
+        try:
+            with shelve.open(CONTACT_CACHE_PATH) as cache:
+                entry = cache.get(key)
+        except Exception as e:
+            logger.warning(f"Could not read contact cache: {e}")
+            return None
+        
+        if entry is None or time.time() > entry['expires']:
+            return None
+        return entry['value']
+
+    def _cache_set(self, key: str, value):
+        """
+        Store a value in the on-disk contact cache.
+        
+        Args:
+            key: Cache key
+            value: Value to store; empty values expire after a day
+        """
+        ttl = CONTACT_CACHE_TTL if value else CONTACT_CACHE_EMPTY_TTL
+        try:
+            os.makedirs(os.path.dirname(CONTACT_CACHE_PATH), exist_ok=True)
+            with shelve.open(CONTACT_CACHE_PATH) as cache:
+                cache[key] = {'expires': time.time() + ttl, 'value': value}
+        except Exception as e:
+            logger.warning(f"Could not write contact cache: {e}")
+
     def _extract_names_and_titles(self, soup: BeautifulSoup) -> List[tuple[str, str]]:
         """
         Extract names and titles from a BeautifulSoup object.
@@ -178,7 +443,7 @@ class CompanyContactFinder:
         names_and_titles = []
         
         # Find common HTML elements containing names and titles
-        name_elements = soup.find_all(["h1", "h2", "h3", "h4", "h5", "h6", "p"], class_=re.compile(r"(name|title)", re.IGNORECASE))
+        name_elements = soup.find_all(NAME_TAGS, class_=_is_name_or_title_class)
         
         for element in name_elements:
             try:
@@ -193,12 +458,12 @@ class CompanyContactFinder:
                 
                 # If no title is found, attempt to find it in the parent element
                 if not title and element.parent:
-                    title_element = element.parent.find(class_=re.compile(r"title", re.IGNORECASE))
+                    title_element = element.parent.find(class_=_is_title_class)
                     if title_element and hasattr(title_element, 'text'):
                         title = title_element.text.strip()
                 
                 # Filter out common false positives
-                if len(name) > 3 and not re.search(r"(email|phone|tel|fax|website)", name, re.IGNORECASE):
+                if len(name) > 3 and not CONTACT_DETAIL_RE.search(name):
                     names_and_titles.append((name, title))
             
             except Exception as e:
@@ -206,13 +471,15 @@ class CompanyContactFinder:
         
         return names_and_titles
 
-    def _generate_email(self, full_name: str, domain: str) -> str:
+    def _generate_email(self, full_name: str, domain: str, format_type: Optional[str] = None) -> str:
         """
         Generate email address based on name and domain.
         
         Args:
             full_name: Full name
             domain: Domain name
+            format_type: The domain's email format; looked up (and the domain
+                checked for mail servers) when not given
         
         Returns:
             Email address
@@ -226,28 +493,18 @@ class CompanyContactFinder:
             first_name = name_parts[0].lower()
             last_name = name_parts[-1].lower()
             
-            # Find email pattern for this domain
-            format_type = self.email_pattern_finder.find_email_pattern(domain, domain)
-            
-            # Generate email based on pattern
-            email = self.email_pattern_finder.generate_email(first_name, last_name, domain, format_type)
-            
-            # Verify domain has MX records
-            if self._verify_email(email):
-                return email
-            
-            # Try alternative formats if the first one doesn't work
-            alternative_formats = ['first.last', 'firstlast', 'first_last', 'flast', 'firstl']
-            for alt_format in alternative_formats:
-                if alt_format == format_type:
-                    continue
+            if format_type is None:
+                # Every address at the domain shares its mail servers, so one
+                # lookup decides for all formats
+                if not domain_accepts_mail(domain):
+                    logger.debug(f"{domain} does not accept email")
+                    return ""
                 
-                alt_email = self.email_pattern_finder.generate_email(first_name, last_name, domain, alt_format)
-                if self._verify_email(alt_email):
-                    return alt_email
+                # Find email pattern for this domain
+                format_type = self.email_pattern_finder.find_email_pattern(domain, domain)
             
-            # Return the original email if no alternatives work
-            return email
+            # Generate email based on pattern
+            return self.email_pattern_finder.generate_email(first_name, last_name, domain, format_type)
         
         except Exception as e:
             logger.error(f"Error generating email: {e}")
@@ -264,11 +521,7 @@ class CompanyContactFinder:
             True if the email is valid, False otherwise.
         """
         try:
-            domain = email.split('@')[1]
-            socket.getaddrinfo(domain, 25)
-            return True
-        except socket.gaierror:
-            return False
+            return domain_accepts_mail(email.rsplit('@', 1)[1])
         except Exception as e:
             logger.error(f"Error verifying email: {e}")
             return False
@@ -1,17 +1,45 @@
 import logging
 import os
+import re
 import time
 import random
-from typing import Dict, Any, Optional
-from datetime import datetime
+from typing import Dict, Any, Optional, Tuple
+from datetime import date
 
 logger = logging.getLogger(__name__)
 
+# Directory generated cover letters are saved in
+COVER_LETTER_DIR = "data_folder/cover_letters"
+
+# Placeholders filled in a cover letter template
+PLACEHOLDER_RE = re.compile(r"\[(DATE|HIRING_MANAGER_NAME|COMPANY_NAME|JOB_TITLE|YOUR_NAME|YOUR_EMAIL|YOUR_PHONE)\]")
+
+# Alternative paragraphs for cover letters written from scratch, one picked
+# at random per letter; {title} and {company} are filled in
+INTRO_OPTIONS = (
+    "I am writing to express my interest in the {title} position at {company}. With my background and skills, I believe I would be a valuable addition to your team.",
+    "I am excited to apply for the {title} role at {company}. My experience and passion for this field make me a strong candidate for this position.",
+    "I was thrilled to see the opening for a {title} at {company}. My skills and experience align well with the requirements of this role.",
+)
+BODY_OPTIONS = (
+    "Throughout my career, I have developed strong skills in [RELEVANT_SKILLS] that would be valuable in this role. I am particularly drawn to {company} because of your reputation for [COMPANY_STRENGTH].",
+    "My experience includes [RELEVANT_EXPERIENCE] which has prepared me well for the challenges of this position. I am impressed by {company}'s commitment to [COMPANY_VALUE].",
+    "I have a proven track record of [ACHIEVEMENT] that demonstrates my ability to excel as a {title}. I am particularly interested in joining {company} because of your innovative approach to [INDUSTRY_AREA].",
+)
+CLOSING_OPTIONS = (
+    "I would welcome the opportunity to discuss how my background and skills would benefit {company}. Thank you for considering my application.",
+    "I am excited about the possibility of joining {company} and would appreciate the chance to further discuss my qualifications. Thank you for your time and consideration.",
+    "I look forward to the opportunity to further discuss how I can contribute to {company}'s continued success. Thank you for reviewing my application.",
+)
+
 class CoverLetterGenerator:
     """
     Generates custom cover letters for job applications.
     """
     
+    # Whether COVER_LETTER_DIR has been created in this process
+    _dir_ensured = False
+    
     def __init__(self, config: Dict[str, Any]):
         """
         Initialize the cover letter generator.
@@ -23,8 +51,16 @@ class CoverLetterGenerator:
         self.user_info = config.get('USER_INFO', {})
         self.ai_settings = config.get('AI_SETTINGS', {})
         
-        # Create cover letters directory if it doesn't exist
-        os.makedirs("data_folder/cover_letters", exist_ok=True)
+        # Template text by path, with the modification time it was read at
+        self._template_cache: Dict[str, Tuple[float, str]] = {}
+        
+        # Today's date and its letter heading, formatted once per day
+        self._date_cache: Optional[Tuple[date, str]] = None
+        
+        # Create cover letters directory if it doesn't exist, once per process
+        if not CoverLetterGenerator._dir_ensured:
+            os.makedirs(COVER_LETTER_DIR, exist_ok=True)
+            CoverLetterGenerator._dir_ensured = True
     
     def generate_cover_letter(self, job: Dict[str, Any]) -> Optional[str]:
         """
@@ -62,10 +98,14 @@ class CoverLetterGenerator:
             
             # Save cover letter to file
             file_name = f"cover_letter_{company_name.replace(' ', '_')}_{int(time.time())}.txt"
-            file_path = os.path.join("data_folder/cover_letters", file_name)
+            file_path = os.path.join(COVER_LETTER_DIR, file_name)
             
-            with open(file_path, 'w', encoding='utf-8') as f:
+            # Write to a temporary file first so a crash never leaves a
+            # half-written letter behind
+            tmp_path = f"{file_path}.{os.getpid()}.tmp"
+            with open(tmp_path, 'w', encoding='utf-8') as f:
                 f.write(cover_letter_text)
+            os.replace(tmp_path, file_path)
             
             logger.info(f"Generated cover letter for {job_title} at {company_name}")
             
@@ -88,8 +128,7 @@ class CoverLetterGenerator:
         """
         try:
             # Read template
-            with open(template_path, 'r', encoding='utf-8') as f:
-                template = f.read()
+            template = self._read_template(template_path)
             
             # Get job information
             job_title = job.get('title', '')
@@ -102,23 +141,56 @@ class CoverLetterGenerator:
             user_phone = self.user_info.get('phone', '')
             
             # Get current date
-            current_date = datetime.now().strftime("%B %d, %Y")
-            
-            # Replace placeholders
-            template = template.replace("[DATE]", current_date)
-            template = template.replace("[HIRING_MANAGER_NAME]", hiring_manager_name if hiring_manager_name else "Hiring Manager")
-            template = template.replace("[COMPANY_NAME]", company_name)
-            template = template.replace("[JOB_TITLE]", job_title)
-            template = template.replace("[YOUR_NAME]", user_name)
-            template = template.replace("[YOUR_EMAIL]", user_email)
-            template = template.replace("[YOUR_PHONE]", user_phone)
-            
-            return template
+            current_date = self._today_str()
+            
+            # Replace placeholders in one pass over the template
+            values = {
+                "DATE": current_date,
+                "HIRING_MANAGER_NAME": hiring_manager_name if hiring_manager_name else "Hiring Manager",
+                "COMPANY_NAME": company_name,
+                "JOB_TITLE": job_title,
+                "YOUR_NAME": user_name,
+                "YOUR_EMAIL": user_email,
+                "YOUR_PHONE": user_phone,
+            }
+            return PLACEHOLDER_RE.sub(lambda match: values[match.group(1)], template)
             
         except Exception as e:
             logger.error(f"Error generating cover letter from template: {e}")
             return ""
     
+    def _today_str(self) -> str:
+        """
+        Format today's date for a letter heading, reusing it for the whole day.
+        
+        Returns:
+            Date such as "January 05, 2025"
+        """
+        today = date.today()
+        if self._date_cache is None or self._date_cache[0] != today:
+            self._date_cache = (today, today.strftime("%B %d, %Y"))
+        return self._date_cache[1]
+    
+    def _read_template(self, template_path: str) -> str:
+        """
+        Read a template file, reusing the last read until the file changes.
+        
+        Args:
+            template_path: Path to template file
+            
+        Returns:
+            Template text
+        """
+        mtime = os.stat(template_path).st_mtime
+        cached = self._template_cache.get(template_path)
+        if cached and cached[0] == mtime:
+            return cached[1]
+        
+        with open(template_path, 'r', encoding='utf-8') as f:
+            template = f.read()
+        self._template_cache[template_path] = (mtime, template)
+        return template
+    
     def _generate_from_scratch(self, job: Dict[str, Any]) -> str:
         """
         Generate cover letter from scratch.
@@ -142,7 +214,7 @@ class CoverLetterGenerator:
             user_phone = self.user_info.get('phone', '')
             
             # Get current date
-            current_date = datetime.now().strftime("%B %d, %Y")
+            current_date = self._today_str()
             
             # Generate cover letter
             cover_letter = f"{current_date}\n\n"
@@ -152,29 +224,9 @@ class CoverLetterGenerator:
             else:
                 cover_letter += "Dear Hiring Manager,\n\n"
             
-            # Introduction
-            intro_options = [
-                f"I am writing to express my interest in the {job_title} position at {company_name}. With my background and skills, I believe I would be a valuable addition to your team.",
-                f"I am excited to apply for the {job_title} role at {company_name}. My experience and passion for this field make me a strong candidate for this position.",
-                f"I was thrilled to see the opening for a {job_title} at {company_name}. My skills and experience align well with the requirements of this role."
-            ]
-            cover_letter += random.choice(intro_options) + "\n\n"
-            
-            # Body
-            body_options = [
-                f"Throughout my career, I have developed strong skills in [RELEVANT_SKILLS] that would be valuable in this role. I am particularly drawn to {company_name} because of your reputation for [COMPANY_STRENGTH].",
-                f"My experience includes [RELEVANT_EXPERIENCE] which has prepared me well for the challenges of this position. I am impressed by {company_name}'s commitment to [COMPANY_VALUE].",
-                f"I have a proven track record of [ACHIEVEMENT] that demonstrates my ability to excel as a {job_title}. I am particularly interested in joining {company_name} because of your innovative approach to [INDUSTRY_AREA]."
-            ]
-            cover_letter += random.choice(body_options) + "\n\n"
-            
-            # Closing
-            closing_options = [
-                f"I would welcome the opportunity to discuss how my background and skills would benefit {company_name}. Thank you for considering my application.",
-                f"I am excited about the possibility of joining {company_name} and would appreciate the chance to further discuss my qualifications. Thank you for your time and consideration.",
-                f"I look forward to the opportunity to further discuss how I can contribute to {company_name}'s continued success. Thank you for reviewing my application."
-            ]
-            cover_letter += random.choice(closing_options) + "\n\n"
+            # Introduction, body and closing, each picked before formatting
+            for options in (INTRO_OPTIONS, BODY_OPTIONS, CLOSING_OPTIONS):
+                cover_letter += random.choice(options).format(title=job_title, company=company_name) + "\n\n"
             
             # Signature
             cover_letter += "Sincerely,\n\n"
@@ -1,11 +1,62 @@
 import logging
+import os
 import re
+import shelve
+import time
 import requests
-from bs4 import BeautifulSoup
-from typing import List, Dict, Any, Optional
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import lru_cache
+from typing import Optional
 
 logger = logging.getLogger(__name__)
 
+# On-disk cache of the email formats found for company domains, shared
+# across runs; companies rarely change their email format
+PATTERN_CACHE_PATH = "data_folder/.email_patterns_cache"
+PATTERN_CACHE_TTL = 30 * 24 * 60 * 60
+
+# Address templates by email format; {f}/{l} are the cleaned first and last
+# names and {fi}/{li} their initials
+EMAIL_FORMATS = {
+    'first.last': '{f}.{l}@{d}',
+    'firstlast': '{f}{l}@{d}',
+    'first_last': '{f}_{l}@{d}',
+    'flast': '{fi}{l}@{d}',
+    'lastf': '{l}{fi}@{d}',
+    'firstl': '{f}{li}@{d}',
+    'f.last': '{fi}.{l}@{d}',
+    'first.l': '{f}.{li}@{d}',
+    'last.first': '{l}.{f}@{d}',
+    'first': '{f}@{d}',
+    'last': '{l}@{d}',
+}
+
+# Characters removed from names before building an address
+NAME_CLEAN_RE = re.compile(r'[^\w]')
+
+# Browser user agent sent with every request
+USER_AGENT = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
+
+# Company site pages where employee emails might be found, fetched in parallel
+WEBSITE_EMAIL_PAGES = ['contact', 'about', 'team', 'company', 'about-us', 'leadership', 'our-team']
+
+
+@lru_cache(maxsize=1024)
+def domain_email_re(domain: str) -> "re.Pattern[str]":
+    """
+    Compile a pattern matching email addresses at a domain.
+    
+    Args:
+        domain: Company domain
+        
+    Returns:
+        Compiled pattern, shared by every lookup for the domain
+    """
+    return re.compile(r'[a-zA-Z0-9._%+-]+@' + re.escape(domain))
+
+
 class EmailPatternFinder:
     """
     Utility to find email patterns for companies without using external APIs.
@@ -29,6 +80,18 @@ class EmailPatternFinder:
         
         # Cache for company email formats
         self.company_formats = {}
+        
+        # Keep-alive session shared by all lookups, sized for the parallel
+        # page probes and retrying gateway errors
+        self._http = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=16,
+            pool_maxsize=16,
+            max_retries=Retry(total=2, backoff_factor=0.2, status_forcelist=[502, 503, 504]),
+        )
+        self._http.mount('https://', adapter)
+        self._http.mount('http://', adapter)
+        self._http.headers.update({'User-Agent': USER_AGENT})
     
     def find_email_pattern(self, company_name: str, domain: str) -> str:
         """
@@ -45,21 +108,59 @@ class EmailPatternFinder:
         if domain in self.company_formats:
             return self.company_formats[domain]
         
-        # Try to find email pattern from company website
-        pattern = self._extract_pattern_from_website(domain)
+        pattern = self._cache_get(domain)
         if pattern:
             self.company_formats[domain] = pattern
             return pattern
         
-        # Try to find pattern from Google search
-        pattern = self._extract_pattern_from_search(company_name, domain)
+        # Try to find email pattern from company website, then from Google search
+        pattern = self._extract_pattern_from_website(domain) or self._extract_pattern_from_search(company_name, domain)
         if pattern:
             self.company_formats[domain] = pattern
+            self._cache_set(domain, pattern)
             return pattern
         
         # Default to most common format
         return 'first.last'
     
+    @staticmethod
+    def _cache_get(domain: str) -> Optional[str]:
+        """
+        Look up an unexpired email format in the on-disk cache.
+        
+        Args:
+            domain: Company domain
+            
+        Returns:
+            The cached email format, or None if there is none or it has expired
+        """
+        try:
+            with shelve.open(PATTERN_CACHE_PATH) as cache:
+                entry = cache.get(domain)
+        except Exception as e:
+            logger.warning(f"Could not read email pattern cache: {e}")
+            return None
+        
+        if entry is None or time.time() > entry['expires']:
+            return None
+        return entry['value']
+    
+    @staticmethod
+    def _cache_set(domain: str, pattern: str):
+        """
+        Store an email format in the on-disk cache.
+        
+        Args:
+            domain: Company domain
+            pattern: Email format found for the domain
+        """
+        try:
+            os.makedirs(os.path.dirname(PATTERN_CACHE_PATH), exist_ok=True)
+            with shelve.open(PATTERN_CACHE_PATH) as cache:
+                cache[domain] = {'expires': time.time() + PATTERN_CACHE_TTL, 'value': pattern}
+        except Exception as e:
+            logger.warning(f"Could not write email pattern cache: {e}")
+    
     def _extract_pattern_from_website(self, domain: str) -> Optional[str]:
         """
         Extract email pattern from company website.
@@ -71,25 +172,23 @@ class EmailPatternFinder:
             Email format pattern or None
         """
         try:
-            headers = {
-                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-            }
-            
-            # Check common pages where emails might be found
-            for page in ['contact', 'about', 'team', 'company', 'about-us', 'leadership', 'our-team']:
-                url = f"https://{domain}/{page}"
-                try:
-                    response = requests.get(url, headers=headers, timeout=10)
-                    if response.status_code == 200:
-                        # Look for email patterns
-                        email_pattern = r'[a-zA-Z0-9._%+-]+@' + re.escape(domain)
-                        emails = re.findall(email_pattern, response.text)
-                        
-                        if emails:
-                            # Extract format from found email
-                            return self._determine_format_from_email(emails[0])
-                except:
-                    continue
+            email_re = domain_email_re(domain)
+            
+            # Check common pages where emails might be found, all at once; the
+            # first email found wins and the remaining requests are abandoned
+            executor = ThreadPoolExecutor(max_workers=len(WEBSITE_EMAIL_PAGES))
+            try:
+                futures = [
+                    executor.submit(self._find_email_on_page, f"https://{domain}/{page}", email_re)
+                    for page in WEBSITE_EMAIL_PAGES
+                ]
+                for future in as_completed(futures):
+                    email = future.result()
+                    if email:
+                        # Extract format from found email
+                        return self._determine_format_from_email(email)
+            finally:
+                executor.shutdown(wait=False, cancel_futures=True)
             
             return None
         
@@ -97,6 +196,28 @@ class EmailPatternFinder:
             logger.error(f"Error extracting pattern from website: {e}")
             return None
     
+    def _find_email_on_page(self, url: str, email_re: "re.Pattern[str]") -> Optional[str]:
+        """
+        Fetch a page and find the first email address on it.
+        
+        Args:
+            url: Page URL
+            email_re: Pattern for email addresses at the company domain
+            
+        Returns:
+            Email address, or None if the page could not be fetched or has none
+        """
+        try:
+            response = self._http.get(url, timeout=10)
+            if response.status_code == 200:
+                # Look for the first email address at the domain
+                match = email_re.search(response.text)
+                if match:
+                    return match.group(0)
+        except Exception:
+            pass
+        return None
+    
     def _extract_pattern_from_search(self, company_name: str, domain: str) -> Optional[str]:
         """
         Extract email pattern from search results.
@@ -109,22 +230,17 @@ class EmailPatternFinder:
             Email format pattern or None
         """
         try:
-            headers = {
-                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-            }
-            
             # Search for company email format
             search_query = f"{company_name} email format {domain}"
-            response = requests.get(f"https://www.google.com/search?q={search_query.replace(' ', '+')}", headers=headers, timeout=10)
+            response = self._http.get(f"https://www.google.com/search?q={search_query.replace(' ', '+')}", timeout=10)
             
             if response.status_code == 200:
-                # Look for email patterns in search results
-                email_pattern = r'[a-zA-Z0-9._%+-]+@' + re.escape(domain)
-                emails = re.findall(email_pattern, response.text)
+                # Look for the first email address at the domain in search results
+                match = domain_email_re(domain).search(response.text)
                 
-                if emails:
+                if match:
                     # Extract format from found email
-                    return self._determine_format_from_email(emails[0])
+                    return self._determine_format_from_email(match.group(0))
             
             return None
         
@@ -187,33 +303,12 @@ class EmailPatternFinder:
         """
         try:
             # Clean names
-            first_name = re.sub(r'[^\w]', '', first_name.lower())
-            last_name = re.sub(r'[^\w]', '', last_name.lower())
-            
-            # Generate email based on format
-            if format_type == 'first.last':
-                return f"{first_name}.{last_name}@{domain}"
-            elif format_type == 'firstlast':
-                return f"{first_name}{last_name}@{domain}"
-            elif format_type == 'first_last':
-                return f"{first_name}_{last_name}@{domain}"
-            elif format_type == 'flast':
-                return f"{first_name[0]}{last_name}@{domain}"
-            elif format_type == 'lastf':
-                return f"{last_name}{first_name[0]}@{domain}"
-            elif format_type == 'firstl':
-                return f"{first_name}{last_name[0]}@{domain}"
-            elif format_type == 'f.last':
-                return f"{first_name[0]}.{last_name}@{domain}"
-            elif format_type == 'last.first':
-                return f"{last_name}.{first_name}@{domain}"
-            elif format_type == 'first':
-                return f"{first_name}@{domain}"
-            elif format_type == 'last':
-                return f"{last_name}@{domain}"
-            else:
-                # Default to first.last
-                return f"{first_name}.{last_name}@{domain}"
+            first_name = NAME_CLEAN_RE.sub('', first_name.lower())
+            last_name = NAME_CLEAN_RE.sub('', last_name.lower())
+            
+            # Generate email based on format, defaulting to first.last
+            template = EMAIL_FORMATS.get(format_type, EMAIL_FORMATS['first.last'])
+            return template.format(f=first_name, l=last_name, fi=first_name[:1], li=last_name[:1], d=domain)
         
         except Exception as e:
             logger.error(f"Error generating email: {e}")
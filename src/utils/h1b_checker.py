@@ -2,10 +2,152 @@ import logging
 import os
 import csv
 import re
-from typing import Dict, Set, Any
+import string
+from functools import lru_cache
+from typing import Dict, FrozenSet, Any, Iterable, Iterator, Optional, Tuple
+
+try:
+    import ahocorasick  # pyahocorasick: optional, scans for all keywords in one pass
+except ImportError:
+    ahocorasick = None
 
 logger = logging.getLogger(__name__)
 
+# Phrases in a job posting that suggest the employer sponsors H1B visas
+H1B_KEYWORDS = (
+    "h1b", "h-1b", "h1-b", "h 1 b", "h1 b", "h-1 b",
+    "visa sponsor", "visa sponsorship", "sponsorship available",
+    "sponsor visa", "sponsor work visa", "sponsor h1b",
+    "will sponsor", "can sponsor", "open to sponsor",
+    "willing to sponsor", "eligible to work", "work authorization",
+    "legally authorized", "work permit", "eligible for sponsorship",
+    "international candidates", "international applicants"
+)
+
+# Phrases in a job posting that rule out sponsorship; they take precedence
+# over H1B_KEYWORDS, several of which they contain ("no h1b")
+NO_SPONSORSHIP_KEYWORDS = (
+    "no visa sponsor", "no sponsorship", "not sponsor",
+    "will not sponsor", "cannot sponsor", "no h1b",
+    "no visa", "no work visa", "no h1b visa",
+    "not eligible for sponsorship", "sponsorship not available",
+    "no sponsorship available", "citizens and permanent residents only",
+    "authorized to work in the us", "must be authorized to work",
+    "must be eligible to work", "must be legally authorized"
+)
+
+# Legal suffixes ignored when matching company names, possibly several in a
+# row ("foo co inc")
+COMPANY_SUFFIX_RE = re.compile(
+    r"(?:\s+(?:inc\.?|incorporated|llc\.?|limited liability company|ltd\.?|limited"
+    r"|corp\.?|corporation|co\.?|company))+\s*$"
+)
+
+# Deletes punctuation, including typographic quotes and dashes, from a name
+PUNCTUATION_TABLE = str.maketrans("", "", string.punctuation + "\u2018\u2019\u201c\u201d\u2013\u2014\u00ae\u2122")
+
+# Each keyword list in one pattern, so a posting is scanned once; used when
+# pyahocorasick is unavailable
+H1B_KEYWORD_RE = re.compile("|".join(map(re.escape, H1B_KEYWORDS)), re.IGNORECASE)
+NO_SPONSORSHIP_RE = re.compile("|".join(map(re.escape, NO_SPONSORSHIP_KEYWORDS)), re.IGNORECASE)
+
+
+def _build_automaton(keywords) -> Optional[Any]:
+    """
+    Build an Aho-Corasick automaton over lowercase keywords.
+    
+    Args:
+        keywords: Lowercase keywords to match
+        
+    Returns:
+        ahocorasick.Automaton mapping each keyword to itself, or None if
+        pyahocorasick is unavailable
+    """
+    if ahocorasick is None:
+        return None
+    
+    automaton = ahocorasick.Automaton()
+    for keyword in keywords:
+        automaton.add_word(keyword, keyword)
+    automaton.make_automaton()
+    return automaton
+
+
+# Automatons matching every keyword of a list in a single pass over a posting
+_h1b_automaton = _build_automaton(H1B_KEYWORDS)
+_no_sponsorship_automaton = _build_automaton(NO_SPONSORSHIP_KEYWORDS)
+
+
+def _find_keyword(automaton: Optional[Any], pattern: "re.Pattern[str]", text: str) -> Optional[str]:
+    """
+    Find the first keyword of a list in a piece of text.
+    
+    Args:
+        automaton: The list's automaton, or None to use the pattern
+        pattern: The list's compiled alternation
+        text: Text to search, in any case
+        
+    Returns:
+        The lowercase keyword found, or None
+    """
+    if automaton is not None:
+        for _, keyword in automaton.iter(text.lower()):
+            return keyword
+        return None
+    
+    match = pattern.search(text)
+    return match.group(0).lower() if match else None
+
+
+def find_h1b_keyword(text: str) -> Optional[str]:
+    """
+    Find the first H1B sponsorship keyword in a piece of text.
+    
+    Args:
+        text: Job description and/or title, in any case
+        
+    Returns:
+        The lowercase keyword found, or None
+    """
+    return _find_keyword(_h1b_automaton, H1B_KEYWORD_RE, text)
+
+
+def find_no_sponsorship_keyword(text: str) -> Optional[str]:
+    """
+    Find the first phrase ruling out sponsorship in a piece of text.
+    
+    Args:
+        text: Job description and/or title, in any case
+        
+    Returns:
+        The lowercase phrase found, or None
+    """
+    return _find_keyword(_no_sponsorship_automaton, NO_SPONSORSHIP_RE, text)
+
+
+@lru_cache(maxsize=4096)
+def clean_company_name(company_name: str) -> str:
+    """
+    Clean company name for matching.
+    
+    Cached because the same employers come up across many jobs.
+    
+    Args:
+        company_name: Company name to clean
+        
+    Returns:
+        Cleaned company name
+    """
+    # Convert to lowercase and remove common suffixes
+    name = COMPANY_SUFFIX_RE.sub("", company_name.lower())
+    
+    # Remove special characters
+    name = name.translate(PUNCTUATION_TABLE)
+    
+    # Remove extra whitespace
+    return " ".join(name.split())
+
+
 class H1BChecker:
     """
     Checks if a company sponsors H1B visas.
@@ -15,14 +157,14 @@ class H1BChecker:
         """Initialize the H1B checker."""
         self.h1b_sponsors = self._load_h1b_sponsors()
     
-    def _load_h1b_sponsors(self) -> Set[str]:
+    def _load_h1b_sponsors(self) -> FrozenSet[str]:
         """
         Load H1B sponsors from CSV file.
         
         Returns:
-            Set of company names that sponsor H1B visas
+            Set of cleaned names of companies that sponsor H1B visas
         """
-        sponsors = set()
+        sponsors = frozenset()
         
         # Path to H1B sponsors CSV file
         h1b_file = os.path.join("data_folder", "h1b_sponsors.csv")
@@ -32,15 +174,16 @@ class H1BChecker:
             self._create_default_h1b_file(h1b_file)
         
         try:
-            with open(h1b_file, 'r', encoding='utf-8') as f:
-                reader = csv.reader(f)
+            with open(h1b_file, 'r', newline='', encoding='utf-8') as f:
                 # Skip header
-                next(reader, None)
+                next(f, None)
                 
-                for row in reader:
-                    if row and len(row) > 0:
-                        # Add company name to set (lowercase for case-insensitive matching)
-                        sponsors.add(row[0].lower())
+                # Store names cleaned the same way as the names looked up,
+                # bypassing the cache so the sponsors list doesn't evict the
+                # job companies kept there
+                sponsors = frozenset(
+                    clean_company_name.__wrapped__(name) for name in self._read_sponsor_names(f)
+                )
             
             logger.info(f"Loaded {len(sponsors)} H1B sponsors")
             
@@ -49,6 +192,30 @@ class H1BChecker:
         
         return sponsors
     
+    @staticmethod
+    def _read_sponsor_names(lines: Iterable[str]) -> Iterator[str]:
+        """
+        Read the company name column of the sponsors CSV.
+        
+        Only lines with quoted fields go through the csv module; the rest
+        are split at the first comma, which is much faster on large files.
+        
+        Args:
+            lines: Lines of the CSV file after the header
+            
+        Returns:
+            Iterator over the non-empty company names
+        """
+        for line in lines:
+            if '"' in line:
+                row = next(csv.reader([line]), None)
+                name = row[0] if row else ""
+            else:
+                name = line.split(',', 1)[0]
+            name = name.strip()
+            if name:
+                yield name
+    
     def _create_default_h1b_file(self, file_path: str):
         """
         Create default H1B sponsors file with some known sponsors.
@@ -141,69 +308,70 @@ class H1BChecker:
         if not company_name:
             return False
         
-        # Clean company name
-        clean_name = self._clean_company_name(company_name)
-        
-        # Check if company is in sponsors list
-        for sponsor in self.h1b_sponsors:
-            if clean_name in sponsor or sponsor in clean_name:
-                logger.info(f"Company {company_name} is an H1B sponsor (found in database)")
-                return True
-        
-        # Check job description for H1B keywords if provided
-        if job_description:
-            h1b_keywords = [
-                "h1b", "h-1b", "h1-b", "h 1 b", "h1 b", "h-1 b",
-                "visa sponsor", "visa sponsorship", "sponsorship available",
-                "sponsor visa", "sponsor work visa", "sponsor h1b",
-                "will sponsor", "can sponsor", "open to sponsor",
-                "willing to sponsor", "eligible to work", "work authorization",
-                "legally authorized", "work permit", "eligible for sponsorship",
-                "international candidates", "international applicants"
-            ]
-            
-            job_description_lower = job_description.lower()
-            
-            for keyword in h1b_keywords:
-                if keyword in job_description_lower:
-                    logger.info(f"Company {company_name} might sponsor H1B (keyword found in job description: {keyword})")
-                    return True
+        if self._classify(company_name, job_description.lower()):
+            return True
         
         logger.info(f"Company {company_name} is not a known H1B sponsor")
         return False
     
-    def _clean_company_name(self, company_name: str) -> str:
+    def _classify(self, company_name: str, text: str) -> Optional[bool]:
         """
-        Clean company name for matching.
+        Decide whether a job offers H1B sponsorship.
+        
+        The company is looked up in the sponsors list first; otherwise the
+        text is scanned once for phrases ruling sponsorship out and once for
+        H1B keywords.
         
         Args:
-            company_name: Company name to clean
+            company_name: Company name, possibly empty
+            text: Lowercased job text (description, and title if known)
             
         Returns:
-            Cleaned company name
+            True if the job offers sponsorship, False if the text rules it
+            out, None if nothing was found either way
         """
-        # Convert to lowercase
-        name = company_name.lower()
+        # Check if company is in sponsors list
+        if company_name and self._matches_sponsor(clean_company_name(company_name)):
+            logger.info(f"Company {company_name} is an H1B sponsor (found in database)")
+            return True
         
-        # Remove common suffixes
-        suffixes = [
-            "inc", "inc.", "incorporated", 
-            "llc", "llc.", "limited liability company",
-            "ltd", "ltd.", "limited",
-            "corp", "corp.", "corporation",
-            "co", "co.", "company"
-        ]
+        if not text:
+            return None
         
-        for suffix in suffixes:
-            name = re.sub(r'\s+' + re.escape(suffix) + r'\s*$', '', name)
+        keyword = find_no_sponsorship_keyword(text)
+        if keyword:
+            logger.info(f"Job at {company_name} explicitly does NOT offer H1B sponsorship (negative keyword found: {keyword})")
+            return False
+        
+        keyword = find_h1b_keyword(text)
+        if keyword:
+            logger.info(f"Job at {company_name} might offer H1B sponsorship (keyword found: {keyword})")
+            return True
+        
+        return None
+    
+    def _matches_sponsor(self, clean_name: str) -> bool:
+        """
+        Check a cleaned company name against the sponsors list.
         
-        # Remove special characters
-        name = re.sub(r'[^\w\s]', '', name)
+        Besides an exact match, a sponsor's name appearing as whole words in
+        the company name counts, so "amazon web services" matches "amazon".
         
-        # Remove extra whitespace
-        name = re.sub(r'\s+', ' ', name).strip()
+        Args:
+            clean_name: Company name as returned by clean_company_name
+            
+        Returns:
+            True if the company is a known sponsor, False otherwise
+        """
+        if clean_name in self.h1b_sponsors:
+            return True
         
-        return name
+        words = clean_name.split()
+        return any(
+            " ".join(words[start:end]) in self.h1b_sponsors
+            for start in range(len(words))
+            for end in range(start + 1, len(words) + 1)
+        )
     
     def add_h1b_sponsor(self, company_name: str, notes: str = ""):
         """
@@ -213,7 +381,17 @@ class H1BChecker:
             company_name: Company name to add
             notes: Notes about the company
         """
-        if not company_name:
+        self.add_h1b_sponsors([(company_name, notes)])
+    
+    def add_h1b_sponsors(self, sponsors: Iterable[Tuple[str, str]]):
+        """
+        Add several companies to the H1B sponsors list, writing the file once.
+        
+        Args:
+            sponsors: (company name, notes) pairs; empty names are skipped
+        """
+        rows = [(company_name, notes) for company_name, notes in sponsors if company_name]
+        if not rows:
             return
         
         try:
@@ -221,14 +399,17 @@ class H1BChecker:
             h1b_file = os.path.join("data_folder", "h1b_sponsors.csv")
             
             # Add to in-memory set
-            self.h1b_sponsors.add(company_name.lower())
+            self.h1b_sponsors = self.h1b_sponsors | {clean_company_name(company_name) for company_name, _ in rows}
             
             # Append to file
-            with open(h1b_file, 'a', encoding='utf-8') as f:
+            with open(h1b_file, 'a', newline='', encoding='utf-8') as f:
                 writer = csv.writer(f)
-                writer.writerow([company_name, notes])
+                writer.writerows(rows)
             
-            logger.info(f"Added {company_name} to H1B sponsors list")
+            if len(rows) == 1:
+                logger.info(f"Added {rows[0][0]} to H1B sponsors list")
+            else:
+                logger.info(f"Added {len(rows)} companies to H1B sponsors list")
             
         except Exception as e:
             logger.error(f"Error adding H1B sponsor: {e}")
@@ -247,43 +428,5 @@ class H1BChecker:
         job_description = job.get('description', '')
         job_title = job.get('title', '')
         
-        # First check if company is in known sponsors list
-        if self.is_h1b_sponsor(company_name):
-            return True
-        
-        # Check job description and title for H1B keywords
-        combined_text = (job_description + " " + job_title).lower()
-        
-        h1b_keywords = [
-            "h1b", "h-1b", "h1-b", "h 1 b", "h1 b", "h-1 b",
-            "visa sponsor", "visa sponsorship", "sponsorship available",
-            "sponsor visa", "sponsor work visa", "sponsor h1b",
-            "will sponsor", "can sponsor", "open to sponsor",
-            "willing to sponsor", "eligible to work", "work authorization",
-            "legally authorized", "work permit", "eligible for sponsorship",
-            "international candidates", "international applicants"
-        ]
-        
-        for keyword in h1b_keywords:
-            if keyword in combined_text:
-                logger.info(f"Job at {company_name} might offer H1B sponsorship (keyword found: {keyword})")
-                return True
-        
-        # Check for negative keywords that indicate no sponsorship
-        negative_keywords = [
-            "no visa sponsor", "no sponsorship", "not sponsor", 
-            "will not sponsor", "cannot sponsor", "no h1b",
-            "no visa", "no work visa", "no h1b visa",
-            "not eligible for sponsorship", "sponsorship not available",
-            "no sponsorship available", "citizens and permanent residents only",
-            "authorized to work in the us", "must be authorized to work",
-            "must be eligible to work", "must be legally authorized"
-        ]
-        
-        for keyword in negative_keywords:
-            if keyword in combined_text:
-                logger.info(f"Job at {company_name} explicitly does NOT offer H1B sponsorship (negative keyword found: {keyword})")
-            return False
-        
-        return False
-
+        # Known sponsors list first, then the description and title
+        return bool(self._classify(company_name, (job_description + " " + job_title).lower()))
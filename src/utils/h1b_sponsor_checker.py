@@ -1,14 +1,46 @@
+import asyncio
+import httpx
 import requests
 import json
 import os
+import sqlite3
 import time
-from typing import Dict, List, Optional, Tuple
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 import logging
 from bs4 import BeautifulSoup
+from concurrent.futures import ThreadPoolExecutor, as_completed, TimeoutError as FuturesTimeoutError
 from datetime import datetime, timedelta
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 logger = logging.getLogger(__name__)
 
+# Threads running source checks, shared by all checkers so they aren't
+# started per lookup; each lookup queries three sources at once
+SOURCE_CHECK_WORKERS = 12
+_source_pool = ThreadPoolExecutor(max_workers=SOURCE_CHECK_WORKERS, thread_name_prefix="h1b-source")
+
+# Seconds to wait for any source to confirm sponsorship before giving up
+SOURCE_CHECK_TIMEOUT = 12
+
+# Companies looked up at once by check_h1b_sponsorship_batch; each queries
+# the three sources in parallel
+BATCH_COMPANIES = 10
+
+# Bits recording which sources answered a lookup, by their position in the
+# order they're queried: H1BData.info, MyVisaJobs, H1BGrader
+ALL_SOURCES = 0b111
+
+# Text on an H1BData.info results page with no filings; pages are streamed
+# and dropped as soon as it appears
+H1B_DATA_NO_RESULTS = b"No results found"
+
+# Bytes read at a time from a streamed results page
+STREAM_CHUNK_SIZE = 8192
+
+# Browser user agent sent with every request
+USER_AGENT = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
+
 class H1BSponsorChecker:
     """
     Utility class to check if a company sponsors H1B visas.
@@ -23,53 +55,189 @@ class H1BSponsorChecker:
             cache_dir: Directory to store temporary cache data
         """
         self.cache_dir = cache_dir
-        self.cache_file = os.path.join(cache_dir, "h1b_cache.json")
+        self.cache_file = os.path.join(cache_dir, "h1b_cache.db")
         self.cache_expiry = 24  # Cache expires after 24 hours
-        self.sponsors_cache = self._load_cache()
+        self.negative_cache_expiry = 6  # "Not a sponsor" answers expire after 6 hours
+        
+        # Cached answers live in SQLite, so a lookup reads and writes one row
+        # instead of loading and rewriting the whole cache
+        self.db = self._open_cache()
+        
+        # Answers already given in this run, by lowercase company name; they
+        # skip the expiry check and never outlive the process
+        self._memo: Dict[str, bool] = {}
         
         # API endpoints
         self.h1b_grader_api = "https://www.h1bgrader.com/api/v1/search"
         self.h1b_data_api = "https://h1bdata.info/index.php"
         self.myvisajobs_url = "https://www.myvisajobs.com/Search_Visa_Sponsor.aspx"
         
-    def _load_cache(self) -> Dict[str, Tuple[bool, float]]:
+        # Keep-alive session shared by all lookups, retrying gateway errors
+        self.session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=8,
+            pool_maxsize=32,
+            max_retries=Retry(total=2, backoff_factor=0.3, status_forcelist=[502, 503, 504]),
+        )
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+        self.session.headers.update({'User-Agent': USER_AGENT})
+    
+    def close(self):
+        """Close the HTTP session's pooled connections and the cache database."""
+        self.session.close()
+        self.db.close()
+    
+    def _open_cache(self) -> sqlite3.Connection:
         """
-        Load the cached H1B sponsor data if available.
+        Open the cache database, creating it if needed.
+        
+        Entries from the JSON cache used by earlier versions are imported
+        when the database is first created.
         
         Returns:
-            Dictionary mapping company names to (is_sponsor, timestamp) tuples
+            Connection to the cache database, or to an in-memory one if the
+            file can't be opened
         """
-        if os.path.exists(self.cache_file):
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            created = not os.path.exists(self.cache_file)
+            db = sqlite3.connect(self.cache_file, check_same_thread=False)
+            db.execute("PRAGMA journal_mode=WAL")
+            db.execute("PRAGMA synchronous=NORMAL")
+        except Exception as e:
+            logger.error(f"Error opening H1B sponsors cache: {e}")
+            created = True
+            db = sqlite3.connect(":memory:", check_same_thread=False)
+        
+        with db:
+            db.execute(
+                "CREATE TABLE IF NOT EXISTS cache (company TEXT PRIMARY KEY, is_sponsor INTEGER, ts REAL,"
+                f" answered INTEGER NOT NULL DEFAULT {ALL_SOURCES})"
+            )
+            
+            # Databases from before answers were tracked per source
+            columns = {row[1] for row in db.execute("PRAGMA table_info(cache)")}
+            if 'answered' not in columns:
+                db.execute(f"ALTER TABLE cache ADD COLUMN answered INTEGER NOT NULL DEFAULT {ALL_SOURCES}")
+        
+        legacy_file = os.path.join(self.cache_dir, "h1b_cache.json")
+        if created and os.path.exists(legacy_file):
             try:
-                with open(self.cache_file, 'r') as f:
-                    cache_data = json.load(f)
-                return cache_data
+                with open(legacy_file, 'r') as f:
+                    legacy = json.load(f)
+                self._put_many(((company, entry[0], entry[1], ALL_SOURCES) for company, entry in legacy.items()), db)
+                logger.info(f"Imported {len(legacy)} entries from {legacy_file}")
             except Exception as e:
-                logger.error(f"Error loading H1B sponsors cache: {e}")
-                return {}
-        return {}
+                logger.error(f"Error importing H1B sponsors cache: {e}")
+        
+        return db
     
-    def _save_cache(self):
-        """Save the current cache to disk."""
+    def _get(self, company_name_lower: str) -> Optional[Tuple[bool, float, int]]:
+        """
+        Read a company's cache entry.
+        
+        Args:
+            company_name_lower: Lowercase company name
+            
+        Returns:
+            (is_sponsor, timestamp, answered sources) tuple, or None if the
+            company isn't cached
+        """
         try:
-            os.makedirs(self.cache_dir, exist_ok=True)
-            with open(self.cache_file, 'w') as f:
-                json.dump(self.sponsors_cache, f)
+            row = self.db.execute(
+                "SELECT is_sponsor, ts, answered FROM cache WHERE company = ?", (company_name_lower,)
+            ).fetchone()
+        except Exception as e:
+            logger.error(f"Error reading H1B sponsors cache: {e}")
+            return None
+        return (bool(row[0]), row[1], row[2]) if row else None
+    
+    def _put(self, company_name_lower: str, is_sponsor: bool, answered: int = ALL_SOURCES,
+             timestamp: Optional[float] = None):
+        """
+        Store a company's answer in the cache.
+        
+        Args:
+            company_name_lower: Lowercase company name
+            is_sponsor: Whether the company sponsors H1B visas
+            answered: Bits of the sources the answer is based on
+            timestamp: When the oldest of those answers was given, now if None
+        """
+        self._put_many([(company_name_lower, is_sponsor, timestamp or time.time(), answered)])
+    
+    def _put_many(self, entries: Iterable[Tuple[str, bool, float, int]], db: Optional[sqlite3.Connection] = None):
+        """
+        Store several cache entries in one transaction.
+        
+        Args:
+            entries: (lowercase company name, is_sponsor, timestamp, answered
+                sources) tuples
+            db: Connection to write to, the cache database if None
+        """
+        if db is None:
+            db = self.db
+        try:
+            with db:
+                db.executemany(
+                    "INSERT OR REPLACE INTO cache (company, is_sponsor, ts, answered) VALUES (?, ?, ?, ?)", entries
+                )
         except Exception as e:
             logger.error(f"Error saving H1B sponsors cache: {e}")
     
-    def _is_cache_valid(self, timestamp: float) -> bool:
+    def _is_cache_valid(self, timestamp: float, is_sponsor: bool = True) -> bool:
         """
         Check if a cached entry is still valid.
         
         Args:
             timestamp: Unix timestamp of when the entry was cached
+            is_sponsor: The cached answer; "not a sponsor" expires sooner
             
         Returns:
             True if the entry is still valid, False otherwise
         """
         current_time = time.time()
-        return (current_time - timestamp) < (self.cache_expiry * 3600)
+        expiry = self.cache_expiry if is_sponsor else self.negative_cache_expiry
+        return (current_time - timestamp) < (expiry * 3600)
+    
+    def _cached_result(self, company_name_lower: str) -> Optional[bool]:
+        """
+        Look up a company in this run's answers, then in the cache.
+        
+        Args:
+            company_name_lower: Lowercase company name
+            
+        Returns:
+            Whether the company sponsors H1B visas, or None if it is not
+            cached or the entry has expired
+        """
+        is_sponsor = self._memo.get(company_name_lower)
+        if is_sponsor is not None:
+            return is_sponsor
+        
+        # "Not a sponsor" only counts once every source has said so; sources
+        # that failed are asked again
+        cached = self._get(company_name_lower)
+        if cached and (cached[0] or cached[2] == ALL_SOURCES) and self._is_cache_valid(cached[1], cached[0]):
+            self._memo[company_name_lower] = cached[0]
+            return cached[0]
+        return None
+    
+    def _answered_sources(self, company_name_lower: str) -> Tuple[int, Optional[float]]:
+        """
+        Find the sources that recently said a company isn't a sponsor.
+        
+        Args:
+            company_name_lower: Lowercase company name
+            
+        Returns:
+            Bits of those sources and when they answered, or (0, None) if
+            there are none
+        """
+        cached = self._get(company_name_lower)
+        if cached and not cached[0] and cached[2] and self._is_cache_valid(cached[1], False):
+            return cached[2], cached[1]
+        return 0, None
     
     def check_h1b_sponsorship(self, company_name: str) -> bool:
         """
@@ -84,48 +252,227 @@ class H1BSponsorChecker:
         company_name_lower = company_name.lower()
         
         # Check cache first
-        if company_name_lower in self.sponsors_cache:
-            is_sponsor, timestamp = self.sponsors_cache[company_name_lower]
-            if self._is_cache_valid(timestamp):
-                return is_sponsor
+        is_sponsor = self._cached_result(company_name_lower)
+        if is_sponsor is not None:
+            return is_sponsor
         
-        # Check using multiple sources
-        is_sponsor = self._check_multiple_sources(company_name)
+        # Check using the sources that haven't already said no
+        answered, since = self._answered_sources(company_name_lower)
+        is_sponsor, answered = self._check_multiple_sources(company_name, answered)
         
-        # Update cache
-        self.sponsors_cache[company_name_lower] = (is_sponsor, time.time())
-        self._save_cache()
+        # Update cache; a "no" keeps the time of the oldest answer it's based on
+        self._memo[company_name_lower] = is_sponsor
+        self._put(company_name_lower, is_sponsor, answered, None if is_sponsor else since)
         
         return is_sponsor
     
-    def _check_multiple_sources(self, company_name: str) -> bool:
+    def _check_multiple_sources(self, company_name: str, answered: int = 0) -> Tuple[bool, int]:
         """
         Check if a company sponsors H1B visas using multiple sources.
         
         Args:
             company_name: Name of the company to check
+            answered: Bits of sources that already said no; they are skipped
             
         Returns:
-            True if the company sponsors H1B visas according to any source, False otherwise
+            Whether the company sponsors H1B visas according to any source,
+            and the bits of the sources that have now answered
         """
-        # Try multiple sources and return True if any of them indicate sponsorship
+        # Query the remaining sources at once and return True as soon as any
+        # of them indicates sponsorship
         sources = [
             self._check_h1b_data,
             self._check_myvisajobs,
             self._check_h1b_grader
         ]
+        futures = {
+            _source_pool.submit(source_check, company_name): 1 << i
+            for i, source_check in enumerate(sources) if not answered & (1 << i)
+        }
         
-        for source_check in sources:
-            try:
-                if source_check(company_name):
+        try:
+            for future in as_completed(futures, timeout=SOURCE_CHECK_TIMEOUT):
+                try:
+                    is_sponsor = future.result()
+                except Exception as e:
+                    logger.debug(f"Error checking source for {company_name}: {e}")
+                    continue
+                if is_sponsor:
+                    return True, ALL_SOURCES
+                if is_sponsor is not None:
+                    answered |= futures[future]
+        except FuturesTimeoutError:
+            logger.debug(f"Timed out checking sources for {company_name}")
+        finally:
+            for future in futures:
+                future.cancel()
+        
+        return False, answered
+    
+    def check_h1b_sponsorship_batch(self, company_names: Iterable[str]) -> Dict[str, bool]:
+        """
+        Check H1B sponsorship for many companies at once.
+        
+        Cached companies are answered from the cache; the rest are looked up
+        concurrently on one async HTTP client, and cached in one transaction.
+        
+        Args:
+            company_names: Names of the companies to check (duplicates allowed)
+            
+        Returns:
+            Dictionary mapping each company name to whether it sponsors H1B visas
+        """
+        results = {}
+        misses = []
+        for company_name in dict.fromkeys(company_names):
+            is_sponsor = self._cached_result(company_name.lower())
+            if is_sponsor is not None:
+                results[company_name] = is_sponsor
+            else:
+                misses.append(company_name)
+        
+        if misses:
+            # Skip the sources that already said no to each company
+            pending = [self._answered_sources(company_name.lower()) for company_name in misses]
+            checked = asyncio.run(self._check_companies(misses, [answered for answered, _ in pending]))
+            now = time.time()
+            entries = []
+            for company_name, (is_sponsor, answered), (_, since) in zip(misses, checked, pending):
+                self._memo[company_name.lower()] = is_sponsor
+                entries.append((company_name.lower(), is_sponsor, since if since and not is_sponsor else now, answered))
+                results[company_name] = is_sponsor
+            self._put_many(entries)
+        
+        return results
+    
+    async def _check_companies(self, company_names: List[str], answered: List[int]) -> List[Tuple[bool, int]]:
+        """
+        Check several companies against all sources on one async HTTP client.
+        
+        Args:
+            company_names: Names of the companies to check
+            answered: For each company, bits of sources that already said no
+            
+        Returns:
+            Whether each company sponsors H1B visas and the bits of the
+            sources that have answered, in order
+        """
+        # Companies wait for a slot rather than for a pooled connection, so
+        # the per-company timeout only runs once its lookups have started
+        slots = asyncio.Semaphore(BATCH_COMPANIES)
+        
+        client_kwargs: Dict[str, Any] = {
+            'headers': {'User-Agent': USER_AGENT},
+            'limits': httpx.Limits(max_connections=3 * BATCH_COMPANIES),
+            'timeout': 10,
+            'follow_redirects': True,
+        }
+        try:
+            # Over HTTP/2 each source's lookups share one multiplexed
+            # connection instead of one TLS handshake per company
+            client = httpx.AsyncClient(http2=True, **client_kwargs)
+        except ImportError:
+            # HTTP/2 needs the optional h2 package
+            client = httpx.AsyncClient(**client_kwargs)
+        
+        async with client:
+            async def check(company_name: str, company_answered: int) -> Tuple[bool, int]:
+                async with slots:
+                    return await self._a_check_multiple_sources(client, company_name, company_answered)
+            
+            return await asyncio.gather(*(check(name, bits) for name, bits in zip(company_names, answered)))
+    
+    async def _a_check_multiple_sources(self, client: httpx.AsyncClient, company_name: str,
+                                        answered: int = 0) -> Tuple[bool, int]:
+        """
+        Async twin of _check_multiple_sources.
+        
+        Args:
+            client: Async HTTP client
+            company_name: Name of the company to check
+            answered: Bits of sources that already said no; they are skipped
+            
+        Returns:
+            Whether the company sponsors H1B visas according to any source,
+            and the bits of the sources that have now answered
+        """
+        async def check_source(bit: int, source_check) -> Tuple[int, Optional[bool]]:
+            return bit, await source_check(client, company_name)
+        
+        sources = (self._a_check_h1b_data, self._a_check_myvisajobs, self._a_check_h1b_grader)
+        tasks = [
+            asyncio.ensure_future(check_source(1 << i, source_check))
+            for i, source_check in enumerate(sources) if not answered & (1 << i)
+        ]
+        try:
+            for next_done in asyncio.as_completed(tasks, timeout=SOURCE_CHECK_TIMEOUT):
+                bit, is_sponsor = await next_done
+                if is_sponsor:
+                    return True, ALL_SOURCES
+                if is_sponsor is not None:
+                    answered |= bit
+        except asyncio.TimeoutError:
+            logger.debug(f"Timed out checking sources for {company_name}")
+        finally:
+            for task in tasks:
+                task.cancel()
+        return False, answered
+    
+    @staticmethod
+    def _h1b_data_found(chunks: Iterable[bytes]) -> bool:
+        """
+        Whether an H1BData.info results page lists any filings.
+        
+        Args:
+            chunks: The page body in pieces, consumed only up to the
+                no-results notice
+            
+        Returns:
+            False as soon as the notice is seen, True if the page ends without it
+        """
+        tail = b""
+        for chunk in chunks:
+            # Keep the end of the previous chunk in case the notice straddles two
+            window = tail + chunk
+            if H1B_DATA_NO_RESULTS in window:
+                return False
+            tail = window[-(len(H1B_DATA_NO_RESULTS) - 1):]
+        return True
+    
+    @staticmethod
+    def _myvisajobs_found(content: bytes, company_name: str) -> bool:
+        """Whether a MyVisaJobs search results page lists the company."""
+        soup = BeautifulSoup(content, 'lxml')
+        
+        # Check if the company is in the results; only the first cell of each
+        # row is needed, but rows need two to be results
+        for row in soup.select('table.tbl tr'):
+            cells = row.find_all('td', limit=2)
+            if len(cells) >= 2:
+                result_company = cells[0].text.strip().lower()
+                if company_name.lower() in result_company or result_company in company_name.lower():
                     return True
-            except Exception as e:
-                logger.debug(f"Error checking source for {company_name}: {e}")
-                continue
         
         return False
     
-    def _check_h1b_data(self, company_name: str) -> bool:
+    @staticmethod
+    def _h1b_grader_found(result: Dict[str, Any], company_name: str) -> bool:
+        """Whether an H1BGrader search response lists the company."""
+        if 'companies' in result and len(result['companies']) > 0:
+            for company in result['companies']:
+                if company_name.lower() in company['name'].lower() or company['name'].lower() in company_name.lower():
+                    return True
+        return False
+    
+    def _h1b_data_params(self, company_name: str) -> Dict[str, str]:
+        """Query parameters for an H1BData.info lookup."""
+        return {
+            'employer': company_name,
+            'year': 'all',  # Check all available years
+            'top': '1'      # We just need to know if there are any results
+        }
+    
+    def _check_h1b_data(self, company_name: str) -> Optional[bool]:
         """
         Check if a company is in H1BData.info database.
         
@@ -133,24 +480,32 @@ class H1BSponsorChecker:
             company_name: Name of the company to check
             
         Returns:
-            True if found in database, False otherwise
+            True if found in database, False if not, None if the check failed
         """
         try:
-            # Query the H1B database
-            params = {
-                'employer': company_name,
-                'year': 'all',  # Check all available years
-                'top': '1'      # We just need to know if there are any results
-            }
-            response = requests.get(self.h1b_data_api, params=params, timeout=10)
-            
-            # If the company has sponsored H1B visas, the response will contain results
-            return "No results found" not in response.text
+            # Query the H1B database, reading the page only until it says
+            # there are no results
+            with self.session.get(self.h1b_data_api, params=self._h1b_data_params(company_name),
+                                  stream=True, timeout=10) as response:
+                response.raise_for_status()
+                
+                # If the company has sponsored H1B visas, the response will contain results
+                return self._h1b_data_found(response.iter_content(chunk_size=STREAM_CHUNK_SIZE))
+        except Exception as e:
+            logger.debug(f"Error checking H1BData for {company_name}: {e}")
+            return None
+    
+    async def _a_check_h1b_data(self, client: httpx.AsyncClient, company_name: str) -> Optional[bool]:
+        """Async twin of _check_h1b_data."""
+        try:
+            response = await client.get(self.h1b_data_api, params=self._h1b_data_params(company_name))
+            response.raise_for_status()
+            return self._h1b_data_found((response.content,))
         except Exception as e:
             logger.debug(f"Error checking H1BData for {company_name}: {e}")
-            return False
+            return None
     
-    def _check_myvisajobs(self, company_name: str) -> bool:
+    def _check_myvisajobs(self, company_name: str) -> Optional[bool]:
         """
         Check if a company is in MyVisaJobs database.
         
@@ -158,7 +513,7 @@ class H1BSponsorChecker:
             company_name: Name of the company to check
             
         Returns:
-            True if found in database, False otherwise
+            True if found in database, False if not, None if the check failed
         """
         try:
             # Query MyVisaJobs
@@ -166,34 +521,33 @@ class H1BSponsorChecker:
                 'searchtext': company_name,
                 'searchtype': 'sponsor'
             }
-            headers = {
-                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-            }
-            response = requests.get(self.myvisajobs_url, params=params, headers=headers, timeout=10)
+            response = self.session.get(self.myvisajobs_url, params=params, timeout=10)
+            response.raise_for_status()
             
             # Parse the response
-            soup = BeautifulSoup(response.content, 'html.parser')
-            
-            # Check if the company is in the results
-            result_tables = soup.find_all('table', class_='tbl')
-            if not result_tables:
-                return False
-                
-            for table in result_tables:
-                rows = table.find_all('tr')
-                for row in rows:
-                    cells = row.find_all('td')
-                    if len(cells) >= 2:
-                        result_company = cells[0].text.strip().lower()
-                        if company_name.lower() in result_company or result_company in company_name.lower():
-                            return True
+            return self._myvisajobs_found(response.content, company_name)
+        except Exception as e:
+            logger.debug(f"Error checking MyVisaJobs for {company_name}: {e}")
+            return None
+    
+    async def _a_check_myvisajobs(self, client: httpx.AsyncClient, company_name: str) -> Optional[bool]:
+        """Async twin of _check_myvisajobs."""
+        try:
+            params = {
+                'searchtext': company_name,
+                'searchtype': 'sponsor'
+            }
+            response = await client.get(self.myvisajobs_url, params=params)
+            response.raise_for_status()
             
-            return False
+            # Parse in a worker thread so the other lookups in flight aren't
+            # held up by it
+            return await asyncio.to_thread(self._myvisajobs_found, response.content, company_name)
         except Exception as e:
             logger.debug(f"Error checking MyVisaJobs for {company_name}: {e}")
-            return False
+            return None
     
-    def _check_h1b_grader(self, company_name: str) -> bool:
+    def _check_h1b_grader(self, company_name: str) -> Optional[bool]:
         """
         Check if a company is in H1BGrader database.
         
@@ -201,33 +555,41 @@ class H1BSponsorChecker:
             company_name: Name of the company to check
             
         Returns:
-            True if found in database, False otherwise
+            True if found in database, False if not, None if the check failed
         """
         try:
-            # Query H1BGrader API
-            headers = {
-                'Content-Type': 'application/json',
-                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-            }
+            # Query H1BGrader API (json= sets the JSON Content-Type)
             data = {
                 'query': company_name,
                 'page': 1,
                 'limit': 5
             }
-            response = requests.post(self.h1b_grader_api, headers=headers, json=data, timeout=10)
+            response = self.session.post(self.h1b_grader_api, json=data, timeout=10)
             
             # Parse the response
             if response.status_code == 200:
-                result = response.json()
-                if 'companies' in result and len(result['companies']) > 0:
-                    for company in result['companies']:
-                        if company_name.lower() in company['name'].lower() or company['name'].lower() in company_name.lower():
-                            return True
+                return self._h1b_grader_found(response.json(), company_name)
             
-            return False
+            return None
         except Exception as e:
             logger.debug(f"Error checking H1BGrader for {company_name}: {e}")
-            return False
+            return None
+    
+    async def _a_check_h1b_grader(self, client: httpx.AsyncClient, company_name: str) -> Optional[bool]:
+        """Async twin of _check_h1b_grader."""
+        try:
+            data = {
+                'query': company_name,
+                'page': 1,
+                'limit': 5
+            }
+            response = await client.post(self.h1b_grader_api, json=data)
+            if response.status_code == 200:
+                return self._h1b_grader_found(response.json(), company_name)
+            return None
+        except Exception as e:
+            logger.debug(f"Error checking H1BGrader for {company_name}: {e}")
+            return None
     
     def get_top_h1b_sponsors(self, limit: int = 100) -> List[str]:
         """
@@ -246,28 +608,25 @@ class H1BSponsorChecker:
             
             # MyVisaJobs provides top H1B sponsors by year
             url = f"https://www.myvisajobs.com/Reports/{current_year}-H1B-Visa-Sponsor.aspx"
-            headers = {
-                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-            }
-            response = requests.get(url, headers=headers, timeout=15)
+            response = self.session.get(url, timeout=15)
             
             # Parse the response
-            soup = BeautifulSoup(response.content, 'html.parser')
+            soup = BeautifulSoup(response.content, 'lxml')
             
-            # Extract company names from the table
-            tables = soup.find_all('table', class_='tbl')
-            if tables:
-                rows = tables[0].find_all('tr')
-                for row in rows[1:limit+1]:  # Skip header row and limit results
-                    cells = row.find_all('td')
+            # Extract company names from the second cell of each row of the
+            # first table
+            table = soup.select_one('table.tbl')
+            if table is not None:
+                for row in table.select('tr')[1:limit+1]:  # Skip header row and limit results
+                    cells = row.find_all('td', limit=2)
                     if len(cells) >= 2:
-                        company_name = cells[1].text.strip()
-                        sponsors.append(company_name)
-                        # Add to cache
-                        self.sponsors_cache[company_name.lower()] = (True, time.time())
+                        sponsors.append(cells[1].get_text(strip=True))
                 
-                # Save updated cache
-                self._save_cache()
+                # Add them all to this run's answers and the cache at once
+                names = [company_name.lower() for company_name in sponsors]
+                self._memo.update(dict.fromkeys(names, True))
+                now = time.time()
+                self._put_many((name, True, now, ALL_SOURCES) for name in names)
             
             logger.info(f"Collected {len(sponsors)} top H1B sponsors from MyVisaJobs")
         except Exception as e:
@@ -1,12 +1,51 @@
 import time
 import random
 import logging
+import weakref
 from selenium.webdriver.common.action_chains import ActionChains
 from selenium.webdriver.common.keys import Keys
 from selenium.common.exceptions import ElementNotInteractableException, StaleElementReferenceException
 
 logger = logging.getLogger(__name__)
 
+# Sets an input's value in one WebDriver call. Goes through the native value
+# setter so React/Vue-controlled inputs see the change, then fires the events
+# a real keystroke sequence would.
+FAST_TYPE_JS = """
+var el = arguments[0];
+var proto = el instanceof HTMLTextAreaElement ? HTMLTextAreaElement.prototype : HTMLInputElement.prototype;
+el.focus();
+Object.getOwnPropertyDescriptor(proto, 'value').set.call(el, arguments[1]);
+el.dispatchEvent(new Event('input', {bubbles: true}));
+el.dispatchEvent(new Event('change', {bubbles: true}));
+"""
+
+# Viewport size and scroll state in one round trip
+VIEWPORT_JS = "return [window.innerWidth, window.innerHeight]"
+PAGE_METRICS_JS = "return [window.pageYOffset, document.body.scrollHeight, window.innerHeight]"
+
+# Plays a scroll schedule of [pixels, delay_ms] steps inside the page and
+# calls back when the last step is done, so a whole scroll costs one
+# WebDriver command. Uses setTimeout rather than requestAnimationFrame, which
+# stops firing in background windows and would stall until the script timeout.
+SCROLL_ANIMATE_JS = """
+var steps = arguments[0], done = arguments[arguments.length - 1], i = 0;
+function next() {
+    if (i >= steps.length) {
+        done();
+        return;
+    }
+    var step = steps[i++];
+    window.scrollBy(0, step[0]);
+    setTimeout(next, step[1]);
+}
+next();
+"""
+
+# Viewport size per driver, looked up once; the scrapers don't resize the
+# window mid-session
+_viewport_cache = weakref.WeakKeyDictionary()
+
 class HumanBehavior:
     """
     Utility class to simulate human-like behavior when interacting with web elements.
@@ -26,25 +65,49 @@ class HumanBehavior:
         return delay
     
     @staticmethod
-    def human_like_typing(element, text, min_speed=0.05, max_speed=0.18, mistake_probability=0.03):
+    def human_like_typing(element, text, min_speed=0.05, max_speed=0.18, mistake_probability=0.03,
+                          fast_mode=False):
         """
         Type text into an element with human-like variations in typing speed and occasional mistakes.
         
+        Every send_keys is a WebDriver round trip, so long strings are slow
+        to type this way. fast_mode sets the value from JavaScript in a
+        single call instead; keep it off on pages that watch for bots.
+        
         Args:
             element: Selenium WebElement to type into
             text: Text to type
             min_speed: Minimum time between keypresses in seconds
             max_speed: Maximum time between keypresses in seconds
             mistake_probability: Probability of making a typing mistake
+            fast_mode: Set the whole value at once instead of typing it
         """
+        if fast_mode:
+            try:
+                element.parent.execute_script(FAST_TYPE_JS, element, text)
+                return
+            except Exception as e:
+                logger.debug(f"Fast typing failed, typing normally: {e}")
+        
         try:
             element.click()
             HumanBehavior.random_delay(0.3, 1.0)
             
+            # Draw the whole schedule up front: which keystrokes get a typo
+            # first, and the pause after each one
+            if mistake_probability > 0:
+                mistakes = [random.random() < mistake_probability for _ in text]
+            else:
+                mistakes = [False] * len(text)
+            if max_speed > 0:
+                delays = [random.uniform(min_speed, max_speed) for _ in text]
+            else:
+                delays = [0.0] * len(text)
+            
             # Type each character with variable speed and occasional mistakes
-            for char in text:
+            for char, mistake, delay in zip(text, mistakes, delays):
                 # Random chance of making a mistake
-                if random.random() < mistake_probability:
+                if mistake:
                     # Type a wrong character
                     wrong_char = chr(ord(char) + random.randint(1, 5))
                     element.send_keys(wrong_char)
@@ -58,7 +121,8 @@ class HumanBehavior:
                 element.send_keys(char)
                 
                 # Random delay between keypresses to simulate human typing
-                HumanBehavior.random_delay(min_speed, max_speed)
+                if delay:
+                    time.sleep(delay)
             
             # Occasionally add a pause as if thinking
             if random.random() < 0.2:
@@ -70,6 +134,23 @@ class HumanBehavior:
             element.clear()
             element.send_keys(text)
     
+    @staticmethod
+    def viewport_size(driver):
+        """
+        Get the browser's viewport size, cached per driver.
+        
+        Args:
+            driver: Selenium WebDriver
+            
+        Returns:
+            (width, height) tuple in pixels
+        """
+        size = _viewport_cache.get(driver)
+        if size is None:
+            size = tuple(driver.execute_script(VIEWPORT_JS))
+            _viewport_cache[driver] = size
+        return size
+    
     @staticmethod
     def human_like_click(driver, element, move_offset=True):
         """
@@ -85,8 +166,7 @@ class HumanBehavior:
             actions = ActionChains(driver)
             
             # Move to a random position first, then to element with realistic mouse movement
-            viewport_width = driver.execute_script("return window.innerWidth")
-            viewport_height = driver.execute_script("return window.innerHeight")
+            viewport_width, viewport_height = HumanBehavior.viewport_size(driver)
             
             # Move to a random starting point
             random_x = random.randint(0, viewport_width)
@@ -118,6 +198,21 @@ class HumanBehavior:
             element.click()
             HumanBehavior.random_delay()
     
+    @staticmethod
+    def instant_click(driver, element):
+        """
+        Click an element from JavaScript, without mouse movement or delays.
+        
+        Meant for low-risk controls such as filter checkboxes; use
+        human_like_click() for actions bot detection watches (sign-in,
+        search, apply).
+        
+        Args:
+            driver: Selenium WebDriver
+            element: Element to click
+        """
+        driver.execute_script("arguments[0].scrollIntoView({block: 'center'}); arguments[0].click();", element)
+    
     @staticmethod
     def scroll_page(driver, direction="down", amount=None):
         """
@@ -136,7 +231,9 @@ class HumanBehavior:
         if direction == "up":
             amount = -amount
         
-        # Scroll in smaller increments to simulate human behavior
+        # Scroll in smaller increments to simulate human behavior, with a
+        # small pause after each step; the browser plays the whole schedule
+        steps = []
         remaining = amount
         while abs(remaining) > 0:
             # Determine increment for this step
@@ -144,14 +241,10 @@ class HumanBehavior:
             if remaining < 0:
                 step = -step
             
-            # Execute scroll
-            driver.execute_script(f"window.scrollBy(0, {step})")
-            
-            # Update remaining amount
+            steps.append((step, random.randint(50, 200)))
             remaining -= step
-            
-            # Small pause between scroll steps
-            time.sleep(random.uniform(0.05, 0.2))
+        
+        driver.execute_async_script(SCROLL_ANIMATE_JS, steps)
         
         # Pause after scrolling
         HumanBehavior.random_delay(0.5, 1.5)
@@ -169,24 +262,24 @@ class HumanBehavior:
         read_duration = random.uniform(*duration_range)
         end_time = time.time() + read_duration
         
-        # Get page height
-        page_height = driver.execute_script("return document.body.scrollHeight")
-        viewport_height = driver.execute_script("return window.innerHeight")
+        # Get the scroll position and page height once, then track the
+        # position locally instead of asking the browser every iteration
+        current_position, page_height, viewport_height = driver.execute_script(PAGE_METRICS_JS)
+        max_position = max(page_height - viewport_height, 0)
         
         # Continue reading behavior until time is up
         while time.time() < end_time:
-            # Determine current scroll position
-            current_position = driver.execute_script("return window.pageYOffset")
-            
             # Either continue scrolling down or occasionally scroll back up
-            if random.random() < 0.8 and current_position < page_height - viewport_height:
+            if random.random() < 0.8 and current_position < max_position:
                 # Scroll down
                 scroll_amount = random.randint(100, 300)
                 HumanBehavior.scroll_page(driver, "down", scroll_amount)
+                current_position = min(current_position + scroll_amount, max_position)
             elif current_position > 0:
                 # Scroll up occasionally
                 scroll_amount = random.randint(50, 200)
                 HumanBehavior.scroll_page(driver, "up", scroll_amount)
+                current_position = max(current_position - scroll_amount, 0)
             
             # Pause as if reading
             HumanBehavior.random_delay(0.5, 2.0)
@@ -1,7 +1,12 @@
 import logging
+import logging.handlers
 import os
 from typing import Optional
 
+# Log records held in memory before they are written to the log file; a
+# warning or worse is written at once, along with everything before it
+LOG_BUFFER_CAPACITY = 512
+
 def setup_logger(level: str = "INFO", log_file: Optional[str] = None):
     """
     Set up the logger.
@@ -46,5 +51,12 @@ def setup_logger(level: str = "INFO", log_file: Optional[str] = None):
         file_handler.setLevel(numeric_level)
         file_handler.setFormatter(formatter)
         
+        # Buffer records so the file isn't written once per line; logging
+        # flushes the buffer when it shuts down at exit
+        buffered_handler = logging.handlers.MemoryHandler(
+            LOG_BUFFER_CAPACITY, flushLevel=logging.WARNING, target=file_handler
+        )
+        buffered_handler.setLevel(numeric_level)
+        
         # Add file handler to logger
-        logger.addHandler(file_handler)
+        logger.addHandler(buffered_handler)
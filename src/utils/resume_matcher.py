@@ -1,10 +1,47 @@
 import logging
 import os
 import re
-from typing import Dict, Any, List, Tuple
+import shelve
+from typing import Dict, Any, Iterable, List, Optional, Set, Tuple
+
+try:
+    import ahocorasick  # pyahocorasick: optional, matches every keyword in one pass
+except ImportError:
+    ahocorasick = None
 
 logger = logging.getLogger(__name__)
 
+# On-disk copy of the text extracted from PDF and DOCX resumes, reused across
+# runs until the file changes
+RESUME_CACHE_PATH = "data_folder/.resume_text_cache"
+
+# Resume text by path, with the modification time it was read at; shared by
+# every matcher in the process
+_resume_text_cache: Dict[str, Tuple[float, str]] = {}
+
+# Words in a job description, for matching single-word keywords by set lookup
+WORD_RE = re.compile(r'\w+')
+
+# Words long enough to be resume keywords
+KEYWORD_TOKEN_RE = re.compile(r'\w{3,}')
+
+# Common words never used as keywords
+STOP_WORDS = frozenset({
+    'a', 'an', 'the', 'and', 'or', 'but', 'if', 'because', 'as', 'what',
+    'when', 'where', 'how', 'from', 'to', 'by', 'for', 'with', 'about',
+    'against', 'between', 'into', 'through', 'during', 'before', 'after',
+    'above', 'below', 'up', 'down', 'in', 'out', 'on', 'off', 'over', 'under',
+    'again', 'further', 'then', 'once', 'here', 'there', 'all', 'any', 'both',
+    'each', 'few', 'more', 'most', 'other', 'some', 'such', 'no', 'nor', 'not',
+    'only', 'own', 'same', 'so', 'than', 'too', 'very', 's', 't', 'can', 'will',
+    'just', 'don', 'should', 'now', 'of', 'at', 'be', 'is', 'am', 'are', 'was',
+    'were', 'has', 'have', 'had', 'do', 'does', 'did', 'doing', 'this', 'that',
+    'these', 'those', 'i', 'me', 'my', 'mine', 'myself', 'you', 'your', 'yours',
+    'yourself', 'he', 'him', 'his', 'himself', 'she', 'her', 'hers', 'herself',
+    'it', 'its', 'itself', 'we', 'us', 'our', 'ours', 'ourselves', 'they', 'them',
+    'their', 'theirs', 'themselves', 'who', 'whom', 'whose', 'which', 'what'
+})
+
 class ResumeMatcher:
     """
     Matches job descriptions to resumes.
@@ -20,6 +57,65 @@ class ResumeMatcher:
         self.config = config
         self.resume_text = self._load_resume()
         self.resume_keywords = self._extract_keywords(self.resume_text)
+        
+        # Single-word keywords are matched against a description's set of
+        # words; the rest (user-defined phrases such as "machine learning" or
+        # "c++") by one alternation, longest first
+        self._keyword_words = frozenset(keyword for keyword in self.resume_keywords if WORD_RE.fullmatch(keyword))
+        self._keyword_phrase_re = self._compile_phrases(
+            keyword for keyword in self.resume_keywords if keyword not in self._keyword_words
+        )
+        self._keyword_count = max(len(self.resume_keywords), 1)
+        
+        # Search settings lowercased once rather than for every job scored
+        job_search = self.config['JOB_SEARCH']
+        self._job_titles = tuple(title.lower() for title in job_search.get('job_titles', []))
+        self._locations = tuple(location.lower() for location in job_search.get('locations', []))
+        self._exclude_keywords = tuple(keyword.lower() for keyword in job_search.get('exclude_keywords', []))
+        
+        # With pyahocorasick, resume keywords and excluded keywords are each
+        # found in a single scan of the description, however many there are
+        self._keyword_automaton = self._build_automaton(self.resume_keywords)
+        self._exclude_automaton = self._build_automaton(self._exclude_keywords)
+    
+    @staticmethod
+    def _build_automaton(keywords: Iterable[str]) -> Optional[Any]:
+        """
+        Build an Aho-Corasick automaton over lowercase keywords.
+        
+        Args:
+            keywords: Lowercase keywords to match
+            
+        Returns:
+            ahocorasick.Automaton mapping each keyword to itself, or None if
+            pyahocorasick is unavailable or there are no keywords
+        """
+        if ahocorasick is None:
+            return None
+        
+        automaton = ahocorasick.Automaton()
+        for keyword in keywords:
+            automaton.add_word(keyword, keyword)
+        if not len(automaton):
+            return None
+        automaton.make_automaton()
+        return automaton
+    
+    @staticmethod
+    def _compile_phrases(phrases) -> Optional["re.Pattern[str]"]:
+        """
+        Compile phrases into one pattern matching any of them as whole words.
+        
+        Args:
+            phrases: Lowercase phrases
+            
+        Returns:
+            Compiled pattern, or None if there are no phrases
+        """
+        phrases = sorted(set(phrases), key=len, reverse=True)
+        if not phrases:
+            return None
+        return re.compile(r'(?<!\w)(?:' + '|'.join(map(re.escape, phrases)) + r')(?!\w)')
     
     def _load_resume(self) -> str:
         """
@@ -35,24 +131,80 @@ class ResumeMatcher:
             return ""
         
         try:
+            mtime = os.stat(resume_path).st_mtime
+            cached = _resume_text_cache.get(resume_path)
+            if cached and cached[0] == mtime:
+                return cached[1]
+            
             # Determine file type
             file_extension = os.path.splitext(resume_path)[1].lower()
             
-            if file_extension == '.pdf':
-                return self._extract_text_from_pdf(resume_path)
-            elif file_extension == '.docx':
-                return self._extract_text_from_docx(resume_path)
+            if file_extension in ('.pdf', '.docx'):
+                # Extracting text is slow, so reuse what an earlier run got
+                # from the same version of the file
+                text = self._disk_cache_get(resume_path, mtime)
+                if text is None:
+                    if file_extension == '.pdf':
+                        text = self._extract_text_from_pdf(resume_path)
+                    else:
+                        text = self._extract_text_from_docx(resume_path)
+                    if text:
+                        self._disk_cache_set(resume_path, mtime, text)
             elif file_extension == '.txt':
                 with open(resume_path, 'r', encoding='utf-8') as f:
-                    return f.read()
+                    text = f.read()
             else:
                 logger.error(f"Unsupported resume file format: {file_extension}")
                 return ""
             
+            if text:
+                _resume_text_cache[resume_path] = (mtime, text)
+            return text
+            
         except Exception as e:
             logger.error(f"Error loading resume: {e}")
             return ""
     
+    @staticmethod
+    def _disk_cache_get(resume_path: str, mtime: float) -> Optional[str]:
+        """
+        Look up a resume's extracted text in the on-disk cache.
+        
+        Args:
+            resume_path: Path to the resume
+            mtime: The resume's current modification time
+            
+        Returns:
+            The cached text, or None if there is none or the file has changed since
+        """
+        try:
+            with shelve.open(RESUME_CACHE_PATH) as cache:
+                entry = cache.get(os.path.abspath(resume_path))
+        except Exception as e:
+            logger.warning(f"Could not read resume cache: {e}")
+            return None
+        
+        if entry is None or entry['mtime'] != mtime:
+            return None
+        return entry['value']
+    
+    @staticmethod
+    def _disk_cache_set(resume_path: str, mtime: float, text: str):
+        """
+        Store a resume's extracted text in the on-disk cache.
+        
+        Args:
+            resume_path: Path to the resume
+            mtime: The resume's modification time when the text was extracted
+            text: Extracted text
+        """
+        try:
+            os.makedirs(os.path.dirname(RESUME_CACHE_PATH), exist_ok=True)
+            with shelve.open(RESUME_CACHE_PATH) as cache:
+                cache[os.path.abspath(resume_path)] = {'mtime': mtime, 'value': text}
+        except Exception as e:
+            logger.warning(f"Could not write resume cache: {e}")
+    
     def _extract_text_from_pdf(self, file_path: str) -> str:
         """
         Extract text from PDF file.
@@ -111,42 +263,54 @@ class ResumeMatcher:
         if not text:
             return []
         
-        # Convert to lowercase
-        text = text.lower()
-        
-        # Remove special characters
-        text = re.sub(r'[^\w\s]', ' ', text)
-        
-        # Split into words
-        words = text.split()
-        
-        # Remove common words
-        stop_words = {
-            'a', 'an', 'the', 'and', 'or', 'but', 'if', 'because', 'as', 'what',
-            'when', 'where', 'how', 'from', 'to', 'by', 'for', 'with', 'about',
-            'against', 'between', 'into', 'through', 'during', 'before', 'after',
-            'above', 'below', 'up', 'down', 'in', 'out', 'on', 'off', 'over', 'under',
-            'again', 'further', 'then', 'once', 'here', 'there', 'all', 'any', 'both',
-            'each', 'few', 'more', 'most', 'other', 'some', 'such', 'no', 'nor', 'not',
-            'only', 'own', 'same', 'so', 'than', 'too', 'very', 's', 't', 'can', 'will',
-            'just', 'don', 'should', 'now', 'of', 'at', 'be', 'is', 'am', 'are', 'was',
-            'were', 'has', 'have', 'had', 'do', 'does', 'did', 'doing', 'this', 'that',
-            'these', 'those', 'i', 'me', 'my', 'mine', 'myself', 'you', 'your', 'yours',
-            'yourself', 'he', 'him', 'his', 'himself', 'she', 'her', 'hers', 'herself',
-            'it', 'its', 'itself', 'we', 'us', 'our', 'ours', 'ourselves', 'they', 'them',
-            'their', 'theirs', 'themselves', 'who', 'whom', 'whose', 'which', 'what'
-        }
-        
-        keywords = [word for word in words if word not in stop_words and len(word) > 2]
+        # Words of three or more characters, lowercased, minus common words
+        keywords = set(KEYWORD_TOKEN_RE.findall(text.lower())) - STOP_WORDS
         
         # Add user-defined keywords
-        user_keywords = self.config['JOB_SEARCH'].get('keywords', [])
-        keywords.extend([keyword.lower() for keyword in user_keywords])
+        keywords.update(keyword.lower() for keyword in self.config['JOB_SEARCH'].get('keywords', []))
         
-        # Remove duplicates
-        keywords = list(set(keywords))
+        return list(keywords)
+    
+    def _find_resume_keywords(self, description: str) -> Set[str]:
+        """
+        Find the resume keywords that appear as whole words in a description.
         
-        return keywords
+        Args:
+            description: Lowercase job description
+            
+        Returns:
+            Set of matching keywords
+        """
+        if self._keyword_automaton is not None:
+            # The automaton matches inside words too, so keep only hits with
+            # no word character on either side, as the patterns below do
+            matches = set()
+            last = len(description) - 1
+            for end, keyword in self._keyword_automaton.iter(description):
+                start = end - len(keyword) + 1
+                if ((start == 0 or not WORD_RE.match(description, start - 1, start))
+                        and (end == last or not WORD_RE.match(description, end + 1, end + 2))):
+                    matches.add(keyword)
+            return matches
+        
+        matches = set(WORD_RE.findall(description)) & self._keyword_words
+        if self._keyword_phrase_re is not None:
+            matches.update(self._keyword_phrase_re.findall(description))
+        return matches
+    
+    def _find_excluded_keywords(self, *texts: str) -> Set[str]:
+        """
+        Find the excluded keywords that appear anywhere in some texts.
+        
+        Args:
+            texts: Lowercase texts to search
+            
+        Returns:
+            Set of excluded keywords found
+        """
+        if self._exclude_automaton is not None:
+            return {keyword for text in texts for _, keyword in self._exclude_automaton.iter(text)}
+        return {keyword for keyword in self._exclude_keywords if any(keyword in text for text in texts)}
     
     def calculate_match_score(self, job: Dict[str, Any]) -> float:
         """
@@ -167,52 +331,32 @@ class ResumeMatcher:
         if not job_description:
             return 0.0
         
-        # Count matching keywords
-        matching_keywords = []
-        
-        for keyword in self.resume_keywords:
-            if keyword in job_description:
-                matching_keywords.append(keyword)
+        # Count matching keywords in one pass over the description
+        matching_keywords = self._find_resume_keywords(job_description)
         
         # Calculate match score
-        match_score = len(matching_keywords) / max(len(self.resume_keywords), 1)
+        match_score = len(matching_keywords) / self._keyword_count
         
         # Adjust score based on job title match
         job_title = job.get('title', '').lower()
-        user_job_titles = [title.lower() for title in self.config['JOB_SEARCH'].get('job_titles', [])]
         
-        title_match = False
-        for user_title in user_job_titles:
-            if user_title in job_title:
-                title_match = True
-                break
-        
-        if title_match:
+        if any(user_title in job_title for user_title in self._job_titles):
             match_score += 0.1
         
         # Adjust score based on location match
         job_location = job.get('location', '').lower()
-        user_locations = [location.lower() for location in self.config['JOB_SEARCH'].get('locations', [])]
-        
-        location_match = False
-        for user_location in user_locations:
-            if user_location in job_location:
-                location_match = True
-                break
         
-        if location_match:
+        if any(user_location in job_location for user_location in self._locations):
             match_score += 0.1
         
         # Adjust score based on excluded keywords
-        excluded_keywords = [keyword.lower() for keyword in self.config['JOB_SEARCH'].get('exclude_keywords', [])]
-        
-        for keyword in excluded_keywords:
-            if keyword in job_description or keyword in job_title:
-                match_score -= 0.2
+        match_score -= 0.2 * len(self._find_excluded_keywords(job_description, job_title))
         
         # Ensure score is between 0.0 and 1.0
         match_score = max(0.0, min(1.0, match_score))
         
-        logger.info(f"Match score for {job.get('title', '')} at {job.get('company_name', '')}: {match_score:.2f}")
+        # Scored for every job found, so skip building the message when INFO is off
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(f"Match score for {job.get('title', '')} at {job.get('company_name', '')}: {match_score:.2f}")
         
         return match_score
\ No newline at end of file
@@ -0,0 +1,39 @@
+import unittest
+
+from src.filters.job_filter import parse_salary
+
+
+class ParseSalaryTest(unittest.TestCase):
+    def test_yearly_salary_mentioning_hours_is_not_scaled(self):
+        self.assertEqual(parse_salary("Up to $120k per year, 40 hours a week"), 120000.0)
+    
+    def test_pay_period_scales_to_a_year(self):
+        self.assertEqual(parse_salary("$25 - $30 an hour"), 62400.0)
+        self.assertEqual(parse_salary("$30/hr"), 62400.0)
+        self.assertEqual(parse_salary("$5,000 per month"), 60000.0)
+        self.assertEqual(parse_salary("$40 hourly"), 83200.0)
+    
+    def test_hours_mentioned_without_a_period_leave_the_amount(self):
+        self.assertEqual(parse_salary("$95,000, 40 hours"), 95000.0)
+        self.assertEqual(parse_salary("$110K annual base"), 110000.0)
+    
+    def test_trailing_benefit_is_not_pay(self):
+        self.assertEqual(parse_salary("$90,000 a year + 401k match"), 90000.0)
+        self.assertEqual(parse_salary("$85K - $95K + 401k"), 95000.0)
+    
+    def test_stray_numbers_are_not_annualized(self):
+        self.assertEqual(parse_salary("$30/hr, 40 hours a week"), 62400.0)
+        self.assertEqual(parse_salary("$5,000 per month, 2 weeks PTO"), 60000.0)
+    
+    def test_amount_without_dollar_sign(self):
+        self.assertEqual(parse_salary("60,000 to 80,000 a year"), 80000.0)
+    
+    def test_numbers_pass_through(self):
+        self.assertEqual(parse_salary(85000), 85000.0)
+    
+    def test_no_amount(self):
+        self.assertIsNone(parse_salary("Competitive"))
+
+
+if __name__ == '__main__':
+    unittest.main()